@@ -0,0 +1,6 @@
+"""
+Benchmarks for the scraping and data pipeline.
+
+Run each one from the repository root as a module, e.g.
+`python -m benchmarks.bench_card_extraction`.
+"""
@@ -0,0 +1,74 @@
+"""
+Compares the throughput of the HTTP and Selenium fetch backends.
+
+Both scrape the same cards from a local stand-in server: the HTTP backend
+reads paginated result pages (HTML or JSON), the Selenium backend scrolls a
+page that lazily loads the same cards. Each page or scroll batch is delayed
+by --latency-ms to mimic the remote site. Pass --skip-selenium to run
+without Chrome.
+
+    python -m benchmarks.bench_backends [--cards 1000] [--page-size 20] [--latency-ms 200] [--json]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from webscrap import scrape_rapidapi_search_page
+from fetch_backends import HttpBackend
+from benchmarks.fixtures import paginated_search_route, render_lazy_search_page, serve_pages
+
+def time_scrape(category, base_url, workdir, backend):
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        data = scrape_rapidapi_search_page(
+            category=category,
+            scroll_delay=1,
+            output_csv_prefix=os.path.join(workdir, "rapidapi_apis"),
+            base_url=base_url,
+            backend=backend
+        )
+    return time.perf_counter() - start, len(data)
+
+def run_benchmark(num_cards=1000, page_size=20, latency_ms=200, concurrency=8, as_json=False, skip_selenium=False):
+    routes = {
+        "/search/Http": paginated_search_route(num_cards, page_size, as_json=as_json, latency_ms=latency_ms),
+        "/search/Browser": render_lazy_search_page(num_cards, batch_size=page_size, load_delay_ms=latency_ms)
+    }
+    server, base_url = serve_pages(routes)
+    workdir = tempfile.mkdtemp(prefix="backend_bench_")
+    results = {}
+    try:
+        backend = HttpBackend(concurrency=concurrency)
+        try:
+            results['http'] = time_scrape("Http", base_url, workdir, backend)
+        finally:
+            backend.close()
+        if not skip_selenium:
+            results['selenium'] = time_scrape("Browser", base_url, workdir, "selenium")
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n📊 Fetch backend benchmark ({num_cards} cards, {page_size} per page, {latency_ms} ms per page)")
+    for name, (elapsed, cards) in results.items():
+        print(f"   {name:<10} {cards:6d} APIs in {elapsed:7.2f} s  ({cards / elapsed:8.1f} APIs/s)")
+    if 'selenium' in results:
+        print(f"   Speedup: {results['selenium'][0] / results['http'][0]:.1f}x")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--latency-ms", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--json", action="store_true", help="Serve JSON instead of HTML result pages")
+    parser.add_argument("--skip-selenium", action="store_true")
+    args = parser.parse_args()
+
+    run_benchmark(num_cards=args.cards, page_size=args.page_size, latency_ms=args.latency_ms,
+                  concurrency=args.concurrency, as_json=args.json, skip_selenium=args.skip_selenium)
@@ -0,0 +1,73 @@
+"""
+Compares per-card WebDriver extraction against the single-script bulk path.
+
+Serves a saved copy of the search page locally (or a generated one) and
+times both extraction paths on it. Needs Chrome and chromedriver.
+
+    python -m benchmarks.bench_card_extraction [--page saved.html] [--cards 500] [--repeat 3]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from webscrap import create_driver, extract_api_cards, extract_data_from_card, extract_all_cards_data
+from benchmarks.fixtures import write_search_page, serve_directory
+
+def extract_per_card(driver):
+    """The original extraction path: several WebDriver calls per card"""
+    return [extract_data_from_card(card) for card in extract_api_cards(driver)]
+
+def time_extraction(func, driver, repeat):
+    """Return (best wall time in seconds, last result) over repeat runs"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with redirect_stdout(StringIO()):
+            result = func(driver)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def run_benchmark(page=None, num_cards=500, repeat=3):
+    """Time both extraction paths against a locally served search page"""
+    workdir = tempfile.mkdtemp(prefix="card_bench_")
+    if page:
+        shutil.copy(page, os.path.join(workdir, "search.html"))
+    else:
+        write_search_page(workdir, num_cards)
+
+    server, base_url = serve_directory(workdir)
+    driver = create_driver()
+    try:
+        driver.get(f"{base_url}/search.html")
+
+        per_card_time, per_card = time_extraction(extract_per_card, driver, repeat)
+        bulk_time, bulk = time_extraction(extract_all_cards_data, driver, repeat)
+
+        if per_card != bulk:
+            print("⚠️  Bulk and per-card extraction returned different data!")
+
+        cards = len(bulk)
+        print(f"\n📊 Card extraction benchmark ({cards} cards, best of {repeat})")
+        print(f"   Per-card WebDriver calls: {per_card_time:8.3f} s  ({cards / per_card_time:10.1f} cards/s)")
+        print(f"   Single script call:       {bulk_time:8.3f} s  ({cards / bulk_time:10.1f} cards/s)")
+        print(f"   Speedup: {per_card_time / bulk_time:.1f}x")
+        return {'cards': cards, 'per_card_seconds': per_card_time, 'bulk_seconds': bulk_time}
+    finally:
+        driver.quit()
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", help="Saved copy of a RapidAPI search page (default: generated page)")
+    parser.add_argument("--cards", type=int, default=500, help="Number of cards in the generated page")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(page=args.page, num_cards=args.cards, repeat=args.repeat)
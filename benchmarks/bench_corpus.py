@@ -0,0 +1,81 @@
+"""
+Compares re-tokenizing the descriptions with reading them from the
+tokenized corpus, and building the search index with and without it.
+
+    python -m benchmarks.bench_corpus [--csv rapidapi_fused_dataset_clean.csv]
+"""
+import argparse
+import filecmp
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from corpus_store import TokenizedCorpus, update_corpus
+from search_index import tokenize, update_search_index
+
+def same_index(index_a, index_b):
+    """True if two search indexes have byte-identical files"""
+    for root, _, files in os.walk(index_a):
+        for name in files:
+            path_a = os.path.join(root, name)
+            path_b = os.path.join(index_b, os.path.relpath(path_a, index_a))
+            if not os.path.exists(path_b) or not filecmp.cmp(path_a, path_b, shallow=False):
+                return False
+    return True
+
+def run_benchmark(csv_file="rapidapi_fused_dataset_clean.csv"):
+    workdir = tempfile.mkdtemp(prefix="corpus_bench_")
+    try:
+        corpus_dir = os.path.join(workdir, "corpus")
+        with redirect_stdout(StringIO()):
+            start = time.perf_counter()
+            update_corpus(csv_file, corpus_dir)
+            build_time = time.perf_counter() - start
+        corpus_mb = sum(os.path.getsize(os.path.join(corpus_dir, name)) for name in os.listdir(corpus_dir)) / 1e6
+
+        # Term frequencies of all descriptions, the way a consumer without the corpus gets them
+        start = time.perf_counter()
+        descriptions = pd.read_csv(csv_file, usecols=['description'])['description']
+        counts = {}
+        for text in descriptions.fillna('').astype(str):
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + 1
+        tokenize_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        corpus = TokenizedCorpus(corpus_dir)
+        corpus_counts = np.bincount(corpus.tokens['description'], minlength=len(corpus.vocabulary))
+        corpus_time = time.perf_counter() - start
+        same_counts = counts == {term: int(count) for term, count in zip(corpus.vocabulary, corpus_counts) if count}
+
+        index_times = {}
+        for label, reuse in (('tokenize', None), ('corpus', corpus_dir)):
+            with redirect_stdout(StringIO()):
+                start = time.perf_counter()
+                update_search_index(csv_file, os.path.join(workdir, f"index_{label}"), corpus_dir=reuse)
+                index_times[label] = time.perf_counter() - start
+        identical = same_index(os.path.join(workdir, "index_tokenize"), os.path.join(workdir, "index_corpus"))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n📊 Tokenized corpus benchmark ({corpus.rows} rows, {len(corpus.tokens['description'])} description tokens)")
+    print(f"   Corpus build: {build_time:.2f} s, {corpus_mb:.1f} MB on disk")
+    print(f"   Term counts, read CSV + tokenize: {tokenize_time * 1000:8.1f} ms")
+    print(f"   Term counts, open corpus:         {corpus_time * 1000:8.1f} ms  (same counts: {same_counts})")
+    print(f"   Search index build, tokenizing:   {index_times['tokenize']:8.2f} s")
+    print(f"   Search index build, from corpus:  {index_times['corpus']:8.2f} s  (identical index: {identical})")
+    return {'build_seconds': build_time, 'tokenize_seconds': tokenize_time, 'corpus_seconds': corpus_time,
+            'index_seconds': index_times, 'identical_index': identical}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="rapidapi_fused_dataset_clean.csv")
+    args = parser.parse_args()
+
+    run_benchmark(csv_file=args.csv)
@@ -0,0 +1,95 @@
+"""
+Runs several local worker processes against one crawl queue file, with a
+fake crawl that only sleeps, and kills one worker in the middle of a task.
+
+Checks that every task ends up done, that the killed worker's task was
+re-claimed after its lease expired, and reports the throughput.
+
+    python -m benchmarks.bench_crawl_queue [--tasks 40] [--workers 4] [--task-seconds 0.2]
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from crawl_queue import CrawlQueue, run_worker
+
+def sleep_crawl(seconds):
+    def crawl(category, stop_event):
+        stop_event.wait(seconds)
+    return crawl
+
+def worker_process(queue_file, worker, task_seconds, lease_seconds, results):
+    with redirect_stdout(StringIO()):
+        handled = run_worker(queue_file, crawl=sleep_crawl(task_seconds), worker=worker, lease_seconds=lease_seconds,
+                             heartbeat_interval=lease_seconds / 4, poll_interval=lease_seconds / 4)
+    results.put((worker, handled['done']))
+
+def doomed_process(queue_file, worker, lease_seconds, claimed):
+    """Claims one task and dies without completing it or sending heartbeats"""
+    queue = CrawlQueue(queue_file)
+    claimed.put(queue.claim(worker, lease_seconds))
+    time.sleep(3600)
+
+def run_benchmark(tasks=40, workers=4, task_seconds=0.2, lease_seconds=1.0):
+    workdir = tempfile.mkdtemp(prefix="crawl_queue_bench_")
+    try:
+        queue_file = os.path.join(workdir, "queue.sqlite")
+        queue = CrawlQueue(queue_file)
+        queue.enqueue(f"category-{i:03d}" for i in range(tasks))
+
+        context = multiprocessing.get_context("spawn")
+        claimed = context.Queue()
+        doomed = context.Process(target=doomed_process, args=(queue_file, "doomed", lease_seconds, claimed))
+        doomed.start()
+        lost_task = claimed.get()
+        doomed.kill()
+        doomed.join()
+
+        results = context.Queue()
+        start = time.perf_counter()
+        processes = [context.Process(target=worker_process,
+                                     args=(queue_file, f"worker-{i}", task_seconds, lease_seconds, results))
+                     for i in range(workers)]
+        for process in processes:
+            process.start()
+        done_by = {}
+        for _ in processes:
+            worker, done = results.get()
+            for category in done:
+                done_by.setdefault(category, []).append(worker)
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        progress = queue.progress()
+        lost_task_row = [task for task in queue.tasks() if task['category'] == lost_task][0]
+        queue.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    all_done = progress['done'] == tasks and len(done_by) == tasks
+    exactly_once = all(len(workers_done) == 1 for workers_done in done_by.values())
+    requeued = lost_task_row['status'] == 'done' and lost_task_row['attempts'] == 2
+
+    print(f"\n📊 Crawl queue benchmark ({tasks} tasks of {task_seconds}s, {workers} worker processes)")
+    print(f"   Drained in {elapsed:.2f} s ({tasks / elapsed:.1f} tasks/s, ideal {workers / task_seconds:.1f})")
+    print(f"   All tasks done: {all_done}, each completed once: {exactly_once}")
+    print(f"   Killed worker's task '{lost_task}' re-claimed and done: {requeued} "
+          f"(by {done_by.get(lost_task, ['nobody'])[0]})")
+    return {'seconds': elapsed, 'tasks_per_second': tasks / elapsed, 'all_done': all_done,
+            'exactly_once': exactly_once, 'requeued': requeued}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--task-seconds", type=float, default=0.2)
+    parser.add_argument("--lease-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    run_benchmark(tasks=args.tasks, workers=args.workers, task_seconds=args.task_seconds, lease_seconds=args.lease_seconds)
@@ -0,0 +1,61 @@
+"""
+Compares per-record append_api_data_to_csv against BufferedCsvWriter.
+
+    python -m benchmarks.bench_csv_writer [--records 100000] [--batch-size 100]
+"""
+import argparse
+import filecmp
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from webscrap import append_api_data_to_csv, BufferedCsvWriter
+from benchmarks.synthetic_data import generate_records
+
+def write_per_record(records, filename):
+    with redirect_stdout(StringIO()):
+        for data in records:
+            append_api_data_to_csv(data, filename)
+
+def write_buffered(records, filename, batch_size):
+    with BufferedCsvWriter(filename, batch_size=batch_size) as writer:
+        for data in records:
+            writer.write(data)
+
+def run_benchmark(num_records=100000, batch_size=100):
+    """Write the same synthetic stream with both writers and compare throughput"""
+    records = list(generate_records(num_records))
+    workdir = tempfile.mkdtemp(prefix="csv_bench_")
+    try:
+        per_record_csv = os.path.join(workdir, "per_record.csv")
+        buffered_csv = os.path.join(workdir, "buffered.csv")
+
+        start = time.perf_counter()
+        write_per_record(records, per_record_csv)
+        per_record_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        write_buffered(records, buffered_csv, batch_size)
+        buffered_time = time.perf_counter() - start
+
+        if not filecmp.cmp(per_record_csv, buffered_csv, shallow=False):
+            print("⚠️  The two writers produced different files!")
+
+        print(f"\n📊 CSV writer benchmark ({num_records} records)")
+        print(f"   append_api_data_to_csv: {per_record_time:8.2f} s  ({num_records / per_record_time:10.0f} records/s)")
+        print(f"   BufferedCsvWriter:      {buffered_time:8.2f} s  ({num_records / buffered_time:10.0f} records/s)")
+        print(f"   Speedup: {per_record_time / buffered_time:.1f}x")
+        return {'records': num_records, 'per_record_seconds': per_record_time, 'buffered_seconds': buffered_time}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    run_benchmark(num_records=args.records, batch_size=args.batch_size)
@@ -0,0 +1,109 @@
+"""
+Compares the "full" and "lean" Chrome driver profiles.
+
+For each profile it reports driver startup time, page-load time and the
+resident memory of the Chrome process tree for every category page, and
+the per-category scraping wall time: "full" starts a fresh driver per
+category (the old behaviour) while "lean" reuses one session. Needs Chrome
+and chromedriver; memory is only reported if psutil is installed.
+
+    python -m benchmarks.bench_driver_profile [--categories Food Music] [--max-apis 100]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from urllib.parse import quote
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from webscrap import create_driver, scrape_rapidapi_search_page
+
+def chrome_memory_mb(driver):
+    """Resident memory of chromedriver and every Chrome process it started, in MB"""
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes if p.is_running()) / 1024 / 1024
+    except (psutil.Error, AttributeError):
+        return None
+
+def measure_page_loads(profile, categories, base_url):
+    """Load every category page in one session and measure load time and memory"""
+    start = time.perf_counter()
+    driver = create_driver(profile)
+    startup = time.perf_counter() - start
+    loads = []
+    try:
+        for category in categories:
+            url = f"{base_url}/search/{quote(category, safe='')}?sortBy=ByRelevance"
+            start = time.perf_counter()
+            driver.get(url)
+            elapsed = time.perf_counter() - start
+            loads.append({'category': category, 'load_seconds': elapsed, 'memory_mb': chrome_memory_mb(driver)})
+    finally:
+        driver.quit()
+    return startup, loads
+
+def measure_category_wall_time(profile, categories, base_url, max_apis, reuse_session, workdir):
+    """Scrape each category and return the wall time per category"""
+    times = {}
+    driver = create_driver(profile) if reuse_session else None
+    try:
+        for category in categories:
+            start = time.perf_counter()
+            with redirect_stdout(StringIO()):
+                scrape_rapidapi_search_page(
+                    category=category,
+                    max_apis=max_apis,
+                    scroll_delay=1,
+                    output_csv_prefix=os.path.join(workdir, f"{profile}_apis"),
+                    driver=driver,
+                    base_url=base_url,
+                    profile=profile
+                )
+            times[category] = time.perf_counter() - start
+    finally:
+        if driver:
+            driver.quit()
+    return times
+
+def run_benchmark(categories, max_apis=100, base_url="https://rapidapi.com"):
+    workdir = tempfile.mkdtemp(prefix="profile_bench_")
+    results = {}
+    try:
+        for profile, reuse_session in (("full", False), ("lean", True)):
+            startup, loads = measure_page_loads(profile, categories, base_url)
+            wall = measure_category_wall_time(profile, categories, base_url, max_apis, reuse_session, workdir)
+            results[profile] = {'startup_seconds': startup, 'page_loads': loads, 'category_seconds': wall}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n📊 Driver profile benchmark ({len(categories)} categories, max {max_apis} APIs each)")
+    for profile, result in results.items():
+        print(f"\n   Profile: {profile}")
+        print(f"   Driver startup: {result['startup_seconds']:.2f} s")
+        for load in result['page_loads']:
+            memory = f"{load['memory_mb']:.0f} MB" if load['memory_mb'] is not None else "n/a"
+            wall = result['category_seconds'][load['category']]
+            print(f"     {load['category']:<20} page load {load['load_seconds']:6.2f} s | "
+                  f"memory {memory:>8} | scrape wall time {wall:6.2f} s")
+        print(f"   Total scrape wall time: {sum(result['category_seconds'].values()):.2f} s")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", nargs="+", default=["Food", "Music", "Travel"])
+    parser.add_argument("--max-apis", type=int, default=100)
+    parser.add_argument("--base-url", default="https://rapidapi.com")
+    args = parser.parse_args()
+
+    run_benchmark(args.categories, max_apis=args.max_apis, base_url=args.base_url)
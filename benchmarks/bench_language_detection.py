@@ -0,0 +1,52 @@
+"""
+Times language detection before and after the shared detection stage.
+
+"Before" runs langdetect once per row in one process, like the old
+statisticalAnalysis and data_translator code did. "After" runs
+detect_languages with a cold and then a warm sidecar cache.
+
+    python -m benchmarks.bench_language_detection [--csv rapidapi_fused_dataset.csv] [--rows 5000] [--workers 4]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from language_detection import detect_language, detect_languages
+
+def run_benchmark(csv_file="rapidapi_fused_dataset.csv", rows=5000, workers=None):
+    texts = pd.read_csv(csv_file, nrows=rows)['description'].tolist()
+    workdir = tempfile.mkdtemp(prefix="langdetect_bench_")
+    cache_file = os.path.join(workdir, "language_cache.sqlite")
+    try:
+        start = time.perf_counter()
+        before = [detect_language(text) for text in texts]
+        before_time = time.perf_counter() - start
+
+        cold, cold_stats = detect_languages(texts, cache_file=cache_file, workers=workers)
+        warm, warm_stats = detect_languages(texts, cache_file=cache_file, workers=workers)
+        repeat, _ = detect_languages(texts, cache_file=None, workers=workers)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    changed = sum(1 for a, b in zip(before, cold) if a != b)
+    print(f"\n📊 Language detection benchmark ({len(texts)} rows)")
+    print(f"   Before, langdetect per row:  {before_time:7.2f} s")
+    print(f"   After, cold cache:           {cold_stats['seconds']:7.2f} s  "
+          f"({cold_stats['prefiltered']} pre-filtered, {cold_stats['detected']} detected)")
+    print(f"   After, warm cache:           {warm_stats['seconds']:7.2f} s  ({warm_stats['cached']} cached)")
+    print(f"   Rows labelled differently by the English pre-filter: {changed}")
+    print(f"   Deterministic across runs: {cold == warm == repeat}")
+    return {'before_seconds': before_time, 'cold_seconds': cold_stats['seconds'], 'warm_seconds': warm_stats['seconds']}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="rapidapi_fused_dataset.csv")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    run_benchmark(csv_file=args.csv, rows=args.rows, workers=args.workers)
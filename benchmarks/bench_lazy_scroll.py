@@ -0,0 +1,53 @@
+"""
+Runs the scraper against a local page that loads cards lazily on scroll.
+
+Checks that every card is found and compares the wall time with the time
+the page itself needs to load all batches. Needs Chrome and chromedriver.
+
+    python -m benchmarks.bench_lazy_scroll [--cards 300] [--batch-size 20] [--delay-ms 300]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from webscrap import scrape_rapidapi_search_page
+from benchmarks.fixtures import render_lazy_search_page, serve_pages
+
+def run_benchmark(num_cards=300, batch_size=20, load_delay_ms=300, category="Food"):
+    """Scrape the lazy fixture once and report wall time against the page's own load time"""
+    page = render_lazy_search_page(num_cards, batch_size=batch_size, load_delay_ms=load_delay_ms, category=category)
+    server, base_url = serve_pages({f"/search/{category}": page})
+    workdir = tempfile.mkdtemp(prefix="scroll_bench_")
+    try:
+        start = time.perf_counter()
+        data = scrape_rapidapi_search_page(
+            category=category,
+            scroll_delay=1,
+            output_csv_prefix=os.path.join(workdir, "rapidapi_apis"),
+            base_url=base_url
+        )
+        elapsed = time.perf_counter() - start
+
+        batches = -(-num_cards // batch_size)
+        page_load_time = (batches - 1) * load_delay_ms / 1000
+        print(f"\n📊 Lazy scroll benchmark ({num_cards} cards in batches of {batch_size}, {load_delay_ms} ms per batch)")
+        print(f"   APIs found: {len(data)} / {num_cards}")
+        print(f"   Scraper wall time: {elapsed:.2f} s")
+        print(f"   Time the page needs to load every batch: {page_load_time:.2f} s")
+        if len(data) != num_cards:
+            print("⚠️  The scraper did not find every card!")
+        return {'cards': len(data), 'seconds': elapsed, 'page_load_seconds': page_load_time}
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=300)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--delay-ms", type=int, default=300)
+    args = parser.parse_args()
+
+    run_benchmark(num_cards=args.cards, batch_size=args.batch_size, load_delay_ms=args.delay_ms)
@@ -0,0 +1,109 @@
+"""
+Load generator for the prediction service.
+
+Starts the service on a free local port and sends single-API requests from
+--clients concurrent keep-alive connections, then reports p50/p99 latency,
+throughput and how many model calls the micro-batcher made. Without --model
+a small model is trained on synthetic records first.
+
+    python -m benchmarks.bench_prediction_service [--model category_model.joblib] [--requests 2000] [--clients 16] [--json]
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from prediction_service import start_service, stop_service
+from predict import load_model
+from train_classifier import build_pipeline, build_text
+from benchmarks.synthetic_data import generate_records
+
+def train_synthetic_model(num_records=5000):
+    import pandas as pd
+
+    df = pd.DataFrame(generate_records(num_records))
+    return build_pipeline().fit(build_text(df), df['category'])
+
+def run_clients(base_url, records, num_requests, clients):
+    url = urlsplit(base_url)
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    counter = iter(range(num_requests))
+
+    def client():
+        conn = http.client.HTTPConnection(url.hostname, url.port, timeout=30)
+        local = []
+        try:
+            while True:
+                with lock:
+                    i = next(counter, None)
+                if i is None:
+                    break
+                body = json.dumps(records[i % len(records)])
+                start = time.perf_counter()
+                conn.request("POST", "/predict", body=body, headers={'Content-Type': 'application/json'})
+                response = conn.getresponse()
+                response.read()
+                local.append(time.perf_counter() - start)
+                if response.status != 200:
+                    errors.append(response.status)
+        finally:
+            conn.close()
+            with lock:
+                latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.array(latencies), time.perf_counter() - start, errors
+
+def run_benchmark(model_file=None, num_requests=2000, clients=16, max_batch=64, max_wait_ms=5):
+    model = load_model(model_file) if model_file else train_synthetic_model()
+    records = list(generate_records(500, seed=1))
+    server, batcher, base_url = start_service(model=model, port=0, max_batch=max_batch, max_wait_ms=max_wait_ms)
+    try:
+        latencies, elapsed, errors = run_clients(base_url, records, num_requests, clients)
+        batches = batcher.batches
+    finally:
+        stop_service(server, batcher)
+
+    results = {
+        'requests': len(latencies),
+        'clients': clients,
+        'errors': len(errors),
+        'p50_ms': float(np.percentile(latencies, 50) * 1000),
+        'p99_ms': float(np.percentile(latencies, 99) * 1000),
+        'throughput_rps': len(latencies) / elapsed,
+        'model_calls': batches,
+        'mean_batch': len(latencies) / batches if batches else 0.0
+    }
+    print(f"\n📊 Prediction service benchmark ({results['requests']} requests, {clients} clients, "
+          f"max batch {max_batch}, max wait {max_wait_ms} ms)")
+    print(f"   p50 latency: {results['p50_ms']:7.2f} ms")
+    print(f"   p99 latency: {results['p99_ms']:7.2f} ms")
+    print(f"   Throughput:  {results['throughput_rps']:7.1f} requests/s")
+    print(f"   Model calls: {batches} (mean batch {results['mean_batch']:.1f}), errors: {results['errors']}")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", help="Model saved by train_classifier; a synthetic model is trained if omitted")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    parser.add_argument("--json", action="store_true", help="Also print the results as JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(model_file=args.model, num_requests=args.requests, clients=args.clients,
+                            max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+    if args.json:
+        print(json.dumps(results, indent=2))
@@ -0,0 +1,86 @@
+"""
+Measures search index build time, open time and query latency.
+
+Builds an index of --csv in a temporary directory, then runs a set of
+sample queries (with and without a category filter) and reports p50/p99
+latency, next to the pandas substring scan it replaces.
+
+    python -m benchmarks.bench_search [--csv rapidapi_fused_dataset_clean.csv] [--repeat 20]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from search_index import SearchIndex, update_search_index
+
+SAMPLE_QUERIES = [
+    ("weather forecast", None), ("send sms", None), ("stock market price", None),
+    ("translate text", None), ("football live scores", "Sports"), ("crypto wallet balance", "Cryptography"),
+    ("email validation", None), ("image recognition", "Visual Recognition"), ("flight booking", "Travel"),
+    ("recipe nutrition", "Food"), ("news headlines", None), ("qr code generator", None),
+    ("currency exchange rates", "Financial"), ("movie database", None), ("ip geolocation lookup", None)
+]
+
+def percentiles(latencies):
+    latencies = np.array(latencies) * 1000
+    return np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+def run_benchmark(csv_file="rapidapi_fused_dataset_clean.csv", repeat=20):
+    workdir = tempfile.mkdtemp(prefix="search_bench_")
+    index_dir = os.path.join(workdir, "search_index")
+    try:
+        start = time.perf_counter()
+        with redirect_stdout(StringIO()):
+            rows = update_search_index(csv_file, index_dir)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = SearchIndex(index_dir)
+        open_ms = (time.perf_counter() - start) * 1000
+
+        index_latencies = []
+        for _ in range(repeat):
+            for query, category in SAMPLE_QUERIES:
+                start = time.perf_counter()
+                index.search(query, k=10, category=category)
+                index_latencies.append(time.perf_counter() - start)
+
+        df = pd.read_csv(csv_file)
+        text = (df['name'].fillna('') + " " + df['description'].fillna('')).str.lower()
+        scan_latencies = []
+        for query, category in SAMPLE_QUERIES:
+            start = time.perf_counter()
+            mask = np.ones(len(df), dtype=bool)
+            for word in query.split():
+                mask &= text.str.contains(word, regex=False).to_numpy()
+            if category:
+                mask &= (df['category'] == category).to_numpy()
+            df[mask].head(10)
+            scan_latencies.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    index_p50, index_p99 = percentiles(index_latencies)
+    scan_p50, scan_p99 = percentiles(scan_latencies)
+    print(f"\n📊 Search benchmark ({rows} rows, {len(SAMPLE_QUERIES)} queries x {repeat})")
+    print(f"   Index build:      {build_seconds:7.2f} s")
+    print(f"   Index open:       {open_ms:7.2f} ms")
+    print(f"   BM25 index query: p50 {index_p50:7.2f} ms | p99 {index_p99:7.2f} ms")
+    print(f"   pandas scan:      p50 {scan_p50:7.2f} ms | p99 {scan_p99:7.2f} ms")
+    return {'build_seconds': build_seconds, 'open_ms': open_ms, 'p50_ms': index_p50, 'p99_ms': index_p99,
+            'scan_p50_ms': scan_p50, 'scan_p99_ms': scan_p99}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="rapidapi_fused_dataset_clean.csv")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    run_benchmark(csv_file=args.csv, repeat=args.repeat)
@@ -0,0 +1,135 @@
+"""
+Serves a generated sitemap index with a local HTTP server that honours
+ETag / If-None-Match, and measures sitemap.py against it: the first
+crawl, a refresh where nothing changed, and a delta after some child
+sitemaps changed. Also compares the memory of the streaming parse with
+ET.fromstring on the whole file.
+
+    python -m benchmarks.bench_sitemap [--sitemaps 20] [--urls 5000]
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from contextlib import redirect_stdout
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from io import StringIO
+
+from sitemap import iter_sitemap_entries, sitemap_delta
+
+NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+class ConditionalHandler(SimpleHTTPRequestHandler):
+    """Static files with a content-hash ETag and 304 replies to If-None-Match"""
+
+    requests_served = {'200': 0, '304': 0}
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, 'rb') as f:
+            body = f.read()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.requests_served['304'] += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.requests_served['200'] += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+def write_child(path, index, urls, version=0):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{NAMESPACE}">\n')
+        for i in range(urls):
+            # Version bumps change the lastmod of every tenth URL
+            lastmod = f"2026-0{1 + (version if i % 10 == 0 else 0)}-01"
+            f.write(f"  <url><loc>https://rapidapi.com/search/Category%20{index}-{i}</loc>"
+                    f"<lastmod>{lastmod}</lastmod></url>\n")
+        f.write("</urlset>\n")
+
+def write_index(path, base_url, sitemaps):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{NAMESPACE}">\n')
+        for i in range(sitemaps):
+            f.write(f"  <sitemap><loc>{base_url}/child-{i}.xml</loc></sitemap>\n")
+        f.write("</sitemapindex>\n")
+
+def peak_memory(parse):
+    tracemalloc.start()
+    parse()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+def run_benchmark(sitemaps=20, urls=5000):
+    workdir = tempfile.mkdtemp(prefix="sitemap_bench_")
+    site_dir = os.path.join(workdir, "site")
+    os.makedirs(site_dir)
+    handler = lambda *args, **kwargs: ConditionalHandler(*args, directory=site_dir, **kwargs)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        for i in range(sitemaps):
+            write_child(os.path.join(site_dir, f"child-{i}.xml"), i, urls)
+        write_index(os.path.join(site_dir, "index.xml"), base_url, sitemaps)
+        cache_dir = os.path.join(workdir, "cache")
+
+        runs = {}
+        for label in ('first crawl', 'unchanged refresh', 'after changes'):
+            if label == 'after changes':
+                # A quarter of the child sitemaps get new lastmods
+                for i in range(0, sitemaps, 4):
+                    write_child(os.path.join(site_dir, f"child-{i}.xml"), i, urls, version=1)
+            ConditionalHandler.requests_served = {'200': 0, '304': 0}
+            with redirect_stdout(StringIO()):
+                start = time.perf_counter()
+                delta = sitemap_delta(f"{base_url}/index.xml", cache_dir=cache_dir)
+                elapsed = time.perf_counter() - start
+            runs[label] = {'seconds': elapsed, 'new': len(delta['new']), 'changed': len(delta['changed']),
+                           'total': delta['total'], 'served': dict(ConditionalHandler.requests_served)}
+
+        child = os.path.join(site_dir, "child-0.xml")
+        streaming_mb = peak_memory(lambda: sum(1 for _ in iter_sitemap_entries(child)))
+        with open(child, 'rb') as f:
+            content = f.read()
+        full_mb = peak_memory(lambda: len(ET.fromstring(content).findall(f'.//{{{NAMESPACE}}}loc')))
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    expected_changed = len(range(0, sitemaps, 4)) * len(range(0, urls, 10))
+    print(f"\n📊 Sitemap benchmark (index of {sitemaps} sitemaps x {urls} URLs)")
+    for label, run in runs.items():
+        print(f"   {label:18s} {run['seconds'] * 1000:8.1f} ms  200: {run['served']['200']:3d}  304: {run['served']['304']:3d}"
+              f"  new: {run['new']:7d}  changed: {run['changed']:6d}")
+    print(f"   Changed URLs found: {runs['after changes']['changed']} (expected {expected_changed})")
+    print(f"   Peak memory parsing one {urls}-URL sitemap: streaming {streaming_mb:.2f} MB, ET.fromstring {full_mb:.2f} MB")
+    runs['streaming_mb'] = streaming_mb
+    runs['fromstring_mb'] = full_mb
+    return runs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sitemaps", type=int, default=20)
+    parser.add_argument("--urls", type=int, default=5000)
+    args = parser.parse_args()
+
+    run_benchmark(sitemaps=args.sitemaps, urls=args.urls)
@@ -0,0 +1,76 @@
+"""
+Compares the on-disk size and load time of a dataset stored as CSV and as
+Parquet through dataset_storage.
+
+Each load is repeated and the best time is kept. "Projected" loads read
+only the columns a stage needs, e.g. statisticalAnalysis reads name,
+category and description, and a category count needs only category.
+
+    python -m benchmarks.bench_storage [--csv rapidapi_fused_dataset.csv] [--repeat 5] [--scale 1]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from dataset_storage import convert_dataset, read_dataset
+
+PROJECTIONS = {
+    'all columns': None,
+    'name, category, description': ['name', 'category', 'description'],
+    'category only': ['category'],
+}
+
+def best_time(load, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def run_benchmark(csv_file="rapidapi_fused_dataset.csv", repeat=5, scale=1):
+    workdir = tempfile.mkdtemp(prefix="storage_bench_")
+    try:
+        if scale > 1:
+            # Repeat the dataset to see how both formats grow
+            scaled_csv = os.path.join(workdir, "scaled.csv")
+            df = pd.read_csv(csv_file)
+            pd.concat([df] * scale, ignore_index=True).to_csv(scaled_csv, index=False)
+            csv_file = scaled_csv
+        parquet_file = os.path.join(workdir, "dataset.parquet")
+
+        start = time.perf_counter()
+        rows = convert_dataset(csv_file, parquet_file)
+        convert_time = time.perf_counter() - start
+
+        csv_mb = os.path.getsize(csv_file) / 1e6
+        parquet_mb = os.path.getsize(parquet_file) / 1e6
+
+        results = {'rows': rows, 'csv_mb': csv_mb, 'parquet_mb': parquet_mb, 'convert_seconds': convert_time, 'loads': {}}
+        for label, columns in PROJECTIONS.items():
+            csv_time = best_time(lambda: read_dataset(csv_file, columns=columns), repeat)
+            parquet_time = best_time(lambda: read_dataset(parquet_file, columns=columns), repeat)
+            results['loads'][label] = {'csv_seconds': csv_time, 'parquet_seconds': parquet_time}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n📊 Storage benchmark ({rows} rows, best of {repeat})")
+    print(f"   On disk: CSV {csv_mb:.1f} MB, Parquet {parquet_mb:.1f} MB ({csv_mb / parquet_mb:.1f}x smaller)")
+    print(f"   CSV -> Parquet conversion: {convert_time:.2f} s")
+    for label, load in results['loads'].items():
+        print(f"   Load {label:28s} CSV {load['csv_seconds'] * 1000:8.1f} ms   Parquet {load['parquet_seconds'] * 1000:8.1f} ms"
+              f"   ({load['csv_seconds'] / load['parquet_seconds']:.1f}x faster)")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="rapidapi_fused_dataset.csv")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=int, default=1, help="Repeat the dataset this many times")
+    args = parser.parse_args()
+
+    run_benchmark(csv_file=args.csv, repeat=args.repeat, scale=args.scale)
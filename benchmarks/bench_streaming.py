@@ -0,0 +1,112 @@
+"""
+Measures the peak memory of the chunked clean_descriptions and
+process_and_translate_dataset as the input grows.
+
+Every run happens in a fresh process, so its peak RSS is not affected by
+earlier runs. The translator is a FakeTranslator with no latency. On the
+smallest input, the cleaned output is compared with the old in-memory
+clean_descriptions.
+
+    python -m benchmarks.bench_streaming [--rows 27000,270000,2700000] [--translate-rows 5000,50000] [--chunksize 50000]
+"""
+import argparse
+import csv
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+import pandas as pd
+
+from benchmarks.synthetic_data import generate_records
+from metrics import peak_rss_mb
+
+def write_synthetic_csv(filename, num_rows):
+    """Writes num_rows synthetic records, with some empty and one-word descriptions like the real dataset"""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['name', 'category', 'description'])
+        writer.writeheader()
+        for i, record in enumerate(generate_records(num_rows)):
+            if i % 50 == 0:
+                record['description'] = ''
+            elif i % 50 == 1:
+                record['description'] = record['description'].split()[0]
+            writer.writerow(record)
+
+def _run_stage(stage, input_file, output_file, chunksize, results):
+    with redirect_stdout(StringIO()):
+        start = time.perf_counter()
+        if stage == 'clean':
+            from clean_data import clean_descriptions
+            clean_descriptions(input_file, output_file, chunksize=chunksize)
+        else:
+            from data_translator import process_and_translate_dataset
+            from benchmarks.fake_translator import FakeTranslator
+            process_and_translate_dataset(input_file, output_file, cache_file=None, translator=FakeTranslator(latency=0),
+                                          rate_limit=None, language_cache_file=None, chunksize=chunksize)
+        seconds = time.perf_counter() - start
+    results.put({'seconds': seconds, 'peak_rss_mb': peak_rss_mb()})
+
+def measure(stage, input_file, output_file, chunksize):
+    """Runs one stage in a fresh process and returns its wall time and peak RSS"""
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_run_stage, args=(stage, input_file, output_file, chunksize, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+def in_memory_clean(input_file, output_file):
+    """The previous clean_descriptions, which loads the whole file"""
+    df = pd.read_csv(input_file)
+    df.dropna(subset=['description'], inplace=True)
+    df = df[df['description'].str.split().str.len() >= 2]
+    df.to_csv(output_file, index=False)
+
+def run_benchmark(sizes=(27000, 270000, 2700000), translate_sizes=(5000, 50000), chunksize=50000):
+    workdir = tempfile.mkdtemp(prefix="streaming_bench_")
+    results = []
+    try:
+        for stage, stage_sizes in (('clean', sizes), ('translate', translate_sizes)):
+            for num_rows in stage_sizes:
+                input_file = os.path.join(workdir, f"input_{num_rows}.csv")
+                if not os.path.exists(input_file):
+                    write_synthetic_csv(input_file, num_rows)
+                output_file = os.path.join(workdir, f"{stage}_{num_rows}.csv")
+                result = measure(stage, input_file, output_file, chunksize)
+                result.update({'stage': stage, 'rows': num_rows, 'input_mb': os.path.getsize(input_file) / 1e6})
+                results.append(result)
+
+                if stage == 'clean' and num_rows == min(stage_sizes):
+                    expected_file = os.path.join(workdir, "expected.csv")
+                    in_memory_clean(input_file, expected_file)
+                    with open(expected_file, 'rb') as expected, open(output_file, 'rb') as actual:
+                        result['identical'] = expected.read() == actual.read()
+                os.remove(output_file)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n📊 Streaming benchmark (chunksize {chunksize})")
+    for result in results:
+        identical = ""
+        if 'identical' in result:
+            identical = "  same output as in-memory" if result['identical'] else "  ⚠️ output differs from in-memory!"
+        print(f"   {result['stage']:9s} {result['rows']:>9d} rows ({result['input_mb']:7.1f} MB): "
+              f"{result['seconds']:7.2f} s, peak RSS {result['peak_rss_mb']:6.1f} MB{identical}")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default="27000,270000,2700000", help="Comma-separated input sizes for clean_descriptions")
+    parser.add_argument("--translate-rows", default="5000,50000",
+                        help="Comma-separated input sizes for process_and_translate_dataset (langdetect is slow)")
+    parser.add_argument("--chunksize", type=int, default=50000)
+    args = parser.parse_args()
+
+    run_benchmark(sizes=[int(n) for n in args.rows.split(",")],
+                  translate_sizes=[int(n) for n in args.translate_rows.split(",") if n],
+                  chunksize=args.chunksize)
@@ -0,0 +1,33 @@
+import random
+import threading
+import time
+
+from translation_engine import Translator
+
+class FakeTranslator(Translator):
+    """
+    Local stand-in for a remote translator.
+
+    Sleeps `latency` seconds per call to mimic a network round trip, fails a
+    `failure_rate` fraction of calls, and returns a deterministic
+    "translation" so results can be compared.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency=0.05, failure_rate=0.0, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def translate(self, text):
+        with self._lock:
+            self.calls += 1
+            fail = self._random.random() < self.failure_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise ConnectionError("Simulated translator failure")
+        return f"[en] {text}"
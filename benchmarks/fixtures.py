@@ -0,0 +1,180 @@
+import html
+import json
+import os
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, unquote, parse_qs
+
+SAMPLE_CATEGORIES = [
+    "Food", "Financial", "Music", "Search", "Database", "Travel",
+    "Education", "Medical", "Translation", "Text Analysis"
+]
+
+def render_card(index, category=None):
+    """Render one API card with the same class names as the RapidAPI search page"""
+    category = category or SAMPLE_CATEGORIES[index % len(SAMPLE_CATEGORIES)]
+    name = f"Sample API {index}"
+    description = (
+        f"Sample API {index} returns {category.lower()} data as JSON. "
+        "Use it to build dashboards, bots and mobile apps."
+    )
+    return (
+        '<div class="group/card flex flex-col rounded-lg border p-4">'
+        f'<span class="max-w-[100px] truncate text-xs">{html.escape(category)}</span>'
+        f'<span class="text-card-primary font-semibold" title="{html.escape(name)}">{html.escape(name)}</span>'
+        f'<span class="text-card-secondary line-clamp-2" title="{html.escape(description)}">{html.escape(description)}</span>'
+        '</div>'
+    )
+
+def render_search_page(num_cards=500, category=None):
+    """Render a static search page containing num_cards API cards"""
+    cards = "\n".join(render_card(i, category) for i in range(num_cards))
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Search | RapidAPI</title></head>\n"
+        f"<body><main><div id=\"feed\">\n{cards}\n</div></main></body></html>\n"
+    )
+
+# Loads cards in batches when the last card scrolls into view, like the
+# infinite scroll of the real search page.
+LAZY_LOADING_SCRIPT = """
+<script>
+const pending = %(cards)s;
+const batchSize = %(batch_size)d;
+const delayMs = %(delay_ms)d;
+const feed = document.getElementById('feed');
+const observer = new IntersectionObserver(entries => {
+    if (!entries.some(entry => entry.isIntersecting) || !pending.length) return;
+    observer.disconnect();
+    setTimeout(() => {
+        feed.insertAdjacentHTML('beforeend', pending.splice(0, batchSize).join(''));
+        if (pending.length) observer.observe(feed.lastElementChild);
+    }, delayMs);
+});
+observer.observe(feed.lastElementChild);
+</script>
+"""
+
+def render_lazy_search_page(num_cards=500, batch_size=20, load_delay_ms=300, category=None):
+    """
+    Render a search page that starts with one batch of cards and loads the
+    next batch load_delay_ms after the last card is scrolled into view.
+    """
+    cards = [render_card(i, category) for i in range(num_cards)]
+    first, pending = cards[:batch_size], cards[batch_size:]
+    script = LAZY_LOADING_SCRIPT % {
+        'cards': json.dumps(pending).replace('</', '<\\/'),
+        'batch_size': batch_size,
+        'delay_ms': load_delay_ms
+    }
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Search | RapidAPI</title>\n"
+        "<style>.group\\/card { min-height: 120px; }</style></head>\n"
+        f"<body><main><div id=\"feed\">\n{''.join(first)}\n</div></main>{script}</body></html>\n"
+    )
+
+def paginated_search_route(num_cards=500, page_size=20, category=None, as_json=False, latency_ms=0):
+    """
+    Return a serve_pages route that serves num_cards cards split into pages
+    selected by the `page` query parameter (1-based), as HTML search pages
+    or as a JSON list of APIs. Pages past the last one are empty. Each
+    response is delayed by latency_ms to mimic a remote server.
+    """
+    def route(request_path):
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+        query = parse_qs(urlsplit(request_path).query)
+        page = int(query.get('page', ['1'])[0])
+        indexes = range((page - 1) * page_size, min(page * page_size, num_cards))
+        if as_json:
+            apis = []
+            for i in indexes:
+                card_category = category or SAMPLE_CATEGORIES[i % len(SAMPLE_CATEGORIES)]
+                apis.append({
+                    'name': f"Sample API {i}",
+                    'category': card_category,
+                    'description': (
+                        f"Sample API {i} returns {card_category.lower()} data as JSON. "
+                        "Use it to build dashboards, bots and mobile apps."
+                    )
+                })
+            return json.dumps({'apis': apis}), "application/json"
+        cards = "\n".join(render_card(i, category) for i in indexes)
+        return (
+            "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Search | RapidAPI</title></head>\n"
+            f"<body><main><div id=\"feed\">\n{cards}\n</div></main></body></html>\n"
+        )
+    return route
+
+def write_search_page(directory, num_cards=500, filename="search.html"):
+    """Write a rendered search page into directory and return its path"""
+    path = os.path.join(directory, filename)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(render_search_page(num_cards))
+    return path
+
+class _LocalServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections from concurrent clients
+    request_queue_size = 128
+    daemon_threads = True
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+def serve_directory(directory):
+    """
+    Serves a directory over HTTP on a free localhost port in a background thread.
+
+    Returns:
+        tuple: (server, base_url). Call server.shutdown() when done.
+    """
+    handler = partial(_QuietHandler, directory=directory)
+    server = _LocalServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+class _RoutesHandler(BaseHTTPRequestHandler):
+    routes = {}
+
+    def do_GET(self):
+        path = unquote(urlsplit(self.path).path)
+        page = self.routes.get(path)
+        if callable(page):
+            page = page(self.path)
+        if page is None:
+            self.send_error(404)
+            return
+        if isinstance(page, tuple):
+            body, content_type = page
+        else:
+            body, content_type = page, "text/html; charset=utf-8"
+        body = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def serve_pages(routes):
+    """
+    Serves in-memory pages on a free localhost port in a background thread.
+
+    Args:
+        routes (dict): Maps a URL path (e.g. '/search/Food') to the page body,
+            a (body, content_type) tuple, or a callable that receives the
+            full request path (with query string) and returns either.
+
+    Returns:
+        tuple: (server, base_url). Call server.shutdown() when done.
+    """
+    handler = type("RoutesHandler", (_RoutesHandler,), {'routes': dict(routes)})
+    server = _LocalServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
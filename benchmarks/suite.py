@@ -0,0 +1,254 @@
+"""
+Benchmark suite of the data pipeline on a synthetic dataset, checked
+against a stored baseline.
+
+Generates per-category CSVs with benchmarks.synthetic_data at the given
+scale and times, in order:
+
+    fuse       fusedData.combine_api_csv_files over the category CSVs
+    translate  data_translator.process_and_translate_dataset with a
+               FakeTranslator and a cold language cache
+    clean      clean_data.clean_descriptions on the translated dataset,
+               or the fused one when translate is left out
+    stats      statisticalAnalysis.analyze_fused_dataset on the clean
+               dataset, with the language cache left by translate
+    extract    fetch_backends.parse_cards_html on a generated search page
+
+Each benchmark runs --repeat times under metrics.METRICS, except
+translate and stats which run once, and its fastest run is kept, with
+the counters and rates it recorded. The result is compared with the
+baseline stored for the same number of rows in benchmarks/baseline.json:
+a benchmark that got slower, or a rate that dropped, by more than
+--threshold fails the run, and so does any change in the row counts the
+benchmarks produce. Clean and stats are only compared when they ran on
+the same dataset as in the baseline, translated or fused. Timings depend
+on the machine, so record a baseline on the machine that runs the suite
+with --update-baseline. Translate and stats are dominated by language
+detection; leave them out with --only for runs in the millions of rows.
+
+    python -m benchmarks.suite [--rows 10000] [--repeat 3] [--only fuse,clean] [--update-baseline]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+import metrics
+from metrics import METRICS, compare_runs
+from benchmarks.fake_translator import FakeTranslator
+from benchmarks.fixtures import render_search_page
+from benchmarks.synthetic_data import write_category_csvs
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+BENCHMARKS = ('fuse', 'translate', 'clean', 'stats', 'extract')
+# Bound by language detection and long enough to be stable, repeating them would triple the suite time
+SINGLE_RUN = ('translate', 'stats')
+# Read the translated dataset, or the fused one when translate is left out
+AFTER_TRANSLATE = ('clean', 'stats')
+
+def count_rows(filename):
+    import pandas as pd
+    return sum(len(chunk) for chunk in pd.read_csv(filename, usecols=['name'], chunksize=100000))
+
+class Workdir:
+    """Files shared by the benchmarks of one suite run"""
+
+    def __init__(self, root):
+        self.root = root
+        self.categories = os.path.join(root, "categories")
+        self.fused = os.path.join(root, "fused.csv")
+        self.translated = os.path.join(root, "translated.csv")
+        self.clean = os.path.join(root, "clean.csv")
+        self.language_cache = os.path.join(root, "language_cache.sqlite")
+        self.warm_language_cache = os.path.join(root, "language_cache_warm.sqlite")
+
+    def clean_input(self):
+        return self.translated if os.path.exists(self.translated) else self.fused
+
+def bench_fuse(workdir):
+    from fusedData import combine_api_csv_files
+    if os.path.exists(workdir.fused):
+        os.remove(workdir.fused)
+    with METRICS.stage('fuse'):
+        combine_api_csv_files(path=workdir.categories, output_filename=workdir.fused)
+    return {'fused_rows': count_rows(workdir.fused)}
+
+def bench_translate(workdir):
+    from data_translator import process_and_translate_dataset
+    # Every run starts from an empty language cache, and leaves a warm copy for stats
+    for path in (workdir.language_cache, workdir.language_cache + "-wal", workdir.language_cache + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+    with METRICS.stage('translate'):
+        process_and_translate_dataset(input_file=workdir.fused, output_file=workdir.translated, cache_file=None,
+                                      translator=FakeTranslator(latency=0), rate_limit=None,
+                                      language_cache_file=workdir.language_cache)
+    shutil.copy(workdir.language_cache, workdir.warm_language_cache)
+    return {'translated_rows': count_rows(workdir.translated)}
+
+def bench_clean(workdir):
+    from clean_data import clean_descriptions
+    with METRICS.stage('clean'):
+        clean_descriptions(input_file=workdir.clean_input(), output_file=workdir.clean)
+    return {'clean_rows': count_rows(workdir.clean)}
+
+def bench_stats(workdir):
+    from statisticalAnalysis import analyze_fused_dataset
+    language_cache = os.path.join(workdir.root, "language_cache_stats.sqlite")
+    if os.path.exists(language_cache):
+        os.remove(language_cache)
+    if os.path.exists(workdir.warm_language_cache):
+        shutil.copy(workdir.warm_language_cache, language_cache)
+    json_file = os.path.join(workdir.root, "stats.json")
+    with METRICS.stage('stats'):
+        analyze_fused_dataset(csv_file=workdir.clean, output_file=os.path.join(workdir.root, "stats.txt"),
+                              language_cache_file=language_cache, json_file=json_file)
+    with open(json_file, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    return {'stats_rows': report['total_apis'], 'stats_non_english': report['non_english']['count'],
+            'stats_duplicate_descriptions': report['duplicates']['description']['count']}
+
+def bench_extract(workdir, num_cards=5000):
+    from fetch_backends import parse_cards_html
+    page = render_search_page(num_cards)
+    with METRICS.stage('extract'):
+        cards = parse_cards_html(page)
+        metrics.count('extract.cards', len(cards))
+        metrics.count('extract.bytes', len(page))
+    return {'extracted_cards': sum(1 for card in cards if card)}
+
+BENCHMARK_FUNCTIONS = {
+    'fuse': bench_fuse,
+    'translate': bench_translate,
+    'clean': bench_clean,
+    'stats': bench_stats,
+    'extract': bench_extract,
+}
+
+def run_suite(rows=10000, repeat=3, only=None, seed=0):
+    """
+    Runs the benchmarks and returns their result, in the format of the
+    metrics snapshots plus 'checks' with the row counts they produced.
+    """
+    selected = [name for name in BENCHMARKS if not only or name in only]
+    result = {'rows': rows, 'seed': seed, 'repeat': repeat, 'host': platform.node(),
+              'python': platform.python_version(), 'stages': {}, 'counters': {}, 'rates': {}, 'checks': {}}
+    root = tempfile.mkdtemp(prefix="suite_bench_")
+    try:
+        workdir = Workdir(root)
+        start = time.perf_counter()
+        write_category_csvs(workdir.categories, rows, seed=seed)
+        print(f"🧪 Generated {rows} synthetic rows in {time.perf_counter() - start:.1f}s")
+
+        # Fuse and clean produce the files the later benchmarks read, so they run even when left out
+        needed = set(selected)
+        if needed & {'translate', 'clean', 'stats'}:
+            needed.add('fuse')
+        if 'stats' in needed:
+            needed.add('clean')
+        for name in (name for name in BENCHMARKS if name in needed):
+            best = None
+            for _ in range(repeat if name in selected and name not in SINGLE_RUN else 1):
+                METRICS.reset()
+                with redirect_stdout(StringIO()):
+                    checks = BENCHMARK_FUNCTIONS[name](workdir)
+                snapshot = METRICS.snapshot()
+                if best is None or snapshot['stages'][name]['seconds'] < best['stages'][name]['seconds']:
+                    best = snapshot
+            if name not in selected:
+                continue
+            result['stages'][name] = best['stages'][name]
+            result['counters'].update((key, value) for key, value in best['counters'].items() if key.startswith(name + '.'))
+            result['rates'].update((key, value) for key, value in best['rates'].items() if key.startswith(name + '.'))
+            result['checks'].update(checks)
+            print(f"   {name:10s} {best['stages'][name]['seconds']:8.3f}s")
+        result['clean_input'] = 'translated' if 'translate' in needed else 'fused'
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    result['peak_rss_mb'] = metrics.peak_rss_mb()
+    return result
+
+def load_baseline(baseline_file=BASELINE_FILE):
+    if not os.path.exists(baseline_file):
+        return {}
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baseline(result, baseline_file=BASELINE_FILE):
+    """Store result as the baseline for its number of rows"""
+    baselines = load_baseline(baseline_file)
+    baselines[str(result['rows'])] = result
+    with open(baseline_file + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(baseline_file + ".tmp", baseline_file)
+
+def _without_benchmarks(result, names):
+    """Copy of a suite result without the stages, counters, rates and checks of the named benchmarks"""
+    def keep(key):
+        return not key.startswith(tuple(f"{name}." for name in names) + tuple(f"{name}_" for name in names))
+    stripped = dict(result)
+    stripped['stages'] = {name: stage for name, stage in result['stages'].items() if name not in names}
+    for field in ('counters', 'rates', 'checks'):
+        stripped[field] = {key: value for key, value in result[field].items() if keep(key)}
+    return stripped
+
+def check_against_baseline(result, baseline, threshold=0.3, min_seconds=0.05):
+    """
+    Print how a suite result compares with its baseline.
+
+    Returns:
+        bool: True if nothing regressed and every check matches.
+    """
+    # Baselines from before clean_input was recorded always ran translate
+    clean_input, baseline_input = result.get('clean_input', 'translated'), baseline.get('clean_input', 'translated')
+    if clean_input != baseline_input:
+        print(f"   {' and '.join(AFTER_TRANSLATE)} ran on the {clean_input} dataset and the baseline on the "
+              f"{baseline_input} one, they are not compared")
+        result = _without_benchmarks(result, AFTER_TRANSLATE)
+    ok = True
+    for name, before, after, change, regressed in compare_runs(baseline, result, threshold=threshold, min_seconds=min_seconds):
+        ok = ok and not regressed
+        print(f"{'❌' if regressed else '  '} {name:35s} {before:12.3f} -> {after:12.3f}  ({change:+.1%})")
+    if baseline.get('seed') == result['seed']:
+        for name, value in result['checks'].items():
+            expected = baseline.get('checks', {}).get(name)
+            if expected is not None and expected != value:
+                ok = False
+                print(f"❌ {name}: {value}, baseline {expected}")
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="Synthetic rows, from 10k to 10M")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark, the fastest is kept")
+    parser.add_argument("--only", help="Comma-separated benchmarks to run, out of " + ", ".join(BENCHMARKS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--threshold", type=float, default=0.3, help="Relative slowdown counted as a regression")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the baseline")
+    args = parser.parse_args()
+
+    only = set(args.only.split(',')) if args.only else None
+    if only and only - set(BENCHMARKS):
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(only - set(BENCHMARKS)))}")
+
+    result = run_suite(rows=args.rows, repeat=args.repeat, only=only, seed=args.seed)
+    if args.update_baseline:
+        save_baseline(result, args.baseline)
+        print(f"\n💾 Baseline for {args.rows} rows saved to '{args.baseline}'")
+        raise SystemExit(0)
+
+    baseline = load_baseline(args.baseline).get(str(args.rows))
+    if baseline is None:
+        print(f"\n⚠️  No baseline for {args.rows} rows in '{args.baseline}', run with --update-baseline to record one")
+        raise SystemExit(0)
+    print(f"\n📊 Compared with the baseline for {args.rows} rows:")
+    passed = check_against_baseline(result, baseline, threshold=args.threshold)
+    print("\n✅ No regressions" if passed else "\n❌ Regressions found")
+    raise SystemExit(0 if passed else 1)
@@ -0,0 +1,191 @@
+import os
+import random
+
+WORDS = (
+    "api data json rest service real time get fetch search returns simple fast "
+    "free access developers app mobile web integration stock weather price news "
+    "music video image text email sms payment crypto market location travel food "
+    "translate detect analyze generate convert validate track monitor"
+).split()
+
+CATEGORIES = [
+    "Data", "Finance", "Tools", "eCommerce", "Business", "Sports", "Food",
+    "Music", "Travel", "Education", "Search", "Database", "Media", "Medical"
+]
+
+def generate_records(num_records, seed=0):
+    """
+    Yields synthetic API records shaped like the scraper's output.
+
+    Args:
+        num_records (int): Number of records to generate.
+        seed (int): Seed for the random generator, so runs are repeatable.
+
+    Yields:
+        dict: A record with 'name', 'category' and 'description'.
+    """
+    rng = random.Random(seed)
+    for i in range(num_records):
+        num_words = rng.randint(5, 40)
+        description = " ".join(rng.choice(WORDS) for _ in range(num_words)).capitalize() + "."
+        yield {
+            'name': f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} API {i}",
+            'category': rng.choice(CATEGORIES),
+            'description': description
+        }
+
+# Categories of the real dataset with their share of rows, see statistics_report_en_clean.txt
+CATEGORY_WEIGHTS = {
+    "Cybersecurity": 950, "Data": 950, "Finance": 923, "Artificial Intelligence/Machine Learning": 909,
+    "Other": 886, "Tools": 875, "eCommerce": 817, "Business": 816, "Advertising": 794, "Social": 740,
+    "Business Software": 723, "Entertainment": 710, "Sports": 707, "News, Media": 679, "Text Analysis": 627,
+    "Video, Images": 589, "Education": 557, "Location": 482, "Database": 452, "Gaming": 450,
+    "Communication": 430, "Commerce": 390, "Media": 378, "Financial": 375, "Email": 360,
+    "Visual Recognition": 341, "Search": 295, "Travel": 289, "Music": 247, "Food": 232, "Weather": 216,
+    "Cryptography": 213, "Health and Fitness": 200
+}
+
+# English sentences with the function words real descriptions have
+ENGLISH_SENTENCES = [
+    "This API returns {topic} data in JSON format.",
+    "Get real time {topic} information for your app.",
+    "Use it to search and filter {topic} records by name, date or location.",
+    "The fastest way to integrate {topic} into your website or mobile application.",
+    "Access thousands of {topic} sources with a single request.",
+    "It is free for developers and easy to use.",
+    "Our service helps you analyze and validate {topic} at scale.",
+    "Track {topic} prices and send alerts to your users.",
+    "Simple REST endpoints with clear documentation and examples.",
+    "We provide accurate {topic} results that are updated every day.",
+]
+TOPICS = [
+    "weather", "stock market", "crypto", "sports", "news", "email", "image", "video", "music", "travel",
+    "food", "recipe", "payment", "location", "translation", "text", "security", "domain", "movie", "job"
+]
+
+# Non-English descriptions, in the languages the real dataset has most, with their share among them
+FOREIGN_SENTENCES = {
+    'de': (254, ["Diese Schnittstelle liefert aktuelle Daten für Ihre Anwendung.",
+                 "Mit dieser API können Sie Informationen schnell und einfach abrufen.",
+                 "Die Daten werden jeden Tag aktualisiert und sind kostenlos verfügbar."]),
+    'it': (162, ["Questa API restituisce i dati più recenti per la tua applicazione.",
+                 "Puoi cercare e filtrare le informazioni in modo semplice e veloce.",
+                 "Il servizio è gratuito e aggiornato ogni giorno."]),
+    'fr': (129, ["Cette API permet de récupérer les données de votre application.",
+                 "Le service est gratuit et les informations sont mises à jour chaque jour.",
+                 "Vous pouvez rechercher des résultats avec une seule requête."]),
+    'es': (60, ["Esta API devuelve los datos más recientes para tu aplicación.",
+                "El servicio es gratuito y se actualiza todos los días.",
+                "Puedes buscar y filtrar la información de forma rápida."]),
+    'pt': (76, ["Esta API retorna os dados mais recentes para o seu aplicativo.",
+                "O serviço é gratuito e atualizado todos os dias.",
+                "Você pode pesquisar as informações de forma simples e rápida."]),
+    'nl': (53, ["Deze API levert actuele gegevens voor uw toepassing.",
+                "De dienst is gratis en wordt elke dag bijgewerkt.",
+                "U kunt de informatie snel en eenvoudig zoeken."]),
+}
+
+def _description(rng, language, name):
+    """A description of about as many words as real ones: median 15, mean 23, long tail"""
+    num_words = max(1, min(380, int(rng.lognormvariate(2.8, 0.85))))
+    # Opening with the API's own name keeps descriptions as distinct as real ones
+    words = name.split()
+    while len(words) < num_words:
+        if language == 'en':
+            sentence = rng.choice(ENGLISH_SENTENCES).format(topic=rng.choice(TOPICS))
+        else:
+            sentence = rng.choice(FOREIGN_SENTENCES[language][1])
+        words.extend(sentence.split())
+    text = " ".join(words[:num_words])
+    return text if text.endswith('.') else text + "."
+
+def generate_dataset_records(num_records, seed=0, foreign_rate=0.07, duplicate_description_rate=0.03,
+                             duplicate_name_rate=0.04, empty_rate=0.002, one_word_rate=0.01):
+    """
+    Yields synthetic API records with the shape of the real scraped data.
+
+    Categories follow the real category sizes, descriptions have real
+    lengths and are English except for a foreign_rate share in the
+    languages the real dataset has most. Some descriptions are empty, some
+    are a single word, some are reused by another API, and some APIs are
+    listed again under another category with the same name, like the
+    per-category CSVs before combine_api_csv_files. Duplicates are drawn
+    from a bounded pool of recent records, so memory stays constant at any
+    num_records.
+
+    Args:
+        num_records (int): Number of records to generate.
+        seed (int): Seed for the random generator, so runs are repeatable.
+        foreign_rate (float): Share of non-English descriptions.
+        duplicate_description_rate (float): Share of descriptions copied from an earlier record.
+        duplicate_name_rate (float): Share of records repeating an earlier API under another category.
+        empty_rate (float): Share of records without a description.
+        one_word_rate (float): Share of one-word descriptions.
+
+    Yields:
+        dict: A record with 'name', 'category' and 'description'.
+    """
+    rng = random.Random(seed)
+    categories = list(CATEGORY_WEIGHTS)
+    category_weights = list(CATEGORY_WEIGHTS.values())
+    languages = list(FOREIGN_SENTENCES)
+    language_weights = [weight for weight, _ in FOREIGN_SENTENCES.values()]
+    recent = []
+    for i in range(num_records):
+        category = rng.choices(categories, category_weights)[0]
+        roll = rng.random()
+        if recent and roll < duplicate_name_rate:
+            record = dict(rng.choice(recent), category=category)
+            yield record
+            continue
+
+        name = f"{rng.choice(TOPICS).title()} {rng.choice(WORDS).title()} API {i}"
+        roll = rng.random()
+        if roll < empty_rate:
+            description = None
+        elif roll < empty_rate + one_word_rate:
+            description = rng.choice(WORDS).title()
+        elif recent and roll < empty_rate + one_word_rate + duplicate_description_rate:
+            description = rng.choice(recent)['description']
+        else:
+            language = 'en' if rng.random() >= foreign_rate else rng.choices(languages, language_weights)[0]
+            description = _description(rng, language, name)
+
+        record = {'name': name, 'category': category, 'description': description}
+        if len(recent) < 1000:
+            recent.append(record)
+        else:
+            recent[rng.randrange(1000)] = record
+        yield record
+
+def write_category_csvs(directory, num_records, seed=0, prefix="rapidapi_apis", **options):
+    """
+    Writes generate_dataset_records as per-category CSVs named like the
+    scraper's output files, streaming rows so any size fits in memory.
+
+    Returns:
+        dict: Rows written per file.
+    """
+    import csv
+
+    os.makedirs(directory, exist_ok=True)
+    files = {}
+    writers = {}
+    rows = {}
+    try:
+        for record in generate_dataset_records(num_records, seed=seed, **options):
+            # Same names as webscrap.get_output_csv, without importing selenium
+            sanitized_category = record['category'].replace('/', '_').replace(' ', '')
+            filename = os.path.join(directory, f"{prefix}_{sanitized_category}.csv")
+            writer = writers.get(filename)
+            if writer is None:
+                files[filename] = open(filename, 'w', newline='', encoding='utf-8')
+                writer = writers[filename] = csv.DictWriter(files[filename], fieldnames=['name', 'category', 'description'])
+                writer.writeheader()
+                rows[filename] = 0
+            writer.writerow(record)
+            rows[filename] += 1
+    finally:
+        for f in files.values():
+            f.close()
+    return rows
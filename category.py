@@ -1,10 +1,13 @@
-import re
-from urllib.parse import unquote
 import os
 
+from sitemap import iter_sitemap_entries, category_from_url
+
 def extract_categories_from_sitemap(sitemap_file="sitemap-category.xml"):
     """
-    Extracts API categories from the sitemap.xml file using regex.
+    Extracts API categories from the sitemap.xml file.
+
+    The file is streamed with sitemap.iter_sitemap_entries, so memory does
+    not grow with its size.
 
     Args:
         sitemap_file (str): The path to the sitemap XML file.
@@ -14,18 +17,9 @@ def extract_categories_from_sitemap(sitemap_file="sitemap-category.xml"):
     """
     print(f"🔎 Extracting categories from {sitemap_file}...")
     try:
-        with open(sitemap_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Regex to find all category names within the <loc> tags
-        # It captures the part of the URL after "/search/"
-        pattern = r"<loc>https://rapidapi.com/search/(.*?)</loc>"
-        
-        # Find all matches and decode URL-encoded characters (e.g., %20 -> space)
-        encoded_categories = re.findall(pattern, content)
-        decoded_categories = [unquote(cat) for cat in encoded_categories]
-        
-        return decoded_categories
+        # Keep the category names of the /search/<category> page URLs (e.g. %20 -> space)
+        categories = (category_from_url(loc) for kind, loc, _ in iter_sitemap_entries(sitemap_file) if kind == 'url')
+        return [category for category in categories if category]
     except FileNotFoundError:
         print(f"❌ Error: Sitemap file not found at '{sitemap_file}'")
         return []
@@ -1,14 +1,44 @@
-import pandas as pd
 import os
+from dataset_storage import DatasetWriter, iter_dataset_chunks, read_columns
+import metrics
 
-def clean_descriptions(input_file="rapidapi_fused_dataset_en.csv", output_file="rapidapi_fused_dataset_clean.csv"):
+def iter_clean_chunks(input_file, chunksize=50000, min_words=2):
+    """
+    Reads a CSV or Parquet dataset in fixed-size chunks and yields each
+    chunk without the rows whose description is empty or has fewer than
+    min_words words.
+
+    Words are counted with a vectorized regex instead of splitting every
+    description into a list, so memory use only depends on chunksize.
+
+    Args:
+        input_file (str): The path to the input CSV or Parquet file.
+        chunksize (int): Rows read at a time.
+        min_words (int): Minimum number of words in a kept description.
+
+    Yields:
+        tuple: (number of rows read, cleaned pd.DataFrame)
+    """
+    for chunk in iter_dataset_chunks(input_file, chunksize=chunksize):
+        descriptions = chunk['description']
+        # astype(str) also works on chunks without any text; non-text values are never kept
+        word_counts = descriptions.astype(str).str.count(r'\S+')
+        yield len(chunk), chunk[descriptions.notna() & (word_counts >= min_words)]
+
+def clean_descriptions(input_file="rapidapi_fused_dataset_en.csv", output_file="rapidapi_fused_dataset_clean.csv", chunksize=50000):
     """
     Reads a dataset, filters out rows with descriptions that are empty or
     contain less than two words, and saves the cleaned data.
 
+    The input is streamed through iter_clean_chunks and every cleaned chunk
+    is appended to the output as soon as it is ready, so peak memory stays
+    flat however large the input grows. Either file can be CSV or Parquet,
+    depending on its extension.
+
     Args:
-        input_file (str): The path to the input CSV file.
-        output_file (str): The path to save the cleaned CSV file.
+        input_file (str): The path to the input CSV or Parquet file.
+        output_file (str): The path to save the cleaned CSV or Parquet file.
+        chunksize (int): Rows read and written at a time.
     """
     print(f"🧹 Reading and cleaning dataset: {input_file}")
 
@@ -17,24 +47,22 @@ def clean_descriptions(input_file="rapidapi_fused_dataset_en.csv", output_file="
         return
 
     try:
-        df = pd.read_csv(input_file)
-        initial_rows = len(df)
-        print(f"Total rows in original dataset: {initial_rows}")
+        initial_rows = 0
+        with DatasetWriter(output_file, columns=read_columns(input_file)) as writer:
+            for rows_read, chunk in iter_clean_chunks(input_file, chunksize=chunksize):
+                initial_rows += rows_read
+                writer.write(chunk)
+        final_rows = writer.rows
+        metrics.count('clean.rows', initial_rows)
+        metrics.count('clean.rows_kept', final_rows)
 
-        # Filter out rows where the description is null, empty, or has less than two words
-        df.dropna(subset=['description'], inplace=True)
-        df = df[df['description'].str.split().str.len() >= 2]
-
-        final_rows = len(df)
+        print(f"Total rows in original dataset: {initial_rows}")
         rows_removed = initial_rows - final_rows
         print(f"Rows after cleaning: {final_rows} ({rows_removed} rows removed)")
-
-        # Save the cleaned dataset
-        df.to_csv(output_file, index=False)
         print(f"✅ Cleaned dataset saved to '{output_file}'")
 
     except Exception as e:
         print(f"❌ An error occurred during cleaning: {e}")
 
 if __name__ == "__main__":
-    clean_descriptions()
\ No newline at end of file
+    clean_descriptions()
@@ -0,0 +1,256 @@
+import argparse
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+import metrics
+from dataset_storage import iter_dataset_chunks, prefix_sha256s
+from search_index import tokenize
+
+MANIFEST_FILE = "manifest.json"
+VOCABULARY_FILE = "vocabulary.txt"
+TEXT_COLUMNS = ('name', 'description')
+TOKEN_DTYPE = np.uint32
+OFFSET_DTYPE = np.int64
+CATEGORY_DTYPE = np.uint16
+
+def _column_files(corpus_dir, column):
+    return (os.path.join(corpus_dir, f"{column}.tokens.u32"),
+            os.path.join(corpus_dir, f"{column}.offsets.i64"))
+
+def _load_manifest(corpus_dir):
+    path = os.path.join(corpus_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_manifest(corpus_dir, manifest):
+    path = os.path.join(corpus_dir, MANIFEST_FILE)
+    with open(path + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+def _truncate(path, length):
+    """Drop whatever a crashed update appended after the last saved manifest"""
+    with open(path, 'ab') as f:
+        f.truncate(length)
+
+def update_corpus(csv_file="rapidapi_fused_dataset_clean.csv", corpus_dir="corpus", chunksize=50000, rebuild=False):
+    """
+    Builds the tokenized corpus of a dataset, or adds the rows appended to
+    it since the last update.
+
+    Every 'name' and 'description' is tokenized once with
+    search_index.tokenize. Tokens are stored as ids into a shared
+    vocabulary, in one flat uint32 file per column, with an int64 offsets
+    file giving where each row starts. Categories are stored as uint16
+    codes. All files are raw arrays, so an update only appends to them and
+    readers can memory-map them; new terms get the next free ids, so
+    existing ids never change. The corpus is rebuilt when the dataset no
+    longer starts with the bytes it had at the last update, since then it
+    was rewritten rather than appended to.
+
+    Args:
+        csv_file (str): The CSV or Parquet dataset to tokenize.
+        corpus_dir (str): Directory of the corpus.
+        chunksize (int): Rows tokenized at a time.
+        rebuild (bool): Drop the existing corpus and tokenize the whole dataset.
+
+    Returns:
+        int: Number of rows added to the corpus.
+    """
+    print(f"🔤 Updating tokenized corpus '{corpus_dir}' from '{csv_file}'...")
+    if not os.path.exists(csv_file):
+        print(f"❌ Error: Input file '{csv_file}' not found.")
+        return 0
+
+    start = time.perf_counter()
+    manifest = None if rebuild else _load_manifest(corpus_dir)
+    source_bytes = os.path.getsize(csv_file)
+    tokenized_sha256, source_sha256 = prefix_sha256s(csv_file, [manifest['source_bytes'] if manifest else 0, source_bytes])
+    if manifest and (tokenized_sha256 is None or tokenized_sha256 != manifest.get('source_sha256')):
+        print("   ⚠️ Dataset was rewritten since it was tokenized, rebuilding the corpus")
+        manifest = None
+    if manifest is None:
+        shutil.rmtree(corpus_dir, ignore_errors=True)
+        os.makedirs(corpus_dir)
+        manifest = {'rows': 0, 'source_bytes': 0, 'vocabulary_size': 0, 'categories': [],
+                    'tokens': {column: 0 for column in TEXT_COLUMNS}}
+        for column in TEXT_COLUMNS:
+            with open(_column_files(corpus_dir, column)[1], 'wb') as f:
+                f.write(np.zeros(1, dtype=OFFSET_DTYPE).tobytes())
+
+    vocabulary_file = os.path.join(corpus_dir, VOCABULARY_FILE)
+    terms = []
+    if os.path.exists(vocabulary_file):
+        with open(vocabulary_file, 'r', encoding='utf-8') as f:
+            terms = f.read().split("\n")[:manifest['vocabulary_size']]
+    term_ids = {term: i for i, term in enumerate(terms)}
+    category_codes = {category: code for code, category in enumerate(manifest['categories'])}
+
+    # Cut off anything a crashed update appended after the manifest was saved
+    for column in TEXT_COLUMNS:
+        tokens_file, offsets_file = _column_files(corpus_dir, column)
+        _truncate(tokens_file, manifest['tokens'][column] * np.dtype(TOKEN_DTYPE).itemsize)
+        _truncate(offsets_file, (manifest['rows'] + 1) * np.dtype(OFFSET_DTYPE).itemsize)
+    categories_file = os.path.join(corpus_dir, "category.codes.u16")
+    _truncate(categories_file, manifest['rows'] * np.dtype(CATEGORY_DTYPE).itemsize)
+    with open(vocabulary_file, 'w', encoding='utf-8') as f:
+        f.write("".join(f"{term}\n" for term in terms))
+
+    added = 0
+    reader = iter_dataset_chunks(csv_file, chunksize=chunksize, columns=['name', 'category', 'description'],
+                                 skip_rows=manifest['rows'])
+    for chunk in reader:
+        if chunk.empty:
+            continue
+        vocabulary_size = len(terms)
+        for column in TEXT_COLUMNS:
+            ids = []
+            lengths = np.zeros(len(chunk), dtype=OFFSET_DTYPE)
+            # Same text as search_index indexes: missing values are empty, numbers are text
+            texts = chunk[column].astype(object).fillna('').astype(str).tolist()
+            for row, text in enumerate(texts):
+                tokens = tokenize(text)
+                lengths[row] = len(tokens)
+                for token in tokens:
+                    term_id = term_ids.get(token)
+                    if term_id is None:
+                        term_id = term_ids[token] = len(terms)
+                        terms.append(token)
+                    ids.append(term_id)
+            tokens_file, offsets_file = _column_files(corpus_dir, column)
+            with open(tokens_file, 'ab') as f:
+                f.write(np.asarray(ids, dtype=TOKEN_DTYPE).tobytes())
+            with open(offsets_file, 'ab') as f:
+                f.write((manifest['tokens'][column] + np.cumsum(lengths)).astype(OFFSET_DTYPE).tobytes())
+            manifest['tokens'][column] += len(ids)
+
+        codes = []
+        for category in chunk['category'].astype(object).fillna('').astype(str):
+            code = category_codes.get(category)
+            if code is None:
+                code = category_codes[category] = len(manifest['categories'])
+                manifest['categories'].append(category)
+            codes.append(code)
+        with open(categories_file, 'ab') as f:
+            f.write(np.asarray(codes, dtype=CATEGORY_DTYPE).tobytes())
+        with open(vocabulary_file, 'a', encoding='utf-8') as f:
+            f.write("".join(f"{term}\n" for term in terms[vocabulary_size:]))
+
+        manifest['rows'] += len(chunk)
+        manifest['vocabulary_size'] = len(terms)
+        added += len(chunk)
+
+    manifest['source_bytes'] = source_bytes
+    manifest['source_sha256'] = source_sha256
+    _save_manifest(corpus_dir, manifest)
+    metrics.count('corpus.rows', added)
+    print(f"✅ Tokenized {added} new rows in {time.perf_counter() - start:.1f}s "
+          f"({manifest['rows']} rows, {sum(manifest['tokens'].values())} tokens, {len(terms)} terms)")
+    return added
+
+class TokenizedCorpus:
+    """
+    Read-only view of a corpus built by update_corpus.
+
+    Token ids, offsets and category codes are memory-mapped, so opening is
+    instant and the token stream of a row is a zero-copy slice.
+
+    Args:
+        corpus_dir (str): Directory of the corpus.
+    """
+
+    def __init__(self, corpus_dir="corpus"):
+        manifest = _load_manifest(corpus_dir)
+        if manifest is None:
+            raise FileNotFoundError(f"No tokenized corpus in '{corpus_dir}', run update_corpus first")
+        self.corpus_dir = corpus_dir
+        self.rows = manifest['rows']
+        self.source_bytes = manifest['source_bytes']
+        self.source_sha256 = manifest.get('source_sha256')
+        self.category_names = manifest['categories']
+        self._vocabulary_size = manifest['vocabulary_size']
+        self._vocabulary = None
+        self._term_ids = None
+        self.tokens = {}
+        self.offsets = {}
+        for column in TEXT_COLUMNS:
+            tokens_file, offsets_file = _column_files(corpus_dir, column)
+            self.tokens[column] = self._map(tokens_file, TOKEN_DTYPE, manifest['tokens'][column])
+            self.offsets[column] = self._map(offsets_file, OFFSET_DTYPE, self.rows + 1)
+        self.categories = self._map(os.path.join(corpus_dir, "category.codes.u16"), CATEGORY_DTYPE, self.rows)
+
+    @staticmethod
+    def _map(path, dtype, length):
+        # np.memmap cannot map an empty file
+        if length == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(length,))
+
+    @property
+    def vocabulary(self):
+        """Terms in id order, loaded on first use"""
+        if self._vocabulary is None:
+            with open(os.path.join(self.corpus_dir, VOCABULARY_FILE), 'r', encoding='utf-8') as f:
+                self._vocabulary = f.read().split("\n")[:self._vocabulary_size]
+        return self._vocabulary
+
+    def term_id(self, term):
+        """Id of a term, or None if it is not in the corpus"""
+        if self._term_ids is None:
+            self._term_ids = {term: i for i, term in enumerate(self.vocabulary)}
+        return self._term_ids.get(term)
+
+    def row_tokens(self, row, column='description'):
+        """Token ids of one row, as a view into the memory-mapped file"""
+        offsets = self.offsets[column]
+        return self.tokens[column][offsets[row]:offsets[row + 1]]
+
+    def row_lengths(self, column='description'):
+        """Number of tokens of every row"""
+        return np.diff(self.offsets[column])
+
+    def token_rows(self, column='description'):
+        """Row of every token in the flat token array"""
+        return np.repeat(np.arange(self.rows), self.row_lengths(column))
+
+    def decode(self, token_ids):
+        """Terms of a sequence of token ids"""
+        vocabulary = self.vocabulary
+        return [vocabulary[i] for i in token_ids]
+
+def corpus_for(csv_file, corpus_dir, source_sha256=None):
+    """
+    The TokenizedCorpus in corpus_dir if it was built from the current
+    content of csv_file, so its rows are the rows of the dataset; otherwise
+    None, after a warning, and the caller tokenizes the texts itself.
+
+    Args:
+        source_sha256 (str): SHA-256 of csv_file if the caller has it already.
+    """
+    try:
+        corpus = TokenizedCorpus(corpus_dir)
+    except FileNotFoundError as e:
+        print(f"   ⚠️ {e}, tokenizing the texts instead")
+        return None
+    if source_sha256 is None:
+        source_sha256 = prefix_sha256s(csv_file, [os.path.getsize(csv_file)])[0]
+    if corpus.source_sha256 != source_sha256:
+        print(f"   ⚠️ Corpus '{corpus_dir}' is out of date, tokenizing the texts instead")
+        return None
+    return corpus
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(__file__)
+    parser = argparse.ArgumentParser(description="Build or extend the tokenized corpus of the clean dataset")
+    parser.add_argument("--csv", default=os.path.join(script_dir, "rapidapi_fused_dataset_clean.csv"))
+    parser.add_argument("--corpus", default=os.path.join(script_dir, "corpus"))
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+
+    update_corpus(csv_file=args.csv, corpus_dir=args.corpus, rebuild=args.rebuild)
@@ -0,0 +1,345 @@
+import argparse
+import os
+import socket
+import sqlite3
+import threading
+import time
+from functools import partial
+
+class CrawlQueue:
+    """
+    Durable queue of category crawl tasks, stored in SQLite.
+
+    Workers claim one task at a time under a lease that expires after
+    lease_seconds unless the worker sends heartbeats. A task whose lease
+    expired (its worker died or hung) is claimable again by any worker, so
+    nothing is lost when a process or machine goes away. A task that fails
+    or times out max_attempts times is marked 'failed' instead of being
+    retried forever.
+
+    Several processes may share the file. Workers on other hosts need the
+    file on storage with working file locks; SQLite over NFS is not safe.
+
+    Args:
+        path (str): The SQLite database file.
+        max_attempts (int): Claims of a task before it is marked failed.
+        timeout (float): Seconds to wait for another writer's lock.
+    """
+
+    def __init__(self, path="crawl_queue.sqlite", max_attempts=3, timeout=30.0):
+        self.path = path
+        self.max_attempts = max_attempts
+        # Autocommit mode, transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                category TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker TEXT,
+                lease_expires REAL,
+                enqueued_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                error TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires)")
+
+    def _transaction(self, statements):
+        """Run (sql, args) pairs in one write transaction and return the cursor of the last one"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, args in statements:
+                cursor = self._conn.execute(sql, args)
+            self._conn.execute("COMMIT")
+            return cursor
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def enqueue(self, categories):
+        """Add categories as pending tasks; ones already in the queue are left as they are. Returns the number added."""
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            self._conn.executemany("INSERT OR IGNORE INTO tasks (category, enqueued_at) VALUES (?, ?)",
+                                   [(category, now) for category in dict.fromkeys(categories)])
+            after = self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        return after - before
+
+    def requeue(self, categories=None, failed_only=True):
+        """
+        Put failed tasks back to pending with a fresh attempt count. With
+        failed_only=False, done tasks are requeued too, e.g. to re-crawl
+        categories that changed; leased tasks are never touched.
+        """
+        condition = "status = 'failed'" if failed_only else "status IN ('done', 'failed')"
+        if categories is not None:
+            categories = list(categories)
+            condition += f" AND category IN ({','.join('?' * len(categories))})"
+        cursor = self._transaction([(
+            f"UPDATE tasks SET status = 'pending', attempts = 0, worker = NULL, lease_expires = NULL, error = NULL "
+            f"WHERE {condition}", categories or []
+        )])
+        return cursor.rowcount
+
+    def claim(self, worker, lease_seconds=300):
+        """
+        Lease the next pending or expired task to a worker.
+
+        Expired tasks that already used up their attempts are marked failed
+        first. Returns the category name, or None if nothing is claimable.
+        """
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "UPDATE tasks SET status = 'failed', worker = NULL, error = 'lease expired' "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts)
+            )
+            row = self._conn.execute(
+                "SELECT category FROM tasks WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY attempts, enqueued_at, category LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE tasks SET status = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1, "
+                    "started_at = ?, error = NULL WHERE category = ?",
+                    (worker, now + lease_seconds, now, row[0])
+                )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        return row[0] if row else None
+
+    def heartbeat(self, category, worker, lease_seconds=300):
+        """Extend a lease. Returns False if the worker no longer holds it, e.g. because it expired and was re-claimed."""
+        cursor = self._transaction([(
+            "UPDATE tasks SET lease_expires = ? WHERE category = ? AND worker = ? AND status = 'leased'",
+            (time.time() + lease_seconds, category, worker)
+        )])
+        return cursor.rowcount == 1
+
+    def complete(self, category, worker):
+        """Mark a leased task done. Returns False if the worker had lost the lease."""
+        cursor = self._transaction([(
+            "UPDATE tasks SET status = 'done', lease_expires = NULL, finished_at = ? "
+            "WHERE category = ? AND worker = ? AND status = 'leased'",
+            (time.time(), category, worker)
+        )])
+        return cursor.rowcount == 1
+
+    def fail(self, category, worker, error):
+        """Give a leased task back: pending again, or failed once it used up its attempts"""
+        cursor = self._transaction([(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "worker = NULL, lease_expires = NULL, finished_at = ?, error = ? "
+            "WHERE category = ? AND worker = ? AND status = 'leased'",
+            (self.max_attempts, time.time(), str(error), category, worker)
+        )])
+        return cursor.rowcount == 1
+
+    def progress(self):
+        """
+        Returns:
+            dict: Number of tasks per status ('pending', 'leased', 'done',
+            'failed'), with expired leases counted as 'expired'.
+        """
+        counts = {'pending': 0, 'leased': 0, 'expired': 0, 'done': 0, 'failed': 0}
+        for status, expired, count in self._conn.execute(
+            "SELECT status, status = 'leased' AND lease_expires < ?, COUNT(*) FROM tasks GROUP BY 1, 2", (time.time(),)
+        ):
+            counts['expired' if expired else status] += count
+        return counts
+
+    def tasks(self, status=None):
+        """All tasks, or the ones with a given status, as dicts"""
+        sql = "SELECT * FROM tasks" + (" WHERE status = ?" if status else "") + " ORDER BY enqueued_at, category"
+        cursor = self._conn.execute(sql, (status,) if status else ())
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def close(self):
+        self._conn.close()
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class _Heartbeat(threading.Thread):
+    """
+    Extends a task's lease in the background while the worker crawls, and
+    sets the lost event once a heartbeat finds the lease taken over.
+    """
+
+    def __init__(self, queue_file, category, worker, lease_seconds, interval):
+        super().__init__(daemon=True)
+        self.queue_file = queue_file
+        self.category = category
+        self.worker = worker
+        self.lease_seconds = lease_seconds
+        self.interval = interval
+        self.lost = threading.Event()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        # SQLite connections belong to one thread, so the heartbeat has its own
+        queue = CrawlQueue(self.queue_file)
+        try:
+            while not self._stop_event.wait(self.interval):
+                if not queue.heartbeat(self.category, self.worker, self.lease_seconds):
+                    self.lost.set()
+                    return
+        finally:
+            queue.close()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+def scrape_category_task(category, stop_event=None, scroll_delay=1, profile="lean", backend="selenium",
+                         output_csv_prefix="rapidapi_apis"):
+    """
+    Crawl one category with webscrap and raise if it did not finish.
+
+    Resumes an unfinished checkpoint, so a task re-claimed after a worker
+    died continues where that worker stopped. A finished checkpoint means
+    the category was requeued to be crawled again, so it starts over. The
+    crawl stops between batches once stop_event is set.
+    """
+    from webscrap import scrape_rapidapi_search_page, get_output_csv, load_checkpoint
+    checkpoint = load_checkpoint(get_output_csv(category, output_csv_prefix))
+    resume = not (checkpoint and checkpoint.get('completed'))
+    scrape_rapidapi_search_page(category=category, scroll_delay=scroll_delay, output_csv_prefix=output_csv_prefix,
+                                resume=resume, profile=profile, backend=backend, stop_event=stop_event)
+    if stop_event is not None and stop_event.is_set():
+        return
+    checkpoint = load_checkpoint(get_output_csv(category, output_csv_prefix))
+    if not (checkpoint and checkpoint.get('completed')):
+        raise RuntimeError(f"crawl of '{category}' did not complete")
+
+def run_worker(queue_file="crawl_queue.sqlite", crawl=scrape_category_task, worker=None, lease_seconds=300,
+               heartbeat_interval=60, poll_interval=10, wait_for_leases=True, max_attempts=3):
+    """
+    Drains a CrawlQueue: claims a task, crawls it while sending heartbeats,
+    and marks it done or failed, until no task is left.
+
+    Args:
+        queue_file (str): The queue's SQLite file.
+        crawl (callable): Called with the category name and an event that
+            is set when the lease is lost, after which it must stop writing
+            and return; raising marks the attempt as failed.
+        worker (str): Worker id, hostname:pid by default.
+        lease_seconds (float): Lease length; a worker that stops sending
+            heartbeats loses its task after this long.
+        heartbeat_interval (float): Seconds between heartbeats, well below lease_seconds.
+        poll_interval (float): Seconds between claims while other workers hold leases.
+        wait_for_leases (bool): Keep polling while other workers hold tasks,
+            so tasks of workers that die are picked up; otherwise stop as
+            soon as nothing is pending.
+        max_attempts (int): Claims of a task before it is marked failed.
+
+    Returns:
+        dict: {'done': [...], 'failed': [...]} categories handled by this worker.
+    """
+    worker = worker or default_worker_id()
+    queue = CrawlQueue(queue_file, max_attempts=max_attempts)
+    handled = {'done': [], 'failed': []}
+    print(f"👷 Worker {worker} started on '{queue_file}'")
+    try:
+        while True:
+            category = queue.claim(worker, lease_seconds)
+            if category is None:
+                progress = queue.progress()
+                if not wait_for_leases or progress['leased'] + progress['expired'] == 0:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            print(f"\n[{worker}] Crawling category: {category}")
+            heartbeat = _Heartbeat(queue_file, category, worker, lease_seconds, heartbeat_interval)
+            heartbeat.start()
+            start = time.time()
+            try:
+                crawl(category, heartbeat.lost)
+                error = None
+            except Exception as e:
+                error = e
+            heartbeat.stop()
+            if heartbeat.lost.is_set():
+                # The task and its files belong to the worker that took it over
+                print(f"⚠️  [{worker}] Lost the lease on {category}, stopped crawling it")
+            elif error is not None:
+                queue.fail(category, worker, error)
+                handled['failed'].append(category)
+                print(f"❌ [{worker}] {category} failed: {error}")
+            elif queue.complete(category, worker):
+                handled['done'].append(category)
+                print(f"✅ [{worker}] {category} done in {time.time() - start:.1f}s")
+            else:
+                print(f"⚠️  [{worker}] Lost the lease on {category}, another worker took it over")
+    finally:
+        queue.close()
+
+    print(f"👷 Worker {worker} finished: {len(handled['done'])} done, {len(handled['failed'])} failed")
+    return handled
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(__file__)
+    parser = argparse.ArgumentParser(description="Distributed category crawls through a shared SQLite job queue")
+    parser.add_argument("--queue", default=os.path.join(script_dir, "crawl_queue.sqlite"))
+    commands = parser.add_subparsers(dest="command", required=True)
+    enqueue_parser = commands.add_parser("enqueue", help="Add categories to the queue")
+    enqueue_parser.add_argument("categories", nargs="*", help="Category names")
+    enqueue_parser.add_argument("--sitemap", help="Also add every category of this sitemap file")
+    enqueue_parser.add_argument("--sitemap-url", help="Also add the categories of this sitemap that are new or "
+                                                      "changed since the last delta, and requeue the changed ones")
+    enqueue_parser.add_argument("--sitemap-cache", default=os.path.join(script_dir, "sitemap_cache"))
+    requeue_parser = commands.add_parser("requeue", help="Put failed tasks back to pending")
+    requeue_parser.add_argument("categories", nargs="*")
+    worker_parser = commands.add_parser("worker", help="Crawl tasks until the queue is drained")
+    worker_parser.add_argument("--lease", type=float, default=300)
+    worker_parser.add_argument("--heartbeat", type=float, default=60)
+    worker_parser.add_argument("--profile", default="lean")
+    worker_parser.add_argument("--backend", default="selenium")
+    commands.add_parser("status", help="Show the progress of the queue")
+    args = parser.parse_args()
+
+    if args.command == "enqueue":
+        categories = list(args.categories)
+        if args.sitemap:
+            from category import extract_categories_from_sitemap
+            categories += extract_categories_from_sitemap(args.sitemap)
+        queue = CrawlQueue(args.queue)
+        if args.sitemap_url:
+            from sitemap import category_delta, commit_delta
+            delta = category_delta(args.sitemap_url, cache_dir=args.sitemap_cache, commit=False)
+            categories += delta['new']
+            queue.enqueue(delta['changed'])
+            print(f"♻️  {queue.requeue(delta['changed'], failed_only=False)} changed categories requeued")
+        print(f"✅ {queue.enqueue(categories)} new tasks added to '{args.queue}'")
+        if args.sitemap_url:
+            # Only now that the delta is queued does it become the reference for the next one
+            commit_delta(delta)
+    elif args.command == "requeue":
+        queue = CrawlQueue(args.queue)
+        print(f"♻️  {queue.requeue(args.categories or None)} tasks put back to pending")
+    elif args.command == "worker":
+        run_worker(args.queue, crawl=partial(scrape_category_task, profile=args.profile, backend=args.backend),
+                   lease_seconds=args.lease, heartbeat_interval=args.heartbeat)
+    else:
+        queue = CrawlQueue(args.queue)
+        print(" | ".join(f"{status}: {count}" for status, count in queue.progress().items()))
+        for task in queue.tasks():
+            worker = f" ({task['worker']})" if task['status'] == 'leased' else ""
+            error = f" - {task['error']}" if task['error'] else ""
+            print(f"   {task['status']:8s} {task['category']}{worker} attempts {task['attempts']}{error}")
@@ -1,66 +1,230 @@
-import pandas as pd
-from deep_translator import GoogleTranslator
-from langdetect import detect, LangDetectException
+from language_detection import detect_languages
 import os
+from translation_cache import TranslationCache
+from translation_engine import GoogleTranslatorBackend, translate_batch
+from dataset_storage import DatasetWriter, iter_dataset_chunks, read_columns
+import metrics
 
-def translate_if_not_english(text):
+_translator = None
+
+def get_translator():
+    """Return the shared translator instead of building one per row"""
+    global _translator
+    if _translator is None:
+        _translator = GoogleTranslatorBackend(source='auto', target='en')
+    return _translator
+
+def translate_if_not_english(text, cache=None, language_cache_file="language_cache.sqlite"):
     """
     Translates a given text to English if it's not already in English.
+
+    If a TranslationCache is given it is checked first, and every detected
+    language and translation is stored in it. Failed translations are not
+    cached, so they are retried on the next run. The language comes from
+    language_detection.detect_languages, through the same sidecar as the
+    batch path (language_cache_file, or None to not use it).
     """
     if not isinstance(text, str) or not text.strip():
         return text, None
 
+    if cache is not None:
+        cached = cache.get(text)
+        if cached is not None:
+            return cached
+
     try:
-        lang = detect(text)
+        (lang,), _ = detect_languages([text], cache_file=language_cache_file, workers=1)
         if lang == 'en':
-            return text, 'en'
+            result = (text, 'en')
+        elif lang == 'unknown':
+            print("    ⚠️  Could not detect language, skipping translation.")
+            result = (text, 'unknown')
         else:
             print(f"    Translating from '{lang}'...")
-            translated_text = GoogleTranslator(source='auto', target='en').translate(text)
-            return translated_text, lang
-    except LangDetectException:
-        print("    ⚠️  Could not detect language, skipping translation.")
-        return text, 'unknown'
+            translated_text = get_translator().translate(text)
+            result = (translated_text, lang)
     except Exception as e:
         print(f"    ❌ Error during translation: {e}")
         return text, 'error'
 
-def process_and_translate_dataset(input_file="rapidapi_fused_dataset.csv", output_file="rapidapi_fused_dataset_en.csv"):
+    if cache is not None:
+        cache.put(text, *result)
+    return result
+
+def translate_descriptions(descriptions, cache=None, translator=None, max_workers=8, rate_limit=5.0, language_cache_file="language_cache.sqlite"):
+    """
+    Translates every non-English description to English in one batch.
+
+    Cached descriptions are resolved first, the rest have their language
+    detected in one language_detection.detect_languages stage, and the
+    non-English ones are sent through translate_batch together. The results
+    are merged back in input order.
+
+    Args:
+        descriptions (list): The descriptions to translate.
+        cache (TranslationCache): Optional cache of languages and translations.
+        translator (Translator): Translation backend, Google Translate by default.
+        max_workers (int): Number of concurrent translator calls.
+        rate_limit (float): Maximum translator calls per second.
+        language_cache_file (str): Sidecar of detected languages shared with
+            the other stages, or None.
+
+    Returns:
+        list: One (text, language) tuple per description, like
+        translate_if_not_english returns.
+    """
+    results = [None] * len(descriptions)
+    uncached = []  # row positions that need language detection
+    pending = []  # (row position, text, language) waiting for translation
+
+    for i, text in enumerate(descriptions):
+        if not isinstance(text, str) or not text.strip():
+            results[i] = (text, None)
+            continue
+        cached = cache.get(text) if cache is not None else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            uncached.append(i)
+    if cache is not None:
+        metrics.count('translate.cache_hits', len(descriptions) - len(uncached))
+        metrics.count('translate.cache_misses', len(uncached))
+
+    languages, _ = detect_languages([descriptions[i] for i in uncached], cache_file=language_cache_file)
+    for i, lang in zip(uncached, languages):
+        text = descriptions[i]
+        if lang in ('en', 'unknown'):
+            results[i] = (text, lang)
+            if cache is not None:
+                cache.put(text, text, lang)
+        else:
+            pending.append((i, text, lang))
+
+    if pending:
+        print(f"    Translating {len(pending)} non-English descriptions...")
+        translations, stats = translate_batch(
+            [text for _, text, _ in pending],
+            translator or get_translator(),
+            max_workers=max_workers,
+            rate_limit=rate_limit
+        )
+        for (i, text, lang), translated_text in zip(pending, translations):
+            if translated_text is None:
+                results[i] = (text, 'error')
+                continue
+            results[i] = (translated_text, lang)
+            if cache is not None:
+                cache.put(text, translated_text, lang)
+        metrics.count('translate.calls', stats['calls'])
+        metrics.count('translate.retries', stats['retries'])
+        metrics.count('translate.failed', stats['failed'])
+        metrics.observe('translate.batch_seconds', stats['seconds'])
+        print(f"    🌐 {stats['calls']} translator calls for {stats['unique']} unique texts "
+              f"in {stats['seconds']:.1f}s ({stats['retries']} retries, {stats['failed']} failed)")
+
+    return results
+
+def iter_translated_chunks(input_file, cache=None, translator=None, max_workers=8, rate_limit=5.0,
+                           language_cache_file="language_cache.sqlite", chunksize=20000):
+    """
+    Reads a CSV or Parquet dataset in fixed-size chunks and yields each
+    chunk without the rows with empty descriptions, its non-English
+    descriptions translated to English and an 'original_language' column
+    added.
+
+    Every chunk goes through translate_descriptions, so memory use only
+    depends on chunksize.
+
+    Yields:
+        tuple: (number of rows read, translated pd.DataFrame)
+    """
+    for chunk in iter_dataset_chunks(input_file, chunksize=chunksize):
+        rows_read = len(chunk)
+        chunk = chunk.dropna(subset=['description'])
+        chunk = chunk[chunk['description'].astype(str).str.strip() != '']
+
+        translations = translate_descriptions(chunk['description'].tolist(), cache=cache, translator=translator,
+                                              max_workers=max_workers, rate_limit=rate_limit,
+                                              language_cache_file=language_cache_file)
+        chunk = chunk.assign(
+            description=[text for text, _ in translations],
+            original_language=[lang for _, lang in translations]
+        )
+        yield rows_read, chunk
+
+def process_and_translate_dataset(input_file="rapidapi_fused_dataset.csv", output_file="rapidapi_fused_dataset_en.csv", cache_file="translation_cache.sqlite",
+                                  translator=None, max_workers=8, rate_limit=5.0, language_cache_file="language_cache.sqlite", chunksize=20000):
     """
     Reads a dataset, filters out rows with empty descriptions, translates
     non-English descriptions to English, and saves the result.
+
+    Detected languages and translations are cached in cache_file (set it
+    to None to disable the cache), so rerunning over unchanged descriptions
+    makes no remote calls. Translations run concurrently through
+    translate_descriptions with the given translator, worker count and
+    rate limit (calls per second). Detected languages are shared with the
+    other stages through language_cache_file.
+
+    The input is streamed through iter_translated_chunks, chunksize rows at
+    a time, and each chunk is appended to the output as soon as it is
+    translated, so peak memory stays flat however large the input grows.
+    Either file can be CSV or Parquet, depending on its extension.
+
+    Descriptions whose translation failed are kept untranslated with
+    'error' as their original_language, and are not cached, so a rerun
+    tries them again.
+
+    Returns:
+        dict: {'rows', 'kept', 'translated', 'failed'} row counts, or None
+        if the input file does not exist.
     """
     print(f"📖 Reading dataset: {input_file}")
     if not os.path.exists(input_file):
         print(f"❌ Error: Input file '{input_file}' not found.")
-        return
-
-    df = pd.read_csv(input_file)
-    print(f"Total rows in original dataset: {len(df)}")
+        return None
 
-    # --- Step 1: Filter out rows with empty descriptions ---
-    df.dropna(subset=['description'], inplace=True)
-    df = df[df['description'].str.strip() != '']
-    print(f"Rows after removing empty descriptions: {len(df)}")
-
-    # --- Step 2: Translate non-English descriptions ---
     print("\n🔄 Starting translation process...")
-    translations = df['description'].apply(translate_if_not_english)
-    
-    df['description'] = translations.apply(lambda x: x[0])
-    df['original_language'] = translations.apply(lambda x: x[1])
+    total_rows = 0
+    kept_rows = 0
+    translated_count = 0
+    failed_count = 0
+    writer = DatasetWriter(output_file, columns=read_columns(input_file) + ['original_language'])
+    cache = TranslationCache(cache_file) if cache_file else None
+    try:
+        for rows_read, chunk in iter_translated_chunks(input_file, cache=cache, translator=translator,
+                                                       max_workers=max_workers, rate_limit=rate_limit,
+                                                       language_cache_file=language_cache_file, chunksize=chunksize):
+            total_rows += rows_read
+            kept_rows += len(chunk)
+            metrics.count('translate.rows', rows_read)
+            languages = chunk['original_language']
+            translated_count += int((languages.notna() & ~languages.isin(['en', 'unknown', 'error'])).sum())
+            failed_count += int((languages == 'error').sum())
+            writer.write(chunk)
+        if cache is not None:
+            stats = cache.stats()
+            print(f"🗃️  Translation cache: {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['hit_rate']:.1%} hit rate, {stats['entries']} entries)")
+    finally:
+        writer.close()
+        if cache is not None:
+            cache.close()
 
-    translated_count = df[df['original_language'].notna() & (df['original_language'] != 'en') & (df['original_language'] != 'unknown')].shape[0]
+    print(f"Total rows in original dataset: {total_rows}")
+    print(f"Rows after removing empty descriptions: {kept_rows}")
+    if failed_count:
+        print(f"\n⚠️ {failed_count} descriptions could not be translated and were kept as they were.")
     print(f"\n✅ Translation complete. Translated {translated_count} descriptions.")
-
-    # --- Step 3: Save the new dataset ---
-    df.to_csv(output_file, index=False)
     print(f"💾 Translated dataset saved to '{output_file}'")
+    return {'rows': total_rows, 'kept': kept_rows, 'translated': translated_count, 'failed': failed_count}
 
 if __name__ == "__main__":
     # Get the directory of the current script
     script_dir = os.path.dirname(__file__)
     input_csv_path = os.path.join(script_dir, "rapidapi_fused_dataset.csv")
     output_csv_path = os.path.join(script_dir, "rapidapi_fused_dataset_en.csv")
+    cache_path = os.path.join(script_dir, "translation_cache.sqlite")
+    language_cache_path = os.path.join(script_dir, "language_cache.sqlite")
 
-    process_and_translate_dataset(input_file=input_csv_path, output_file=output_csv_path)
\ No newline at end of file
+    process_and_translate_dataset(input_file=input_csv_path, output_file=output_csv_path, cache_file=cache_path,
+                                  language_cache_file=language_cache_path)
\ No newline at end of file
@@ -0,0 +1,229 @@
+import argparse
+import hashlib
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+
+# Low-cardinality columns stored as Arrow dictionaries, read back as pandas categoricals
+DICTIONARY_COLUMNS = ('category', 'original_language')
+
+def storage_format(path):
+    """'parquet' for a .parquet/.pq path, 'csv' otherwise"""
+    return 'parquet' if os.path.splitext(path)[1].lower() in PARQUET_EXTENSIONS else 'csv'
+
+def _require_pyarrow(path):
+    if pq is None:
+        raise ImportError(f"pyarrow is needed to read or write '{path}' (pip install pyarrow)")
+
+def read_columns(path):
+    """Column names of a dataset, without reading its rows"""
+    if storage_format(path) == 'parquet':
+        _require_pyarrow(path)
+        return pq.read_schema(path).names
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+def count_rows(path):
+    """Number of rows of a Parquet dataset, from its metadata"""
+    _require_pyarrow(path)
+    return pq.ParquetFile(path).metadata.num_rows
+
+def prefix_sha256s(path, lengths, block_size=1 << 20):
+    """
+    SHA-256 of the first n bytes of a file for every n in lengths, in one
+    read of the file.
+
+    Incremental readers store the digest of the bytes they have processed,
+    and compare it with the digest of the same prefix on the next run: if
+    it differs, the file was rewritten rather than appended to, whatever
+    its size.
+
+    Returns:
+        list: Hex digests in the order of lengths.
+    """
+    digest = hashlib.sha256()
+    digests = {}
+    position = 0
+    with open(path, 'rb') as f:
+        for length in sorted(set(lengths)):
+            while position < length:
+                block = f.read(min(block_size, length - position))
+                if not block:
+                    break
+                digest.update(block)
+                position += len(block)
+            digests[length] = digest.hexdigest() if position == length else None
+    return [digests[length] for length in lengths]
+
+def read_dataset(path, columns=None):
+    """
+    Reads a whole CSV or Parquet dataset.
+
+    Args:
+        path (str): The dataset file; the format follows the extension.
+        columns (list): Only read these columns, or None for all of them.
+            Parquet skips the other columns on disk.
+
+    Returns:
+        pd.DataFrame: The dataset, with DICTIONARY_COLUMNS as categoricals
+        when read from Parquet.
+    """
+    if storage_format(path) == 'parquet':
+        _require_pyarrow(path)
+        return pq.read_table(path, columns=columns).to_pandas()
+    return pd.read_csv(path, usecols=columns)
+
+def iter_dataset_chunks(path, chunksize=50000, columns=None, skip_rows=0):
+    """
+    Reads a CSV or Parquet dataset in chunks of at most chunksize rows.
+
+    Args:
+        path (str): The dataset file; the format follows the extension.
+        chunksize (int): Maximum rows per chunk.
+        columns (list): Only read these columns, or None for all of them.
+        skip_rows (int): Number of data rows to skip at the start. Parquet
+            row groups that are skipped entirely are not read at all.
+
+    Yields:
+        pd.DataFrame: The chunks, in file order.
+    """
+    if storage_format(path) == 'csv':
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns, skiprows=range(1, skip_rows + 1))
+        return
+
+    _require_pyarrow(path)
+    parquet_file = pq.ParquetFile(path)
+    row_groups = []
+    for i in range(parquet_file.num_row_groups):
+        group_rows = parquet_file.metadata.row_group(i).num_rows
+        if not row_groups and skip_rows >= group_rows:
+            skip_rows -= group_rows
+        else:
+            row_groups.append(i)
+    if not row_groups:
+        return
+    for batch in parquet_file.iter_batches(batch_size=chunksize, row_groups=row_groups, columns=columns):
+        if skip_rows:
+            skipped = min(skip_rows, batch.num_rows)
+            batch = batch.slice(skipped)
+            skip_rows -= skipped
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+class DatasetWriter:
+    """
+    Writes a dataset chunk by chunk, as CSV or Parquet depending on the
+    extension of the path.
+
+    CSV chunks are appended with the same quoting as DataFrame.to_csv.
+    Parquet chunks each become a row group of one file; the schema is
+    fixed by the first chunk, with text columns stored as strings and
+    DICTIONARY_COLUMNS dictionary-encoded.
+
+    Args:
+        path (str): The output file. It is replaced, not appended to.
+        columns (list): Header written if no chunk is written at all.
+    """
+
+    def __init__(self, path, columns=None):
+        self.path = path
+        self.format = storage_format(path)
+        self.columns = columns
+        self.rows = 0
+        self._header = True
+        self._schema = None
+        self._parquet_writer = None
+        if self.format == 'parquet':
+            _require_pyarrow(path)
+
+    def _arrow_schema(self, df):
+        fields = []
+        for column in df.columns:
+            series = df[column]
+            if column in DICTIONARY_COLUMNS:
+                field_type = pa.dictionary(pa.int32(), pa.string())
+            elif series.notna().any() and (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)):
+                field_type = pa.array(series, from_pandas=True).type
+            else:
+                field_type = pa.string()
+            fields.append(pa.field(str(column), field_type))
+        return pa.schema(fields)
+
+    def _to_arrow(self, df):
+        df = df.reset_index(drop=True).reindex(columns=self._schema.names)
+        columns = {}
+        for field in self._schema:
+            series = df[field.name]
+            if pa.types.is_string(field.type) or pa.types.is_dictionary(field.type):
+                if pd.api.types.is_string_dtype(series) and series.dtype != object:
+                    array = pa.array(series, type=pa.string(), from_pandas=True)
+                else:
+                    # Object columns of CSV chunks can mix numbers into text
+                    array = pa.array([None if pd.isna(value) else str(value) for value in series], type=pa.string())
+                if pa.types.is_dictionary(field.type):
+                    array = array.dictionary_encode().cast(field.type)
+            else:
+                array = pa.array(series, type=field.type, from_pandas=True)
+            columns[field.name] = array
+        return pa.Table.from_pydict(columns, schema=self._schema)
+
+    def write(self, df):
+        """Append the rows of a DataFrame"""
+        if self.format == 'csv':
+            df.to_csv(self.path, mode='w' if self._header else 'a', header=self._header, index=False)
+        else:
+            if self._schema is None:
+                self._schema = self._arrow_schema(df)
+                self._parquet_writer = pq.ParquetWriter(self.path, self._schema, compression='zstd')
+            self._parquet_writer.write_table(self._to_arrow(df))
+        self._header = False
+        self.rows += len(df)
+
+    def close(self):
+        if self._header and self.columns is not None:
+            self.write(pd.DataFrame(columns=self.columns))
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def write_dataset(df, path):
+    """Writes a whole DataFrame as CSV or Parquet, depending on the extension of path"""
+    with DatasetWriter(path, columns=df.columns.tolist()) as writer:
+        writer.write(df)
+
+def convert_dataset(input_path, output_path, chunksize=50000):
+    """
+    Converts a dataset between CSV and Parquet chunk by chunk, e.g. to
+    export a Parquet intermediate as CSV.
+
+    Returns:
+        int: Number of rows written.
+    """
+    with DatasetWriter(output_path, columns=read_columns(input_path)) as writer:
+        for chunk in iter_dataset_chunks(input_path, chunksize=chunksize):
+            writer.write(chunk)
+    return writer.rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a dataset between CSV and Parquet (by file extension)")
+    parser.add_argument("input", help="CSV or Parquet file to read")
+    parser.add_argument("output", help="CSV or Parquet file to write")
+    parser.add_argument("--chunksize", type=int, default=50000)
+    args = parser.parse_args()
+
+    rows = convert_dataset(args.input, args.output, chunksize=args.chunksize)
+    print(f"✅ {rows} rows written to '{args.output}' "
+          f"({os.path.getsize(args.input) / 1e6:.1f} MB -> {os.path.getsize(args.output) / 1e6:.1f} MB)")
@@ -0,0 +1,267 @@
+import asyncio
+import json
+import time
+from html.parser import HTMLParser
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+import metrics
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+class FetchBackend:
+    """
+    Interface of the card sources behind webscrap.scrape_rapidapi_search_page.
+
+    A backend turns a search URL into batches of card records. The scraper
+    takes care of deduplication, output files and resuming, so a backend
+    only has to yield cards in page order.
+    """
+
+    name = None
+
+    def iter_card_batches(self, search_url):
+        """
+        Yield lists of card records for a search URL, in page order.
+
+        Each record is a dict with 'name', 'category' and 'description', or
+        None for a card without a name. The caller may stop iterating early.
+        """
+        raise NotImplementedError
+
+    def report(self):
+        """Print backend-specific statistics about the last crawl"""
+
+    def close(self):
+        """Release any resources held by the backend"""
+
+# Card fields: (field, class substring, whether the element needs a title attribute)
+CARD_FIELDS = (
+    ('category', 'max-w-[100px]', False),
+    ('name', 'text-card-primary', True),
+    ('description', 'text-card-secondary', True)
+)
+
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr'
+}
+
+class CardHTMLParser(HTMLParser):
+    """
+    Parses API cards out of a search result page.
+
+    Uses the same selectors and title/text fallbacks as
+    webscrap.extract_data_from_card, so both backends produce the same
+    records from the same markup.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []
+        self._card = None
+        self._card_depth = 0
+        self._found = set()
+        self._field = None
+        self._field_depth = 0
+        self._title = ''
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        attrs = dict(attrs)
+        classes = attrs.get('class') or ''
+
+        if self._card is None:
+            if 'group/card' in classes:
+                self._card = {'name': None, 'category': None, 'description': None}
+                self._card_depth = 1
+                self._found = set()
+            return
+
+        self._card_depth += 1
+        if self._field is not None:
+            self._field_depth += 1
+            return
+
+        for field, marker, needs_title in CARD_FIELDS:
+            if field not in self._found and marker in classes and (not needs_title or 'title' in attrs):
+                self._found.add(field)
+                self._field = field
+                self._field_depth = 1
+                self._title = (attrs.get('title') or '').strip() if needs_title else ''
+                self._text = []
+                break
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS or self._card is None:
+            return
+
+        if self._field is not None:
+            self._field_depth -= 1
+            if self._field_depth == 0:
+                self._card[self._field] = self._title or ''.join(self._text).strip()
+                self._field = None
+
+        self._card_depth -= 1
+        if self._card_depth == 0:
+            self.cards.append(self._card if self._card['name'] else None)
+            self._card = None
+
+    def handle_data(self, data):
+        if self._field is not None:
+            self._text.append(data)
+
+def parse_cards_html(page):
+    """Parse the API cards of an HTML search page"""
+    parser = CardHTMLParser()
+    parser.feed(page)
+    parser.close()
+    return parser.cards
+
+def parse_cards_json(payload):
+    """
+    Parse API cards from a JSON search response.
+
+    Accepts either a list of API objects or an object holding that list
+    under 'apis', 'results', 'items', 'cards' or 'data'.
+    """
+    if isinstance(payload, dict):
+        for key in ('apis', 'results', 'items', 'cards', 'data'):
+            if isinstance(payload.get(key), (list, dict)):
+                return parse_cards_json(payload[key])
+        return []
+
+    cards = []
+    for item in payload or []:
+        if not isinstance(item, dict):
+            continue
+        category = item.get('category')
+        if isinstance(category, dict):
+            category = category.get('name')
+        name = (item.get('name') or item.get('title') or '').strip()
+        cards.append({
+            'name': name,
+            'category': (category or '').strip() or None,
+            'description': (item.get('description') or '').strip() or None
+        } if name else None)
+    return cards
+
+def get_page_url(search_url, page, page_param="page"):
+    """Return search_url with the page query parameter set"""
+    parts = urlsplit(search_url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != page_param]
+    query.append((page_param, str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+class HttpBackend(FetchBackend):
+    """
+    Fetches search result pages over plain HTTP, without a browser.
+
+    Pages are requested concurrently, `concurrency` at a time, over one
+    pooled aiohttp session, and parsed as HTML cards or JSON depending on
+    the response content type. Crawling stops at the first page that is
+    missing, empty, or has no card that an earlier page did not already
+    return.
+
+    Args:
+        concurrency (int): Number of pages requested at the same time.
+        max_pages (int): Upper bound on the number of pages per search.
+        page_param (str): Name of the pagination query parameter.
+        timeout (float): Per-request timeout in seconds.
+        retries (int): Retries for failed requests and 429/5xx responses.
+        headers (dict): Extra request headers.
+    """
+
+    name = "http"
+
+    def __init__(self, concurrency=8, max_pages=1000, page_param="page", timeout=30, retries=2, headers=None):
+        if aiohttp is None:
+            raise ImportError("The HTTP backend needs aiohttp: pip install aiohttp")
+        self.concurrency = concurrency
+        self.max_pages = max_pages
+        self.page_param = page_param
+        self.timeout = timeout
+        self.retries = retries
+        self.headers = {'User-Agent': USER_AGENT, 'Accept': 'text/html,application/json'}
+        self.headers.update(headers or {})
+        self.pages_fetched = 0
+        self.bytes_fetched = 0
+        self._loop = asyncio.new_event_loop()
+        self._session = None
+
+    async def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.concurrency)
+            )
+        return self._session
+
+    async def _fetch_page(self, url):
+        """Fetch and parse one page; returns None if the page does not exist"""
+        session = await self._get_session()
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                async with session.get(url) as response:
+                    if response.status == 404:
+                        return None
+                    if response.status == 429 or response.status >= 500:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info, response.history, status=response.status
+                        )
+                    response.raise_for_status()
+                    body = await response.read()
+                    self.pages_fetched += 1
+                    self.bytes_fetched += len(body)
+                    metrics.observe('scrape.page_latency', time.perf_counter() - start)
+                    metrics.count('scrape.pages')
+                    metrics.count('scrape.bytes', len(body))
+                    if 'json' in response.content_type:
+                        return parse_cards_json(json.loads(body))
+                    return parse_cards_html(body.decode(response.charset or 'utf-8', errors='replace'))
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
+    async def _fetch_pages(self, urls):
+        return await asyncio.gather(*(self._fetch_page(url) for url in urls))
+
+    def iter_card_batches(self, search_url):
+        print(f"🌐 Fetching search pages over HTTP: {search_url}")
+        seen_names = set()
+        page = 1
+        while page <= self.max_pages:
+            last_page = min(page + self.concurrency - 1, self.max_pages)
+            urls = [get_page_url(search_url, p, self.page_param) for p in range(page, last_page + 1)]
+            results = self._loop.run_until_complete(self._fetch_pages(urls))
+
+            for cards in results:
+                names = {card['name'] for card in cards or [] if card}
+                if not names or names <= seen_names:
+                    return
+                seen_names |= names
+                yield cards
+            page = last_page + 1
+
+    def report(self):
+        print(f"   🌐 Pages fetched: {self.pages_fetched} ({self.bytes_fetched / 1024:.0f} KB)")
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+        if self._session is not None:
+            self._loop.run_until_complete(self._session.close())
+            self._session = None
+        self._loop.close()
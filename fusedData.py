@@ -1,8 +1,13 @@
 import pandas as pd
 import os
 import glob
+import hashlib
+import json
+import sqlite3
+from dataset_storage import storage_format, write_dataset
+import metrics
 
-def combine_api_csv_files(path=".", prefix="rapidapi_apis", output_filename="rapidapi_fused_dataset.csv"):
+def combine_api_csv_files(path=".", prefix="rapidapi_apis", output_filename="rapidapi_fused_dataset.csv", incremental=False):
     """
     Combines all CSV files in a given path that start with a specific prefix
     into a single CSV file, removing duplicates.
@@ -10,11 +15,18 @@ def combine_api_csv_files(path=".", prefix="rapidapi_apis", output_filename="rap
     Args:
         path (str): The directory to search for CSV files.
         prefix (str): The prefix of the CSV files to combine.
-        output_filename (str): The name of the output combined CSV file.
+        output_filename (str): The name of the output combined file, saved
+            as Parquet if it ends with .parquet and as CSV otherwise.
+        incremental (bool): Only merge new or changed files into the existing
+            output, see combine_api_csv_files_incremental.
     """
-    # Use glob to find all files matching the pattern
+    if incremental:
+        return combine_api_csv_files_incremental(path=path, prefix=prefix, output_filename=output_filename)
+
+    # Use glob to find all files matching the pattern, sorted like the
+    # incremental merge so both keep the same row of a duplicated name
     search_pattern = os.path.join(path, f"{prefix}*.csv")
-    csv_files = glob.glob(search_pattern)
+    csv_files = sorted(glob.glob(search_pattern))
 
     if not csv_files:
         print(f"No CSV files with prefix '{prefix}' found in '{path}'.")
@@ -40,16 +52,174 @@ def combine_api_csv_files(path=".", prefix="rapidapi_apis", output_filename="rap
 
     # Concatenate all dataframes in the list
     combined_df = pd.concat(df_list, ignore_index=True)
+    metrics.count('fuse.files', len(df_list))
+    metrics.count('fuse.rows', len(combined_df))
     print(f"\nTotal rows before deduplication: {len(combined_df)}")
 
     # Drop duplicate APIs based on the 'name' column
     combined_df.drop_duplicates(subset=['name'], keep='first', inplace=True)
     print(f"Total unique rows after deduplication: {len(combined_df)}")
 
-    # Save the final dataframe to a new CSV file
-    combined_df.to_csv(output_filename, index=False)
+    # Save the final dataframe to a new CSV or Parquet file
+    write_dataset(combined_df, output_filename)
     print(f"\n✅ Successfully merged all files into '{output_filename}'")
 
+def file_sha256(filename, block_size=1 << 20):
+    """SHA-256 of a file, read in blocks"""
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class NameIndex:
+    """Persistent set of the API names already written to the fused output, stored in SQLite"""
+
+    def __init__(self, filename):
+        self._conn = sqlite3.connect(filename)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS names (name TEXT PRIMARY KEY)")
+
+    def add_new(self, names):
+        """Add names to the index and return the ones that were not in it yet"""
+        existing = set()
+        for start in range(0, len(names), 900):
+            batch = names[start:start + 900]
+            placeholders = ",".join("?" * len(batch))
+            existing.update(row[0] for row in self._conn.execute(
+                f"SELECT name FROM names WHERE name IN ({placeholders})", batch
+            ))
+        new_names = [name for name in names if name not in existing]
+        self._conn.executemany("INSERT INTO names (name) VALUES (?)", [(name,) for name in new_names])
+        return set(new_names)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        """Close the index, dropping names added since the last commit"""
+        self._conn.close()
+
+def combine_api_csv_files_incremental(path=".", prefix="rapidapi_apis", output_filename="rapidapi_fused_dataset.csv", chunksize=5000):
+    """
+    Merges only new or changed category files into the fused CSV.
+
+    A manifest next to the output records the size, mtime and SHA-256 of
+    every merged file, and a SQLite index holds every name already in the
+    output. Unchanged files are skipped without being read. New or changed
+    files are streamed in chunks, and only rows whose name is not in the
+    index are appended, so memory use does not depend on the size of the
+    dataset. Rows that disappear from a changed file stay in the output;
+    run combine_api_csv_files to rebuild it from scratch.
+
+    Each file is merged all or nothing: the index and the manifest, with
+    the size of the output, are only saved once its rows are appended. If
+    a file fails, the output is truncated back and the index rolled back;
+    after a crash, rows beyond the size in the manifest are cut off on the
+    next run.
+
+    Args:
+        path (str): The directory to search for CSV files.
+        prefix (str): The prefix of the CSV files to combine.
+        output_filename (str): The name of the output combined CSV file.
+        chunksize (int): Rows read at a time from each input file.
+    """
+    if storage_format(output_filename) != 'csv':
+        # Appending needs a row-oriented file; convert the CSV afterwards with dataset_storage
+        print(f"❌ Error: incremental merges can only append to a CSV file, not '{output_filename}'.")
+        return
+
+    manifest_file = f"{output_filename}.manifest.json"
+    index_file = f"{output_filename}.names.sqlite"
+
+    csv_files = sorted(glob.glob(os.path.join(path, f"{prefix}*.csv")))
+    if not csv_files:
+        print(f"No CSV files with prefix '{prefix}' found in '{path}'.")
+        return
+
+    # Without all three pieces the output cannot be trusted, start over
+    if not (os.path.exists(output_filename) and os.path.exists(manifest_file) and os.path.exists(index_file)):
+        print("No previous incremental merge found, building the fused dataset from scratch.")
+        for stale in (output_filename, manifest_file, index_file):
+            if os.path.exists(stale):
+                os.remove(stale)
+        manifest = {'files': {}, 'output_bytes': 0}
+    else:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    def save_manifest():
+        tmp_file = manifest_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_file, manifest_file)
+
+    # Drop rows a crashed run appended after the last saved manifest
+    if os.path.exists(output_filename) and os.path.getsize(output_filename) > manifest.get('output_bytes', float('inf')):
+        with open(output_filename, 'ab') as f:
+            f.truncate(manifest['output_bytes'])
+
+    columns = None
+    if os.path.exists(output_filename) and os.path.getsize(output_filename):
+        columns = pd.read_csv(output_filename, nrows=0).columns.tolist()
+
+    index = NameIndex(index_file)
+    files_merged = 0
+    rows_appended = 0
+    try:
+        for file in csv_files:
+            key = os.path.basename(file)
+            stat = os.stat(file)
+            entry = manifest['files'].get(key)
+            if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+                continue
+            sha256 = file_sha256(file)
+            if entry and entry['sha256'] == sha256:
+                entry['mtime'] = stat.st_mtime
+                continue
+
+            file_rows = 0
+            output_bytes = os.path.getsize(output_filename) if os.path.exists(output_filename) else 0
+            try:
+                for chunk in pd.read_csv(file, chunksize=chunksize):
+                    if columns is None:
+                        columns = chunk.columns.tolist()
+                    chunk = chunk.reindex(columns=columns)
+                    names = chunk['name'].fillna('').astype(str)
+                    chunk = chunk[~names.duplicated()]
+                    names = names[chunk.index]
+                    new_names = index.add_new(names.tolist())
+                    new_rows = chunk[names.isin(new_names)]
+                    if len(new_rows):
+                        new_rows.to_csv(output_filename, mode='a', index=False,
+                                        header=not os.path.exists(output_filename) or os.path.getsize(output_filename) == 0)
+                        file_rows += len(new_rows)
+            except Exception as e:
+                print(f"Could not read {file}. Error: {e}")
+                index.rollback()
+                if os.path.exists(output_filename):
+                    with open(output_filename, 'ab') as f:
+                        f.truncate(output_bytes)
+                continue
+
+            index.commit()
+            manifest['files'][key] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': sha256}
+            manifest['output_bytes'] = os.path.getsize(output_filename) if os.path.exists(output_filename) else 0
+            save_manifest()
+            files_merged += 1
+            rows_appended += file_rows
+            print(f"  - {key}: {file_rows} new unique rows")
+    finally:
+        index.close()
+        save_manifest()
+
+    metrics.count('fuse.files', files_merged)
+    metrics.count('fuse.rows', rows_appended)
+    print(f"\nMerged {files_merged} new or changed files out of {len(csv_files)}.")
+    print(f"✅ Appended {rows_appended} new unique rows to '{output_filename}'")
+
 if __name__ == "__main__":
     # Run the function on the current directory
     current_directory = os.path.dirname(__file__)
@@ -0,0 +1,309 @@
+import argparse
+import cProfile
+import json
+import os
+import random
+import resource
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Counters that should go down, not up, between runs
+ERROR_COUNTERS = ('.retries', '.failed', '.scroll_timeouts')
+
+def _proc_status_mb(field):
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def peak_rss_mb(include_children=False):
+    """
+    Peak RSS of this process, or with include_children the largest peak of
+    this process and of its finished child processes. ru_maxrss survives
+    exec on Linux, so VmHWM is read first.
+    """
+    peak = _proc_status_mb('VmHWM')
+    if peak is None:
+        # ru_maxrss is in kilobytes on Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    if include_children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024)
+    return peak
+
+def rss_mb():
+    """Current RSS of this process, or None where /proc is not available"""
+    return _proc_status_mb('VmRSS')
+
+class Histogram:
+    """
+    Count, sum, min and max of observed values, with percentiles estimated
+    from a fixed-size uniform sample, so memory does not grow with the
+    number of observations.
+    """
+
+    def __init__(self, sample_size=1024):
+        self.sample_size = sample_size
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.sample = []
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if len(self.sample) < self.sample_size:
+            self.sample.append(value)
+        else:
+            # Reservoir sampling keeps every value with the same probability
+            i = random.randrange(self.count)
+            if i < self.sample_size:
+                self.sample[i] = value
+
+    def summary(self):
+        if not self.count:
+            return {'count': 0}
+        ordered = sorted(self.sample)
+        def percentile(p):
+            return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+        return {'count': self.count, 'sum': self.total, 'mean': self.total / self.count, 'min': self.min,
+                'p50': percentile(0.5), 'p95': percentile(0.95), 'p99': percentile(0.99), 'max': self.max}
+
+class Metrics:
+    """
+    Thread-safe counters, gauges, histograms and per-stage timings of a run.
+
+    Stages and the functions they call record into the shared METRICS
+    registry through the module-level count, observe, gauge and timer
+    functions; names are dotted and start with the stage they belong to,
+    e.g. 'translate.calls' or 'scrape.scroll_latency'. Recording is cheap,
+    so it is always on; only profiling is opt-in.
+
+    Args:
+        profile_dir (str): Directory for a cProfile dump of every stage, or
+            None to not profile. Only the thread running the stage is
+            profiled, not the worker threads it starts.
+        trace_memory (bool): Record the peak of Python allocations of every
+            stage with tracemalloc. The tracing is process-wide and slows
+            allocation-heavy code down noticeably.
+    """
+
+    def __init__(self, profile_dir=None, trace_memory=False):
+        self.profile_dir = profile_dir
+        self.trace_memory = trace_memory
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self._start = time.perf_counter()
+            self.counters = {}
+            self.gauges = {}
+            self.histograms = {}
+            self.stages = {}
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name, value):
+        with self._lock:
+            self.gauges[name] = value
+
+    def observe(self, name, value):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(value)
+
+    @contextmanager
+    def timer(self, name):
+        """Observe the seconds spent in the with block into histogram name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a pipeline stage and record its memory, and profile it if enabled.
+
+        Memory is the RSS at the start and end of the stage and their
+        difference, rss_delta_mb, plus process_peak_rss_mb: the high-water
+        mark of the whole process when the stage ended, which includes
+        earlier stages and any stage running at the same time. A stage that
+        raises is still recorded, with status 'failed'.
+        """
+        record = {'status': 'ran', 'rss_start_mb': rss_mb()}
+        profiler = None
+        if self.profile_dir:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            profiler = cProfile.Profile()
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            yield record
+        except BaseException:
+            record['status'] = 'failed'
+            raise
+        finally:
+            if profiler:
+                profiler.disable()
+            record['seconds'] = time.perf_counter() - start
+            record['rss_end_mb'] = rss_mb()
+            if record['rss_start_mb'] is not None and record['rss_end_mb'] is not None:
+                record['rss_delta_mb'] = record['rss_end_mb'] - record['rss_start_mb']
+            record['process_peak_rss_mb'] = peak_rss_mb()
+            if self.trace_memory:
+                record['traced_peak_mb'] = tracemalloc.get_traced_memory()[1] / 1e6
+            if profiler:
+                record['profile'] = os.path.join(self.profile_dir, f"{name}.prof")
+                profiler.dump_stats(record['profile'])
+            with self._lock:
+                self.stages[name] = record
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: Everything recorded so far, with histogram summaries and
+            derived 'rates': '<counter>_per_second' for every counter of a
+            timed stage other than cache counters, over that stage's
+            seconds, and '<prefix>.cache_hit_rate' for every
+            <prefix>.cache_hits / <prefix>.cache_misses pair.
+        """
+        with self._lock:
+            counters = dict(self.counters)
+            stages = {name: dict(record) for name, record in self.stages.items()}
+            histograms = {name: histogram.summary() for name, histogram in self.histograms.items()}
+            gauges = dict(self.gauges)
+
+        rates = {}
+        for name, value in counters.items():
+            stage = stages.get(name.split('.', 1)[0])
+            if stage and stage['seconds'] > 0 and not name.endswith(('.cache_hits', '.cache_misses')):
+                rates[f"{name}_per_second"] = value / stage['seconds']
+            if name.endswith('.cache_hits'):
+                prefix = name[:-len('.cache_hits')]
+                lookups = value + counters.get(prefix + '.cache_misses', 0)
+                rates[prefix + '.cache_hit_rate'] = value / lookups if lookups else 0.0
+
+        return {
+            'started_at': self.started_at,
+            'seconds': time.perf_counter() - self._start,
+            'host': socket.gethostname(),
+            'pid': os.getpid(),
+            'argv': sys.argv,
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': stages,
+            'counters': counters,
+            'rates': rates,
+            'gauges': gauges,
+            'histograms': histograms,
+        }
+
+    def write(self, path, **extra):
+        """Write the snapshot, plus any extra fields, as JSON. Returns the snapshot."""
+        snapshot = self.snapshot()
+        snapshot.update(extra)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, indent=2, default=str)
+        os.replace(path + ".tmp", path)
+        return snapshot
+
+METRICS = Metrics()
+
+def count(name, n=1):
+    METRICS.count(name, n)
+
+def gauge(name, value):
+    METRICS.gauge(name, value)
+
+def observe(name, value):
+    METRICS.observe(name, value)
+
+def timer(name):
+    return METRICS.timer(name)
+
+def run_metrics_file(metrics_dir="metrics"):
+    """Path of a new per-run metrics file, named after the current time"""
+    return os.path.join(metrics_dir, time.strftime("run_%Y%m%d_%H%M%S") + f"_{os.getpid()}.json")
+
+def compare_runs(baseline, current, threshold=0.2, min_seconds=1.0):
+    """
+    Compare the stage timings and rates of two metrics snapshots.
+
+    A stage that got more than threshold slower, a rate that dropped by
+    more than threshold, or a rate of retries or failures that grew by more
+    than threshold is a regression. Cache hit rates depend on what was
+    cached before the run and are shown but never count, and neither do
+    stages that took less than min_seconds in the baseline, whose timings
+    are mostly noise. Stages that did not run in both runs are not compared.
+
+    Returns:
+        list: (name, baseline value, current value, change, regressed) rows.
+    """
+    compared = {}
+    for name, stage in current.get('stages', {}).items():
+        previous = baseline.get('stages', {}).get(name)
+        if previous and previous.get('status') == 'ran' and stage.get('status') == 'ran' and previous['seconds']:
+            compared[name] = previous['seconds'] >= min_seconds
+
+    rows = []
+    for name, significant in compared.items():
+        before, after = baseline['stages'][name]['seconds'], current['stages'][name]['seconds']
+        change = after / before - 1
+        rows.append((f"{name}.seconds", before, after, change, significant and change > threshold))
+    for name, value in current.get('rates', {}).items():
+        previous = baseline.get('rates', {}).get(name)
+        stage = name.split('.', 1)[0]
+        if not previous or stage not in compared:
+            continue
+        change = value / previous - 1
+        if not compared[stage] or name.endswith('cache_hit_rate'):
+            regressed = False
+        elif name[:-len('_per_second')].endswith(ERROR_COUNTERS):
+            regressed = change > threshold
+        else:
+            regressed = change < -threshold
+        rows.append((name, previous, value, change, regressed))
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the metrics files of two pipeline runs")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative change counted as a regression")
+    parser.add_argument("--min-seconds", type=float, default=1.0, help="Ignore stages faster than this in the baseline")
+    args = parser.parse_args()
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+    rows = compare_runs(baseline, current, threshold=args.threshold, min_seconds=args.min_seconds)
+    for name, before, after, change, regressed in rows:
+        print(f"{'❌' if regressed else '  '} {name:45s} {before:12.3f} -> {after:12.3f}  ({change:+.1%})")
+    print(f"\nPeak RSS: {baseline['peak_rss_mb']:.1f} MB -> {current['peak_rss_mb']:.1f} MB")
+    raise SystemExit(1 if any(row[4] for row in rows) else 0)
@@ -0,0 +1,232 @@
+import os
+import re
+import time
+import zlib
+
+import numpy as np
+
+import metrics
+from dataset_storage import read_dataset
+
+# Prime just above 2**32, so (a * x + b) fits in uint64 for 32-bit a, b and x
+MINHASH_PRIME = np.uint64(4294967311)
+HASH_MASK = np.uint64(0xFFFFFFFF)
+
+def normalize_text(text):
+    """Lowercase and collapse whitespace and punctuation so trivial edits do not matter"""
+    return re.sub(r"[\W_]+", " ", text.lower()).strip()
+
+def shingle_hashes(text, shingle_size=5):
+    """Return the unique 32-bit hashes of the character shingles of a text"""
+    text = normalize_text(text)
+    if len(text) <= shingle_size:
+        grams = [text]
+    else:
+        grams = [text[i:i + shingle_size] for i in range(len(text) - shingle_size + 1)]
+    return np.unique(np.fromiter((zlib.crc32(gram.encode('utf-8')) for gram in grams), dtype=np.uint64, count=len(grams)))
+
+def token_shingle_hashes(token_ids, shingle_size=2):
+    """Return the unique 32-bit hashes of the n-grams of a row of corpus token ids"""
+    ids = np.asarray(token_ids, dtype=np.uint64)
+    width = min(shingle_size, len(ids))
+    hashes = np.zeros(len(ids) - width + 1, dtype=np.uint64)
+    for offset in range(width):
+        hashes = (hashes * np.uint64(1000003) + ids[offset:len(ids) - width + 1 + offset]) & HASH_MASK
+    return np.unique(hashes)
+
+def minhash_signatures(texts, num_perm=128, shingle_size=5, seed=1, chunk_shingles=200000, perm_block=32):
+    """
+    Computes MinHash signatures for a list of texts, over their character shingles.
+
+    Returns:
+        np.ndarray: uint32 array of shape (len(texts), num_perm).
+    """
+    return shingle_minhash_signatures(len(texts), lambda i: shingle_hashes(texts[i], shingle_size), num_perm=num_perm,
+                                      seed=seed, chunk_shingles=chunk_shingles, perm_block=perm_block)
+
+def shingle_minhash_signatures(count, shingles_of, num_perm=128, seed=1, chunk_shingles=200000, perm_block=32):
+    """
+    Computes MinHash signatures from the shingle hashes of count rows.
+
+    Shingles of many rows are hashed together, one block of permutations
+    at a time, and reduced per row with np.minimum.reduceat, so the work is
+    vectorized and memory stays bounded by chunk_shingles * perm_block.
+
+    Args:
+        count (int): Number of rows.
+        shingles_of (callable): Returns the unique 32-bit shingle hashes of
+            row i, e.g. shingle_hashes or token_shingle_hashes.
+
+    Returns:
+        np.ndarray: uint32 array of shape (count, num_perm).
+    """
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, 2 ** 32 - 1, size=num_perm, dtype=np.uint64)
+    b = rng.randint(0, 2 ** 32 - 1, size=num_perm, dtype=np.uint64)
+    signatures = np.empty((count, num_perm), dtype=np.uint32)
+
+    start = 0
+    while start < count:
+        hashes = []
+        total = 0
+        end = start
+        while end < count and (total < chunk_shingles or end == start):
+            shingles = shingles_of(end)
+            hashes.append(shingles)
+            total += len(shingles)
+            end += 1
+        flat = np.concatenate(hashes)
+        offsets = np.cumsum([0] + [len(h) for h in hashes[:-1]])
+        for p in range(0, num_perm, perm_block):
+            block = (a[p:p + perm_block, None] * flat[None, :] + b[p:p + perm_block, None]) % MINHASH_PRIME
+            signatures[start:end, p:p + perm_block] = np.minimum.reduceat(block, offsets, axis=1).T
+        start = end
+    return signatures
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = np.arange(size)
+
+    def find(self, x):
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, x, y):
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x != root_y:
+            # Keep the smallest row as root, so cluster ids are stable
+            if root_x < root_y:
+                self.parent[root_y] = root_x
+            else:
+                self.parent[root_x] = root_y
+
+def lsh_clusters(signatures, bands=16, threshold=0.8):
+    """
+    Groups rows with similar MinHash signatures using LSH banding.
+
+    For every band, rows are sorted by the hash of their band and each run
+    of equal hashes is compared with its first row only, so the cost grows
+    with n log n rather than with the number of pairs in a bucket. Rows
+    whose signatures agree on at least `threshold` of their positions are
+    merged into one cluster.
+
+    Returns:
+        np.ndarray: Cluster id of every row, the smallest row index in its cluster.
+    """
+    num_rows, num_perm = signatures.shape
+    rows_per_band = num_perm // bands
+    union_find = _UnionFind(num_rows)
+
+    for band in range(bands):
+        columns = signatures[:, band * rows_per_band:(band + 1) * rows_per_band].astype(np.uint64)
+        band_hash = np.zeros(num_rows, dtype=np.uint64)
+        for column in columns.T:
+            band_hash = band_hash * np.uint64(1000003) + column
+        order = np.argsort(band_hash, kind='stable')
+        sorted_hash = band_hash[order]
+        run_start = np.concatenate(([True], sorted_hash[1:] != sorted_hash[:-1]))
+        heads = order[np.maximum.accumulate(np.where(run_start, np.arange(num_rows), 0))]
+        members = order
+        candidates = heads != members
+        heads, members = heads[candidates], members[candidates]
+        if not len(heads):
+            continue
+        similarity = (signatures[heads] == signatures[members]).mean(axis=1)
+        for head, member in zip(heads[similarity >= threshold], members[similarity >= threshold]):
+            union_find.union(head, member)
+
+    return np.array([union_find.find(i) for i in range(num_rows)])
+
+def find_near_duplicates(csv_file="rapidapi_fused_dataset_clean.csv", output_file="rapidapi_near_duplicates.csv",
+                         dedup_file="rapidapi_fused_dataset_dedup.csv", threshold=0.8, num_perm=128, bands=16, shingle_size=5,
+                         corpus_dir=None, token_shingle_size=2):
+    """
+    Finds APIs with near-identical descriptions using MinHash and LSH.
+
+    Writes the dataset with 'cluster_id' and 'cluster_size' columns to
+    output_file, and a copy that keeps only the first API of every cluster
+    to dedup_file. Rows without a description, or whose description is
+    only punctuation and whitespace, are their own cluster.
+
+    Descriptions are compared by their character shingles, or, when
+    corpus_dir holds a tokenized corpus of the same file (see
+    corpus_store), by the n-grams of their token ids, read from the corpus
+    instead of normalizing and shingling every text. Descriptions without
+    any token, e.g. in a non-Latin script, keep their character shingles.
+
+    The whole dataset is loaded at once, plus a uint32 signature of
+    num_perm values per description (512 bytes per row with the default
+    128), so memory grows with the dataset: about 1 GB for a million rows
+    of typical length. Larger datasets need more memory or fewer permutations.
+
+    Args:
+        csv_file (str): The dataset to deduplicate.
+        output_file (str): Where to save the dataset with cluster ids.
+        dedup_file (str): Where to save the deduplicated dataset.
+        threshold (float): Minimum estimated Jaccard similarity of two descriptions.
+        num_perm (int): Number of MinHash permutations.
+        bands (int): Number of LSH bands; num_perm must be divisible by it.
+        shingle_size (int): Length of the character shingles.
+        corpus_dir (str): Tokenized corpus of csv_file, or None.
+        token_shingle_size (int): Tokens per shingle when the corpus is used.
+    """
+    print(f"🔁 Looking for near-duplicate descriptions in '{csv_file}'...")
+    if not os.path.exists(csv_file):
+        print(f"❌ Error: Input file '{csv_file}' not found.")
+        return None
+
+    start = time.perf_counter()
+    df = read_dataset(csv_file)
+    descriptions = df['description']
+    # Descriptions that normalize to nothing, e.g. only punctuation, would all share one shingle
+    has_text = descriptions.notna() & descriptions.astype(str).str.contains(r"[^\W_]")
+    positions = np.flatnonzero(has_text.to_numpy())
+
+    texts = descriptions[has_text].astype(str).tolist()
+    corpus = None
+    if corpus_dir is not None:
+        from corpus_store import corpus_for
+        corpus = corpus_for(csv_file, corpus_dir)
+    if corpus is not None:
+        offsets = corpus.offsets['description']
+        tokens = corpus.tokens['description']
+
+        def shingles_of(i):
+            row = positions[i]
+            if offsets[row] == offsets[row + 1]:
+                return shingle_hashes(texts[i], shingle_size)
+            return token_shingle_hashes(tokens[offsets[row]:offsets[row + 1]], token_shingle_size)
+
+        signatures = shingle_minhash_signatures(len(texts), shingles_of, num_perm=num_perm)
+    else:
+        signatures = minhash_signatures(texts, num_perm=num_perm, shingle_size=shingle_size)
+    local_clusters = lsh_clusters(signatures, bands=bands, threshold=threshold)
+
+    cluster_ids = np.arange(len(df))
+    cluster_ids[positions] = positions[local_clusters]
+    df['cluster_id'] = cluster_ids
+    df['cluster_size'] = df.groupby('cluster_id')['cluster_id'].transform('size')
+
+    df.to_csv(output_file, index=False)
+    deduplicated = df[~df['cluster_id'].duplicated()].drop(columns=['cluster_id', 'cluster_size'])
+    deduplicated.to_csv(dedup_file, index=False)
+
+    clusters = df[df['cluster_size'] > 1]['cluster_id'].nunique()
+    metrics.count('dedup.rows', len(df))
+    metrics.count('dedup.rows_removed', len(df) - len(deduplicated))
+    print(f"   Rows: {len(df)} | clusters with near-duplicates: {clusters} | "
+          f"rows removed: {len(df) - len(deduplicated)} ({time.perf_counter() - start:.1f}s)")
+    print(f"✅ Cluster ids saved to '{output_file}', deduplicated dataset saved to '{dedup_file}'")
+    return df
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(__file__)
+    find_near_duplicates(
+        csv_file=os.path.join(script_dir, "rapidapi_fused_dataset_clean.csv"),
+        output_file=os.path.join(script_dir, "rapidapi_near_duplicates.csv"),
+        dedup_file=os.path.join(script_dir, "rapidapi_fused_dataset_dedup.csv")
+    )
@@ -0,0 +1,394 @@
+import argparse
+import fnmatch
+import glob
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from fusedData import file_sha256
+from metrics import METRICS, run_metrics_file
+
+STATE_FILE = ".pipeline_state.json"
+
+class Stage:
+    """
+    One step of the pipeline.
+
+    A stage calls func(**params) to turn its input files into its output
+    files. Inputs may be glob patterns. A stage depends on every stage that
+    produces one of its inputs, and is skipped when its fingerprint (its
+    parameters, the content of its inputs, the source of func and of the
+    modules that implement it) and its outputs are unchanged since it last
+    succeeded.
+
+    Args:
+        name (str): Unique stage name.
+        func (callable): Function that runs the stage.
+        inputs (list): Files or glob patterns the stage reads.
+        outputs (list): Files the stage writes.
+        params (dict): Keyword arguments of func.
+        always_run (bool): Run the stage even if it looks up to date.
+        code_modules (list): Names of the modules func calls into, whose
+            source is part of the fingerprint.
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), params=None, always_run=False, code_modules=()):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = params or {}
+        self.always_run = always_run
+        self.code_modules = list(code_modules)
+
+    def input_files(self):
+        return _existing_files(self.inputs)
+
+    def output_files(self):
+        return _existing_files(self.outputs)
+
+    def run(self):
+        return self.func(**self.params)
+
+def _existing_files(patterns):
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        files.extend(match for match in matches if os.path.exists(match))
+    return files
+
+class FileHashes:
+    """SHA-256 of files, recomputed only when a file's size or mtime changed"""
+
+    def __init__(self, known=None):
+        self.known = known or {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        stat = os.stat(path)
+        with self._lock:
+            entry = self.known.get(path)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return entry['sha256']
+        sha256 = file_sha256(path)
+        with self._lock:
+            self.known[path] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha256': sha256}
+        return sha256
+
+def _function_source_hash(func):
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        return None
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def _module_source_hash(module_name):
+    # find_spec locates the file without importing the module and its dependencies
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        return None
+    return file_sha256(spec.origin)
+
+def stage_fingerprint(stage, hashes):
+    """Hash of everything that decides a stage's outputs"""
+    description = {
+        'params': stage.params,
+        'inputs': {path: hashes.get(path) for path in stage.input_files()},
+        'code': _function_source_hash(stage.func),
+        'modules': {name: _module_source_hash(name) for name in stage.code_modules}
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def _matches(pattern, path):
+    return fnmatch.fnmatch(path, pattern) if glob.has_magic(pattern) else pattern == path
+
+def stage_dependencies(stages):
+    """{stage name: set of the names of the stages it depends on}"""
+    producers = {}
+    for stage in stages:
+        for output in stage.outputs:
+            producers[output] = stage.name
+    dependencies = {}
+    for stage in stages:
+        dependencies[stage.name] = {
+            producer for pattern in stage.inputs for output, producer in producers.items()
+            if producer != stage.name and _matches(pattern, output)
+        }
+    return dependencies
+
+def check_acyclic(dependencies):
+    """Raises ValueError naming the stages that depend on each other in a cycle"""
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps & remaining.keys()]
+        if not ready:
+            break
+        for name in ready:
+            del remaining[name]
+    # Peel off the stages that only depend on a cycle, so the error names the cycle itself
+    while True:
+        needed = set().union(*remaining.values()) & remaining.keys()
+        if needed == remaining.keys():
+            break
+        remaining = {name: deps for name, deps in remaining.items() if name in needed}
+    if remaining:
+        raise ValueError(f"Stages depend on each other in a cycle: {', '.join(sorted(remaining))}")
+
+def _with_upstream(targets, dependencies):
+    selected = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(dependencies[name])
+    return selected
+
+def _load_state(state_file):
+    if not os.path.exists(state_file):
+        return {'stages': {}, 'files': {}}
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable pipeline state {state_file}: {e}")
+        return {'stages': {}, 'files': {}}
+
+def _save_state(state_file, state):
+    tmp_file = state_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_file, state_file)
+
+def run_pipeline(stages, targets=None, force=False, max_workers=4, state_file=STATE_FILE, metrics_file=None):
+    """
+    Runs the stages that are out of date, in dependency order.
+
+    A stage starts as soon as all the stages it depends on are done, so
+    independent stages run concurrently on a pool of max_workers threads.
+    Before a stage runs, its fingerprint is compared with the one saved in
+    state_file when it last succeeded; if it matches and every output still
+    has the content it had then, the stage is skipped. Since inputs are
+    fingerprinted by content, a stage whose upstream re-ran but produced
+    the same files is skipped too. If a stage fails, the stages that
+    depend on it are not run.
+
+    Args:
+        stages (list): The Stage objects of the pipeline.
+        targets (list): Names of the stages to bring up to date, with their
+            upstream stages, or None for all of them.
+        force (bool): Run the selected stages even if they are up to date.
+        max_workers (int): Maximum number of stages running at once.
+        state_file (str): JSON file with the fingerprints of the last runs.
+        metrics_file (str): JSON file to write the run's metrics.METRICS
+            to, with the stage results, or None.
+
+    Returns:
+        dict: {stage name: {'status': 'ran'|'skipped'|'failed'|'blocked', 'seconds': float}}
+    """
+    by_name = {stage.name: stage for stage in stages}
+    dependencies = stage_dependencies(stages)
+    check_acyclic(dependencies)
+    unknown = set(targets or ()) - set(by_name)
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(sorted(unknown))}")
+    selected = _with_upstream(targets or by_name, dependencies)
+
+    state = _load_state(state_file)
+    hashes = FileHashes(state.get('files'))
+    state_lock = threading.Lock()
+    results = {}
+
+    def is_up_to_date(stage, fingerprint):
+        previous = state['stages'].get(stage.name)
+        if force or stage.always_run or not previous or previous['fingerprint'] != fingerprint:
+            return False
+        outputs = stage.output_files()
+        if not outputs or any(output not in previous['outputs'] for output in stage.outputs if not glob.has_magic(output)):
+            return False
+        return all(hashes.get(output) == previous['outputs'].get(output) for output in outputs)
+
+    def execute(stage):
+        start = time.perf_counter()
+        fingerprint = stage_fingerprint(stage, hashes)
+        if is_up_to_date(stage, fingerprint):
+            return 'skipped', time.perf_counter() - start
+
+        print(f"\n▶️  Running stage '{stage.name}'...")
+        before = {output: os.stat(output).st_mtime_ns for output in stage.output_files()}
+        try:
+            with METRICS.stage(stage.name):
+                stage.run()
+        except Exception as e:
+            print(f"❌ Stage '{stage.name}' failed: {e}")
+            return 'failed', time.perf_counter() - start
+        seconds = time.perf_counter() - start
+
+        # The stage functions print their errors instead of raising, so a stale or missing output means failure
+        stale = [output for output in stage.outputs if not glob.has_magic(output)
+                 and (not os.path.exists(output) or os.stat(output).st_mtime_ns == before.get(output))]
+        if stale or not stage.output_files():
+            print(f"❌ Stage '{stage.name}' did not write {', '.join(stale) or ', '.join(stage.outputs)}")
+            return 'failed', seconds
+
+        # Fingerprint again: inputs written while the stage ran must not be marked as done
+        with state_lock:
+            state['stages'][stage.name] = {
+                'fingerprint': stage_fingerprint(stage, hashes) if stage.inputs else fingerprint,
+                'outputs': {output: hashes.get(output) for output in stage.output_files()},
+                'seconds': round(seconds, 3),
+                'finished_at': time.time()
+            }
+            state['files'] = hashes.known
+            _save_state(state_file, state)
+        return 'ran', seconds
+
+    pending = [name for name in by_name if name in selected]
+    running = {}
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            for name in list(pending):
+                blockers = dependencies[name] & selected
+                if any(results.get(dep, {}).get('status') in ('failed', 'blocked') for dep in blockers):
+                    results[name] = {'status': 'blocked', 'seconds': 0.0}
+                    pending.remove(name)
+                elif all(dep in results for dep in blockers):
+                    running[executor.submit(execute, by_name[name])] = name
+                    pending.remove(name)
+            if not running:
+                if pending:
+                    raise ValueError(f"Stages can never start: {', '.join(pending)}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                status, seconds = future.result()
+                results[running.pop(future)] = {'status': status, 'seconds': seconds}
+
+    print(f"\n⏱️  Pipeline finished in {time.perf_counter() - start:.1f}s")
+    for name in by_name:
+        if name in results:
+            print(f"   {name:10s} {results[name]['status']:8s} {results[name]['seconds']:8.2f}s")
+    if metrics_file:
+        # Every stage gets the pipeline's status, so runs are only compared on stages that ran in both
+        for name, result in results.items():
+            METRICS.stages.setdefault(name, {'seconds': result['seconds']})['status'] = result['status']
+        METRICS.write(metrics_file, results=results)
+        print(f"📈 Metrics saved to '{metrics_file}'")
+    return results
+
+def _scrape(categories, profile, num_drivers, backend):
+    from webscrap import scrape_categories
+    scrape_categories(categories, scroll_delay=1, num_drivers=num_drivers, resume=True, profile=profile, backend=backend)
+
+def _fuse(output_filename):
+    from fusedData import combine_api_csv_files
+    combine_api_csv_files(path=".", output_filename=output_filename)
+
+def _translate(input_file, output_file, rate_limit):
+    from data_translator import process_and_translate_dataset
+    counts = process_and_translate_dataset(input_file=input_file, output_file=output_file, rate_limit=rate_limit)
+    # Untranslated rows would otherwise be marked done and never retried
+    if counts and counts['failed']:
+        raise RuntimeError(f"{counts['failed']} descriptions could not be translated")
+
+def _clean(input_file, output_file):
+    from clean_data import clean_descriptions
+    clean_descriptions(input_file=input_file, output_file=output_file)
+
+def _stats(csv_file, output_file, json_file, corpus_dir):
+    from statisticalAnalysis import analyze_fused_dataset
+    analyze_fused_dataset(csv_file=csv_file, output_file=output_file, json_file=json_file, corpus_dir=corpus_dir)
+
+def _dedup(csv_file, output_file, dedup_file, corpus_dir):
+    from near_duplicates import find_near_duplicates
+    find_near_duplicates(csv_file=csv_file, output_file=output_file, dedup_file=dedup_file, corpus_dir=corpus_dir)
+
+def _corpus(csv_file, corpus_dir):
+    from corpus_store import update_corpus
+    # The clean dataset is rewritten, not appended to, so new APIs can land anywhere in it
+    update_corpus(csv_file=csv_file, corpus_dir=corpus_dir, rebuild=True)
+
+def _search(csv_file, index_dir, corpus_dir):
+    from search_index import update_search_index
+    update_search_index(csv_file=csv_file, index_dir=index_dir, rebuild=True, corpus_dir=corpus_dir)
+
+def build_stages(storage="csv", categories=None, profile="lean", num_drivers=4, backend="selenium", translate_rate_limit=5.0):
+    """
+    The stages of the API dataset pipeline:
+    scrape -> fuse -> translate -> clean -> corpus -> stats, dedup and search.
+
+    Every stage works on files in the current directory. Intermediate
+    datasets are CSV or Parquet files depending on storage. The scrape
+    stage is only added when categories are given, and always runs then;
+    otherwise the pipeline starts from the per-category CSVs on disk.
+    """
+    extension = ".parquet" if storage == "parquet" else ".csv"
+    fused = "rapidapi_fused_dataset" + extension
+    translated = "rapidapi_fused_dataset_en" + extension
+    clean = "rapidapi_fused_dataset_clean" + extension
+    category_files = "rapidapi_apis_*.csv"
+    corpus_manifest = os.path.join("corpus", "manifest.json")
+
+    stages = []
+    if categories:
+        stages.append(Stage("scrape", _scrape, outputs=[category_files], always_run=True,
+                            params={'categories': list(categories), 'profile': profile,
+                                    'num_drivers': num_drivers, 'backend': backend}))
+    stages += [
+        Stage("fuse", _fuse, inputs=[category_files], outputs=[fused], params={'output_filename': fused},
+              code_modules=["fusedData", "dataset_storage"]),
+        Stage("translate", _translate, inputs=[fused], outputs=[translated],
+              params={'input_file': fused, 'output_file': translated, 'rate_limit': translate_rate_limit},
+              code_modules=["data_translator", "translation_engine", "translation_cache", "language_detection",
+                            "dataset_storage"]),
+        Stage("clean", _clean, inputs=[translated], outputs=[clean], params={'input_file': translated, 'output_file': clean},
+              code_modules=["clean_data", "dataset_storage"]),
+        Stage("corpus", _corpus, inputs=[clean], outputs=[corpus_manifest],
+              params={'csv_file': clean, 'corpus_dir': "corpus"},
+              code_modules=["corpus_store", "search_index", "dataset_storage"]),
+        Stage("stats", _stats, inputs=[clean, corpus_manifest],
+              outputs=["statistics_report_en_clean.txt", "statistics_report_en_clean.json"],
+              params={'csv_file': clean, 'output_file': "statistics_report_en_clean.txt",
+                      'json_file': "statistics_report_en_clean.json", 'corpus_dir': "corpus"},
+              code_modules=["statisticalAnalysis", "language_detection", "corpus_store", "search_index", "dataset_storage"]),
+        Stage("dedup", _dedup, inputs=[clean, corpus_manifest],
+              outputs=["rapidapi_near_duplicates.csv", "rapidapi_fused_dataset_dedup.csv"],
+              params={'csv_file': clean, 'output_file': "rapidapi_near_duplicates.csv",
+                      'dedup_file': "rapidapi_fused_dataset_dedup.csv", 'corpus_dir': "corpus"},
+              code_modules=["near_duplicates", "corpus_store", "dataset_storage"]),
+        Stage("search", _search, inputs=[clean, corpus_manifest],
+              outputs=[os.path.join("search_index", "manifest.json")],
+              params={'csv_file': clean, 'index_dir': "search_index", 'corpus_dir': "corpus"},
+              code_modules=["search_index", "corpus_store", "dataset_storage"]),
+    ]
+    return stages
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the out-of-date stages of the API dataset pipeline")
+    parser.add_argument("stages", nargs="*", help="Stages to bring up to date (default: all)")
+    parser.add_argument("--dir", default=os.path.dirname(os.path.abspath(__file__)), help="Directory with the datasets")
+    parser.add_argument("--force", action="store_true", help="Run the selected stages even if they are up to date")
+    parser.add_argument("--workers", type=int, default=4, help="Maximum number of stages running at once")
+    parser.add_argument("--storage", choices=["csv", "parquet"], default="csv", help="Format of the intermediate datasets")
+    parser.add_argument("--scrape", nargs="+", metavar="CATEGORY", help="Scrape these categories first")
+    parser.add_argument("--backend", default="selenium", help="Scraper backend, see fetch_backends")
+    parser.add_argument("--metrics-dir", default="metrics", help="Directory of the per-run metrics files")
+    parser.add_argument("--profile", action="store_true", help="cProfile every stage into the metrics directory")
+    parser.add_argument("--trace-memory", action="store_true", help="Record the peak Python allocations of every stage")
+    args = parser.parse_args()
+
+    os.chdir(args.dir)
+    metrics_file = run_metrics_file(args.metrics_dir)
+    if args.profile:
+        METRICS.profile_dir = os.path.splitext(metrics_file)[0] + "_profiles"
+    METRICS.trace_memory = args.trace_memory
+    results = run_pipeline(build_stages(storage=args.storage, categories=args.scrape, backend=args.backend),
+                           targets=args.stages or None, force=args.force, max_workers=args.workers,
+                           metrics_file=metrics_file)
+    raise SystemExit(1 if any(result['status'] in ('failed', 'blocked') for result in results.values()) else 0)
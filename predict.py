@@ -0,0 +1,96 @@
+import argparse
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from train_classifier import build_text
+
+def load_model(model_file="category_model.joblib"):
+    """Load a model saved by train_classifier"""
+    return joblib.load(model_file)
+
+def top_k_predictions(model, records, k=3):
+    """
+    Predicts the k most likely categories of many APIs at once.
+
+    Args:
+        model: A model saved by train_classifier.
+        records: DataFrame or list of dicts with 'name' and 'description',
+            like the rows produced by webscrap.extract_data_from_card.
+        k (int): Number of categories to return per API.
+
+    Returns:
+        tuple: (categories, scores), two arrays of shape (len(records), k)
+        ordered from the best category down. Scores are the decision values
+        of the linear model; higher means more confident.
+    """
+    df = records if isinstance(records, pd.DataFrame) else pd.DataFrame(records, columns=['name', 'category', 'description'])
+    scores = model.decision_function(build_text(df))
+    if scores.ndim == 1:
+        # Two-class models return one column, the score of the second class
+        scores = np.column_stack([-scores, scores])
+    k = min(k, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    return model.classes_[top], np.take_along_axis(top_scores, order, axis=1)
+
+def predict_csv(input_file, output_file, model_file="category_model.joblib", chunksize=10000, top_k=3):
+    """
+    Predicts the category of every API in a CSV, streaming it in chunks.
+
+    Each chunk is predicted in one vectorized call and appended to the
+    output, so memory stays bounded by the chunk size. The output has the
+    input columns plus 'predicted_category', 'predicted_score' and
+    'top_categories' (the top_k categories joined with '|').
+
+    Args:
+        input_file (str): CSV with 'name' and 'description' columns.
+        output_file (str): Where to save the predictions.
+        model_file (str): Model saved by train_classifier.
+        chunksize (int): Rows per chunk.
+        top_k (int): Number of categories in 'top_categories'.
+
+    Returns:
+        int: Number of predicted rows.
+    """
+    print(f"🔮 Predicting categories for '{input_file}'...")
+    if not os.path.exists(input_file):
+        print(f"❌ Error: Input file '{input_file}' not found.")
+        return 0
+
+    start = time.perf_counter()
+    model = load_model(model_file)
+    print(f"   Model loaded in {time.perf_counter() - start:.2f}s")
+
+    rows = 0
+    header = True
+    for chunk in pd.read_csv(input_file, chunksize=chunksize):
+        categories, scores = top_k_predictions(model, chunk, k=top_k)
+        chunk['predicted_category'] = categories[:, 0]
+        chunk['predicted_score'] = scores[:, 0].round(4)
+        chunk['top_categories'] = ["|".join(row) for row in categories]
+        chunk.to_csv(output_file, mode='w' if header else 'a', header=header, index=False)
+        header = False
+        rows += len(chunk)
+        print(f"   {rows} rows predicted...")
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ {rows} predictions saved to '{output_file}' in {elapsed:.1f}s ({rows / elapsed:.0f} rows/s)")
+    return rows
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(__file__)
+    parser = argparse.ArgumentParser(description="Predict API categories for a CSV of scraped APIs")
+    parser.add_argument("input", help="CSV with 'name' and 'description' columns")
+    parser.add_argument("output", help="Where to save the predictions")
+    parser.add_argument("--model", default=os.path.join(script_dir, "category_model.joblib"))
+    parser.add_argument("--chunksize", type=int, default=10000)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+
+    predict_csv(args.input, args.output, model_file=args.model, chunksize=args.chunksize, top_k=args.top_k)
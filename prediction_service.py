@@ -0,0 +1,198 @@
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from predict import load_model, top_k_predictions
+
+class MicroBatcher:
+    """
+    Collects concurrent prediction requests into small batches.
+
+    A single background thread takes the first waiting request, gathers
+    more for up to max_wait_ms or until max_batch records are waiting, and
+    predicts them all in one vectorized call. Under load this gives one
+    model call per batch instead of one per request.
+
+    Args:
+        model: A model saved by train_classifier.
+        max_batch (int): Maximum number of records per model call.
+        max_wait_ms (float): How long to wait for more requests once one arrives.
+    """
+
+    def __init__(self, model, max_batch=64, max_wait_ms=5):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.records = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, records, k=3):
+        """Queue a list of records and return a Future of their top-k predictions"""
+        future = Future()
+        self._queue.put((records, k, future))
+        return future
+
+    def _run(self):
+        while True:
+            pending = [self._queue.get()]
+            if pending[0] is None:
+                return
+            size = len(pending[0][0])
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                pending.append(item)
+                size += len(item[0])
+            self._predict(pending)
+
+    def _predict(self, pending):
+        records = [record for request_records, _, _ in pending for record in request_records]
+        k = max(request_k for _, request_k, _ in pending)
+        try:
+            categories, scores = top_k_predictions(self.model, records, k=k)
+        except Exception as e:
+            for _, _, future in pending:
+                future.set_exception(e)
+            return
+        self.batches += 1
+        self.records += len(records)
+
+        offset = 0
+        for request_records, request_k, future in pending:
+            results = []
+            for row in range(offset, offset + len(request_records)):
+                results.append([
+                    {'category': str(category), 'score': round(float(score), 4)}
+                    for category, score in zip(categories[row, :request_k], scores[row, :request_k])
+                ])
+            offset += len(request_records)
+            future.set_result(results)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    """
+    POST /predict with one API or a list of APIs as JSON, each with 'name'
+    and 'description' (and optionally 'category', which is ignored). An
+    optional 'k' query parameter sets the number of categories returned.
+    GET /health reports the batching statistics.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, every
+    # keep-alive response waits for the client's delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+    batcher = None
+    max_records = 1000
+
+    def do_GET(self):
+        if urlsplit(self.path).path != "/health":
+            return self._send_json(404, {'error': 'not found'})
+        self._send_json(200, {'status': 'ok', 'batches': self.batcher.batches, 'records': self.batcher.records})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/predict":
+            return self._send_json(404, {'error': 'not found'})
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'null')
+            k = int(parse_qs(url.query).get('k', ['3'])[0])
+        except ValueError as e:
+            return self._send_json(400, {'error': f'invalid request: {e}'})
+
+        single = isinstance(body, dict)
+        records = [body] if single else body
+        if not isinstance(records, list) or not records or not all(isinstance(r, dict) for r in records):
+            return self._send_json(400, {'error': 'expected an API object or a non-empty list of them'})
+        if len(records) > self.max_records:
+            return self._send_json(413, {'error': f'at most {self.max_records} APIs per request'})
+        records = [{'name': r.get('name'), 'category': r.get('category'), 'description': r.get('description')}
+                   for r in records]
+
+        try:
+            results = self.batcher.submit(records, k=max(1, k)).result()
+        except Exception as e:
+            return self._send_json(500, {'error': str(e)})
+        predictions = [{'name': record['name'], 'top': top} for record, top in zip(records, results)]
+        self._send_json(200, predictions[0] if single else {'predictions': predictions})
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class PredictionServer(ThreadingHTTPServer):
+    request_queue_size = 128
+    daemon_threads = True
+
+def start_service(model_file="category_model.joblib", host="127.0.0.1", port=8000, max_batch=64, max_wait_ms=5, model=None):
+    """
+    Loads the model once and starts the prediction service in a background thread.
+
+    Args:
+        model_file (str): Model saved by train_classifier.
+        host (str): Interface to listen on.
+        port (int): Port to listen on, 0 for a free port.
+        max_batch (int): Maximum number of records per model call.
+        max_wait_ms (float): How long a request may wait for others to batch with.
+        model: An already loaded model, instead of model_file.
+
+    Returns:
+        tuple: (server, batcher, base URL). Stop with stop_service.
+    """
+    batcher = MicroBatcher(model if model is not None else load_model(model_file), max_batch=max_batch, max_wait_ms=max_wait_ms)
+    handler = type("BoundPredictionHandler", (PredictionHandler,), {'batcher': batcher})
+    server = PredictionServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, batcher, f"http://{host}:{server.server_address[1]}"
+
+def stop_service(server, batcher):
+    server.shutdown()
+    server.server_close()
+    batcher.close()
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(__file__)
+    parser = argparse.ArgumentParser(description="Serve API category predictions over HTTP")
+    parser.add_argument("--model", default=os.path.join(script_dir, "category_model.joblib"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    server, batcher, url = start_service(args.model, args.host, args.port, args.max_batch, args.max_wait_ms)
+    print(f"🚀 Prediction service listening on {url} (POST /predict, GET /health)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping prediction service...")
+        stop_service(server, batcher)
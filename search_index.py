@@ -0,0 +1,325 @@
+import argparse
+import json
+import os
+import re
+import shutil
+import time
+
+import numpy as np
+
+import metrics
+from dataset_storage import iter_dataset_chunks, prefix_sha256s
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Terms are stored in a fixed-width array so it can be memory-mapped;
+# longer tokens are almost always URLs or keys and are not indexed
+MAX_TERM_LENGTH = 32
+MANIFEST_FILE = "manifest.json"
+
+def tokenize(text):
+    """Lowercase word tokens of a text"""
+    if not isinstance(text, str):
+        return []
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) <= MAX_TERM_LENGTH]
+
+def _write_segment(segment_dir, names, categories, descriptions, first_row, corpus=None):
+    """
+    Writes one immutable index segment for a batch of rows.
+
+    With a corpus_store.TokenizedCorpus that covers the rows, their token
+    ids are read from it instead of tokenizing the texts again.
+
+    Layout, all numpy files so they can be memory-mapped:
+        terms.npy          sorted unique terms
+        term_offsets.npy   postings of terms[i] are [term_offsets[i], term_offsets[i + 1])
+        postings_docs.npy  segment-local document ids, sorted within a term
+        postings_tf.npy    term frequency of each posting
+        doc_lengths.npy    number of tokens of each document
+        doc_categories.npy index into meta.json's category list
+        doc_rows.npy       row of the document in the fused CSV
+        text.bin / text_offsets.npy   "name\\x1fdescription" of each document, UTF-8
+    """
+    os.makedirs(segment_dir)
+    if corpus is None:
+        vocabulary = {}
+        term_ids = []
+        doc_ids = []
+        doc_lengths = np.zeros(len(names), dtype=np.uint32)
+        for doc, (name, description) in enumerate(zip(names, descriptions)):
+            tokens = tokenize(name) + tokenize(description)
+            doc_lengths[doc] = len(tokens)
+            term_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+            doc_ids.extend([doc] * len(tokens))
+        segment_terms = list(vocabulary)
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)
+    else:
+        # Renumber the corpus' global term ids to segment-local ones
+        global_ids, doc_ids, doc_lengths = [], [], np.zeros(len(names), dtype=np.uint32)
+        for column in ('name', 'description'):
+            offsets = corpus.offsets[column][first_row:first_row + len(names) + 1]
+            lengths = np.diff(offsets)
+            global_ids.append(np.asarray(corpus.tokens[column][offsets[0]:offsets[-1]], dtype=np.int64))
+            doc_ids.append(np.repeat(np.arange(len(names), dtype=np.int64), lengths))
+            doc_lengths += lengths.astype(np.uint32)
+        global_ids, doc_ids = np.concatenate(global_ids), np.concatenate(doc_ids)
+        used_ids, term_ids = np.unique(global_ids, return_inverse=True)
+        segment_terms = corpus.decode(used_ids)
+
+    terms = np.array(segment_terms, dtype=f"<U{MAX_TERM_LENGTH}")
+    # Renumber terms in sorted order, then count (term, doc) pairs
+    order = np.argsort(terms)
+    rank = np.empty(len(terms), dtype=np.int64)
+    rank[order] = np.arange(len(terms))
+    terms = terms[order]
+    keys = rank[term_ids] * len(names) + doc_ids
+    unique_keys, counts = np.unique(keys, return_counts=True)
+    posting_terms = unique_keys // len(names)
+
+    term_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+    term_offsets[1:] = np.cumsum(np.bincount(posting_terms, minlength=len(terms)))
+
+    category_list = sorted(set(categories))
+    category_codes = {category: code for code, category in enumerate(category_list)}
+
+    texts = [f"{name}\x1f{description}".encode('utf-8') for name, description in zip(names, descriptions)]
+    text_offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    text_offsets[1:] = np.cumsum([len(text) for text in texts])
+
+    np.save(os.path.join(segment_dir, "terms.npy"), terms)
+    np.save(os.path.join(segment_dir, "term_offsets.npy"), term_offsets)
+    np.save(os.path.join(segment_dir, "postings_docs.npy"), (unique_keys % len(names)).astype(np.uint32))
+    np.save(os.path.join(segment_dir, "postings_tf.npy"), np.minimum(counts, 65535).astype(np.uint16))
+    np.save(os.path.join(segment_dir, "doc_lengths.npy"), doc_lengths)
+    np.save(os.path.join(segment_dir, "doc_categories.npy"),
+            np.array([category_codes[category] for category in categories], dtype=np.uint16))
+    np.save(os.path.join(segment_dir, "doc_rows.npy"), np.arange(first_row, first_row + len(names), dtype=np.int64))
+    np.save(os.path.join(segment_dir, "text_offsets.npy"), text_offsets)
+    with open(os.path.join(segment_dir, "text.bin"), 'wb') as f:
+        f.write(b"".join(texts))
+    with open(os.path.join(segment_dir, "meta.json"), 'w', encoding='utf-8') as f:
+        json.dump({'documents': len(names), 'total_length': int(doc_lengths.sum()), 'categories': category_list}, f)
+
+def _load_manifest(index_dir):
+    path = os.path.join(index_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_manifest(index_dir, manifest):
+    path = os.path.join(index_dir, MANIFEST_FILE)
+    with open(path + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+def update_search_index(csv_file="rapidapi_fused_dataset_clean.csv", index_dir="search_index", chunksize=50000, rebuild=False,
+                        corpus_dir=None):
+    """
+    Builds the search index, or adds the rows appended to the CSV since the last update.
+
+    Every update writes the new rows as a new immutable segment, so existing
+    segments are never rewritten. The index is rebuilt from scratch when the
+    CSV no longer starts with the bytes it had at the last update, since
+    then it was rewritten rather than appended to.
+
+    Args:
+        csv_file (str): The dataset to index, with 'name', 'category' and 'description'.
+        index_dir (str): Directory of the index.
+        chunksize (int): Maximum number of rows per segment.
+        rebuild (bool): Drop the existing index and index the whole CSV.
+        corpus_dir (str): Tokenized corpus of the same CSV, see corpus_store.
+            Its token ids are used instead of tokenizing the texts; it is
+            ignored if it was built from a different version of the CSV.
+
+    Returns:
+        int: Number of rows added to the index.
+    """
+    print(f"🔎 Updating search index '{index_dir}' from '{csv_file}'...")
+    if not os.path.exists(csv_file):
+        print(f"❌ Error: Input file '{csv_file}' not found.")
+        return 0
+
+    start = time.perf_counter()
+    manifest = None if rebuild else _load_manifest(index_dir)
+    csv_size = os.path.getsize(csv_file)
+    indexed_sha256, csv_sha256 = prefix_sha256s(csv_file, [manifest['csv_bytes'] if manifest else 0, csv_size])
+    if manifest and (indexed_sha256 is None or indexed_sha256 != manifest.get('csv_sha256')):
+        print("   ⚠️ CSV was rewritten since it was indexed, rebuilding the index")
+        manifest = None
+    if manifest is None:
+        shutil.rmtree(index_dir, ignore_errors=True)
+        os.makedirs(index_dir)
+        manifest = {'segments': [], 'rows': 0, 'csv_bytes': 0}
+
+    corpus = None
+    if corpus_dir is not None:
+        from corpus_store import corpus_for
+        corpus = corpus_for(csv_file, corpus_dir, source_sha256=csv_sha256)
+
+    added = 0
+    reader = iter_dataset_chunks(csv_file, chunksize=chunksize, columns=['name', 'category', 'description'],
+                                 skip_rows=manifest['rows'])
+    for chunk in reader:
+        if chunk.empty:
+            continue
+        # astype(object): a Parquet 'category' is a categorical, which cannot take ''
+        chunk = chunk.astype(object).fillna('')
+        segment = f"segment_{len(manifest['segments']):05d}"
+        _write_segment(os.path.join(index_dir, segment), chunk['name'].astype(str).tolist(),
+                       chunk['category'].astype(str).tolist(), chunk['description'].astype(str).tolist(), manifest['rows'],
+                       corpus=corpus)
+        manifest['segments'].append(segment)
+        manifest['rows'] += len(chunk)
+        added += len(chunk)
+
+    manifest['csv_bytes'] = csv_size
+    manifest['csv_sha256'] = csv_sha256
+    _save_manifest(index_dir, manifest)
+    metrics.count('search.rows', added)
+    print(f"✅ Indexed {added} new rows in {time.perf_counter() - start:.1f}s "
+          f"({manifest['rows']} rows in {len(manifest['segments'])} segments)")
+    return added
+
+class _Segment:
+    def __init__(self, segment_dir):
+        def load(name):
+            return np.load(os.path.join(segment_dir, name), mmap_mode='r')
+
+        with open(os.path.join(segment_dir, "meta.json"), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        self.documents = meta['documents']
+        self.total_length = meta['total_length']
+        self.categories = {category: code for code, category in enumerate(meta['categories'])}
+        self.category_names = meta['categories']
+        self.terms = load("terms.npy")
+        self.term_offsets = load("term_offsets.npy")
+        self.postings_docs = load("postings_docs.npy")
+        self.postings_tf = load("postings_tf.npy")
+        self.doc_lengths = load("doc_lengths.npy")
+        self.doc_categories = load("doc_categories.npy")
+        self.doc_rows = load("doc_rows.npy")
+        self.text_offsets = load("text_offsets.npy")
+        self.text = np.memmap(os.path.join(segment_dir, "text.bin"), dtype=np.uint8, mode='r') if self.text_offsets[-1] else None
+
+    def postings(self, term):
+        i = int(np.searchsorted(self.terms, term))
+        if i == len(self.terms) or self.terms[i] != term:
+            return None
+        start, end = self.term_offsets[i], self.term_offsets[i + 1]
+        return self.postings_docs[start:end], self.postings_tf[start:end]
+
+    def document(self, doc):
+        start, end = self.text_offsets[doc], self.text_offsets[doc + 1]
+        text = bytes(self.text[start:end]).decode('utf-8') if self.text is not None else "\x1f"
+        name, description = text.split("\x1f", 1)
+        return {'row': int(self.doc_rows[doc]), 'name': name,
+                'category': self.category_names[self.doc_categories[doc]], 'description': description}
+
+class SearchIndex:
+    """
+    Read-only view of a search index built by update_search_index.
+
+    All arrays are memory-mapped, so opening is instant and only the
+    postings a query touches are read from disk.
+
+    Args:
+        index_dir (str): Directory of the index.
+        k1 (float): BM25 term frequency saturation.
+        b (float): BM25 document length normalization.
+    """
+
+    def __init__(self, index_dir="search_index", k1=1.2, b=0.75):
+        manifest = _load_manifest(index_dir)
+        if manifest is None:
+            raise FileNotFoundError(f"No search index in '{index_dir}', run update_search_index first")
+        self.k1 = k1
+        self.b = b
+        self.segments = [_Segment(os.path.join(index_dir, segment)) for segment in manifest['segments']]
+        self.documents = sum(segment.documents for segment in self.segments)
+        total_length = sum(segment.total_length for segment in self.segments)
+        self.avg_length = total_length / self.documents if self.documents else 0.0
+
+    def search(self, query, k=10, category=None):
+        """
+        Ranks documents for a query with BM25.
+
+        Args:
+            query (str): Free-text query.
+            k (int): Number of results.
+            category (str): Only return APIs of this category.
+
+        Returns:
+            list: Up to k dicts with 'row', 'name', 'category', 'description'
+            and 'score', best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.documents:
+            return []
+
+        # Postings and document frequencies over all segments first, since
+        # idf depends on the whole index
+        postings = [[segment.postings(term) for term in terms] for segment in self.segments]
+        document_frequency = np.zeros(len(terms))
+        for segment_postings in postings:
+            for i, found in enumerate(segment_postings):
+                if found is not None:
+                    document_frequency[i] += len(found[0])
+        idf = np.log(1 + (self.documents - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        candidates = []
+        for segment, segment_postings in zip(self.segments, postings):
+            if category is not None and category not in segment.categories:
+                continue
+            scores = None
+            for i, found in enumerate(segment_postings):
+                if found is None:
+                    continue
+                docs, tf = np.asarray(found[0]), np.asarray(found[1], dtype=np.float32)
+                norm = self.k1 * (1 - self.b + self.b * segment.doc_lengths[docs] / self.avg_length)
+                if scores is None:
+                    scores = np.zeros(segment.documents, dtype=np.float32)
+                scores[docs] += idf[i] * tf * (self.k1 + 1) / (tf + norm)
+            if scores is None:
+                continue
+            if category is not None:
+                scores[np.asarray(segment.doc_categories) != segment.categories[category]] = 0
+            matches = np.flatnonzero(scores)
+            if len(matches) > k:
+                matches = matches[np.argpartition(-scores[matches], k - 1)[:k]]
+            candidates.extend((float(scores[doc]), segment, int(doc)) for doc in matches)
+
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1].doc_rows[candidate[2]]))
+        results = []
+        for score, segment, doc in candidates[:k]:
+            result = segment.document(doc)
+            result['score'] = round(score, 4)
+            results.append(result)
+        return results
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(__file__)
+    parser = argparse.ArgumentParser(description="Build and query the BM25 search index over the fused dataset")
+    parser.add_argument("--index", default=os.path.join(script_dir, "search_index"))
+    commands = parser.add_subparsers(dest="command", required=True)
+    update_parser = commands.add_parser("update", help="Build the index or add newly fused rows")
+    update_parser.add_argument("--csv", default=os.path.join(script_dir, "rapidapi_fused_dataset_clean.csv"))
+    update_parser.add_argument("--rebuild", action="store_true")
+    update_parser.add_argument("--corpus", help="Tokenized corpus of the CSV to reuse, see corpus_store")
+    query_parser = commands.add_parser("query", help="Search the index")
+    query_parser.add_argument("query")
+    query_parser.add_argument("-k", type=int, default=10)
+    query_parser.add_argument("--category")
+    args = parser.parse_args()
+
+    if args.command == "update":
+        update_search_index(csv_file=args.csv, index_dir=args.index, rebuild=args.rebuild, corpus_dir=args.corpus)
+    else:
+        start = time.perf_counter()
+        results = SearchIndex(args.index).search(args.query, k=args.k, category=args.category)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"🔎 {len(results)} results for '{args.query}' ({elapsed:.1f} ms)\n")
+        for rank, result in enumerate(results, 1):
+            description = result['description'][:120] + ("..." if len(result['description']) > 120 else "")
+            print(f"{rank:2d}. {result['name']} [{result['category']}]  score {result['score']:.2f}")
+            print(f"    {description}")
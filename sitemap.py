@@ -0,0 +1,288 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+from fetch_backends import USER_AGENT
+
+SITEMAP_URL = "https://rapidapi.com/sitemap-category.xml"
+SEARCH_PATH = "/search/"
+
+def _local_name(tag):
+    """'{namespace}loc' -> 'loc'"""
+    return tag.rsplit('}', 1)[-1]
+
+def _open_sitemap(path):
+    """Open a sitemap file, transparently decompressing .xml.gz files"""
+    f = open(path, 'rb')
+    if f.read(2) == b'\x1f\x8b':
+        f.seek(0)
+        return gzip.GzipFile(fileobj=f)
+    f.seek(0)
+    return f
+
+def iter_sitemap_entries(source):
+    """
+    Stream the entries of a sitemap or sitemap index.
+
+    Parses with iterparse and clears every entry once it is read, so memory
+    stays constant however large the file is.
+
+    Args:
+        source (str or file): Path of a sitemap file (plain or gzipped), or
+            a binary file object.
+
+    Yields:
+        tuple: (kind, loc, lastmod) with kind 'url' for pages of a <urlset>
+        and 'sitemap' for child sitemaps of a <sitemapindex>; lastmod is
+        None when the entry has none.
+    """
+    f = _open_sitemap(source) if isinstance(source, (str, os.PathLike)) else source
+    names = {}  # tag -> local name, tags repeat on every entry
+    try:
+        root = None
+        for event, element in ET.iterparse(f, events=('start', 'end')):
+            if root is None:
+                root = element
+            if event == 'start':
+                continue
+            tag = element.tag
+            name = names.get(tag) or names.setdefault(tag, _local_name(tag))
+            if name != 'url' and name != 'sitemap':
+                continue
+            loc = lastmod = None
+            for child in element:
+                tag = child.tag
+                child_name = names.get(tag) or names.setdefault(tag, _local_name(tag))
+                if child_name == 'loc':
+                    loc = (child.text or '').strip()
+                elif child_name == 'lastmod':
+                    lastmod = (child.text or '').strip() or None
+            if loc:
+                yield name, loc, lastmod
+            # Drop the entries read so far, the root would keep them all alive
+            root.clear()
+    finally:
+        if f is not source:
+            f.close()
+
+def category_from_url(url):
+    """Decoded category name of a https://rapidapi.com/search/<category> URL, or None for other URLs"""
+    path = urlsplit(url).path
+    if not path.startswith(SEARCH_PATH):
+        return None
+    return unquote(path[len(SEARCH_PATH):]) or None
+
+class SitemapCache:
+    """
+    Local copies of downloaded sitemaps, refreshed with conditional requests.
+
+    Each sitemap is stored with the ETag and Last-Modified headers it came
+    with. A refresh sends them back as If-None-Match / If-Modified-Since, so
+    an unchanged sitemap costs a 304 and no download.
+
+    Args:
+        cache_dir (str): Directory of the cached sitemaps.
+        timeout (float): Seconds to wait for the server.
+    """
+
+    def __init__(self, cache_dir="sitemap_cache", timeout=30):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        base = os.path.join(self.cache_dir, key)
+        return base + ".xml", base + ".json"
+
+    def _load_meta(self, url):
+        body_file, meta_file = self._paths(url)
+        if not (os.path.exists(body_file) and os.path.exists(meta_file)):
+            return None
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def fetch(self, url):
+        """
+        Bring the cached copy of a sitemap up to date.
+
+        Returns:
+            tuple: (path, changed) with the local file of the sitemap and
+            whether it was downloaded (False on 304 Not Modified). When the
+            server cannot be reached, the last cached copy is used.
+        """
+        body_file, meta_file = self._paths(url)
+        meta = self._load_meta(url)
+        headers = {'User-Agent': USER_AGENT}
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                # Stream to disk, the body is parsed from the file afterwards
+                tmp_file = body_file + ".tmp"
+                with open(tmp_file, 'wb') as f:
+                    shutil.copyfileobj(response, f, 1 << 16)
+                os.replace(tmp_file, body_file)
+                meta = {'url': url, 'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'), 'fetched_at': time.time()}
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and meta:
+                return body_file, False
+            if meta:
+                print(f"   ⚠️ {url} returned HTTP {e.code}, using the cached copy")
+                return body_file, False
+            raise
+        except (urllib.error.URLError, OSError) as e:
+            if meta:
+                print(f"   ⚠️ Could not reach {url} ({e}), using the cached copy")
+                return body_file, False
+            raise
+
+        with open(meta_file + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(meta_file + ".tmp", meta_file)
+        return body_file, True
+
+def crawl_sitemap(url, cache, max_workers=8, max_depth=3):
+    """
+    Fetch a sitemap and, if it is a sitemap index, all its child sitemaps.
+
+    The children of an index are fetched concurrently, each refreshed
+    through the cache. Unchanged sitemaps are still parsed from their cached
+    copy, so the result is always the full set of URLs.
+
+    Args:
+        url (str): The sitemap or sitemap index URL.
+        cache (SitemapCache): Local cache used for conditional requests.
+        max_workers (int): Sitemaps downloaded at the same time.
+        max_depth (int): Levels of nested sitemap indexes to follow.
+
+    Returns:
+        tuple: (urls, stats) where urls maps every page URL to its lastmod
+        and stats counts the sitemaps fetched, not modified and failed.
+    """
+    urls = {}
+    stats = {'fetched': 0, 'not_modified': 0, 'failed': 0}
+    seen = {url}
+    level = [url]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for depth in range(max_depth + 1):
+            if not level:
+                break
+            children = []
+            for sitemap_url, future in [(u, executor.submit(cache.fetch, u)) for u in level]:
+                try:
+                    path, changed = future.result()
+                except Exception as e:
+                    # Losing the root is fatal, a broken child only loses its URLs
+                    if sitemap_url == url:
+                        raise
+                    print(f"   ❌ Could not fetch {sitemap_url}: {e}")
+                    stats['failed'] += 1
+                    continue
+                stats['fetched' if changed else 'not_modified'] += 1
+                for kind, loc, lastmod in iter_sitemap_entries(path):
+                    if kind == 'url':
+                        urls[loc] = lastmod
+                    elif loc not in seen and depth < max_depth:
+                        seen.add(loc)
+                        children.append(loc)
+            level = children
+    return urls, stats
+
+def load_state(state_file):
+    """URL -> fingerprint map saved by the last delta, empty if there is none"""
+    if not os.path.exists(state_file):
+        return {}
+    with open(state_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(state_file, state):
+    with open(state_file + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(state_file + ".tmp", state_file)
+
+def sitemap_delta(url=SITEMAP_URL, cache_dir="sitemap_cache", state_file=None, max_workers=8, commit=True):
+    """
+    URLs of a sitemap that are new or changed since the last delta.
+
+    A URL counts as changed when its <lastmod> differs from the one seen
+    last time. URLs without a lastmod are only reported when they are new.
+    With commit, the current sitemap becomes the reference for the next
+    call; pass commit=False to look at the delta without consuming it, and
+    commit_delta it once the crawl it feeds has been queued.
+
+    Args:
+        url (str): The sitemap or sitemap index URL.
+        cache_dir (str): Directory of the sitemap cache.
+        state_file (str): JSON file of the URLs seen last time, in cache_dir by default.
+        max_workers (int): Child sitemaps downloaded at the same time.
+        commit (bool): Save the current sitemap as the new reference.
+
+    Returns:
+        dict: 'new', 'changed' and 'removed' lists of URLs, plus 'total'
+        URLs, the fetch 'stats', and the 'urls' and 'state_file' that
+        commit_delta needs.
+    """
+    cache = SitemapCache(cache_dir)
+    state_file = state_file or os.path.join(cache_dir, "delta_state.json")
+    previous = load_state(state_file)
+    urls, stats = crawl_sitemap(url, cache, max_workers=max_workers)
+
+    new, changed = [], []
+    for loc, lastmod in urls.items():
+        if loc not in previous:
+            new.append(loc)
+        elif lastmod is not None and previous[loc] != lastmod:
+            changed.append(loc)
+    removed = [loc for loc in previous if loc not in urls]
+
+    if commit:
+        save_state(state_file, urls)
+    return {'new': new, 'changed': changed, 'removed': removed, 'total': len(urls), 'stats': stats,
+            'urls': urls, 'state_file': state_file}
+
+def commit_delta(delta):
+    """Make the sitemap of a delta taken with commit=False the reference for the next one"""
+    save_state(delta['state_file'], delta['urls'])
+
+def category_delta(url=SITEMAP_URL, cache_dir="sitemap_cache", state_file=None, max_workers=8, commit=True):
+    """
+    Like sitemap_delta, with the 'new', 'changed' and 'removed' URLs turned
+    into category names.
+    """
+    delta = sitemap_delta(url, cache_dir=cache_dir, state_file=state_file, max_workers=max_workers, commit=commit)
+    for key in ('new', 'changed', 'removed'):
+        delta[key] = [category for category in map(category_from_url, delta[key]) if category]
+    return delta
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(__file__)
+    parser = argparse.ArgumentParser(description="Refresh the category sitemap and list new or changed categories")
+    parser.add_argument("--url", default=SITEMAP_URL)
+    parser.add_argument("--cache", default=os.path.join(script_dir, "sitemap_cache"))
+    parser.add_argument("--dry-run", action="store_true", help="Do not save the sitemap as the new reference")
+    args = parser.parse_args()
+
+    delta = category_delta(args.url, cache_dir=args.cache, commit=not args.dry_run)
+    for key, label in (('new', "🆕 New"), ('changed', "✏️  Changed"), ('removed', "🗑️  Removed")):
+        print(f"{label} categories: {len(delta[key])}")
+        for category in delta[key]:
+            print(f"   {category}")
@@ -1,85 +1,321 @@
 import pandas as pd
-from langdetect import detect, LangDetectException
+import numpy as np
 import os
-from collections import Counter
+import json
+from language_detection import detect_language, detect_languages
+from dataset_storage import iter_dataset_chunks, prefix_sha256s
+from search_index import MAX_TERM_LENGTH
+import metrics
+
+MISSING_CATEGORY = "(missing)"
+# Counts the tokens search_index.tokenize keeps: maximal runs of [a-z0-9] of at most MAX_TERM_LENGTH characters
+TOKEN_COUNT_PATTERN = rf"(?<![a-z0-9])[a-z0-9]{{1,{MAX_TERM_LENGTH}}}(?![a-z0-9])"
 
 def get_language_if_not_english(text):
     """
     Detects if a given text is not in English.
     Returns the language code if not English, otherwise None.
     """
-    if not isinstance(text, str) or not text.strip():
+    # langdetect can fail on short/ambiguous text, which is reported as 'unknown'
+    lang = detect_language(text)
+    if lang == 'en':
         return None
-    try:
-        lang = detect(text)
-        if lang != 'en':
-            return lang
-    except LangDetectException:
-        # langdetect can fail on short/ambiguous text. Consider it unknown.
-        return 'unknown'
-    return None
+    return lang
+
+
+def _value_counts(series_by_category):
+    """{category: {value: count}} from a Series indexed by (category, value)"""
+    counts = {}
+    for (category, value), count in series_by_category.items():
+        counts.setdefault(category, {})[str(int(value))] = int(count)
+    return counts
+
+def _merge_counts(target, source):
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _merge_counts(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
 
+def _text_hashes(series):
+    """uint64 hash of every normalized text, so duplicates can be counted without keeping the texts"""
+    normalized = series.fillna('').astype(str).str.strip().str.lower()
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
 
-def analyze_fused_dataset(csv_file="rapidapi_fused_dataset.csv", output_file="statistics_report.txt"):
+def compute_chunk_stats(df, first_row=0, language_cache_file="language_cache.sqlite", seen_hashes=None, token_counts=None):
     """
-    Analyzes the fused dataset to generate statistics about the APIs.
+    Computes the mergeable statistics of a batch of rows in one vectorized pass.
+
+    Every statistic is a count, or a count per distinct value (description
+    lengths and token counts per category), so the statistics of two
+    batches can be added together with merge_stats.
+
+    Args:
+        df (pd.DataFrame): Rows with 'name', 'category' and 'description'.
+        first_row (int): Row number of the first row in the whole dataset.
+        language_cache_file (str): Sidecar cache of detect_languages.
+        seen_hashes (dict): {'name': array, 'description': array} of the
+            text hashes of earlier batches, so duplicates across batches
+            are counted too.
+        token_counts (array): Number of description tokens of every row,
+            from the tokenized corpus; counted from the texts, with the
+            same tokenizer, if None.
+
+    Returns:
+        tuple: (stats dict, {'name': array, 'description': array} of the
+        hashes of this batch)
     """
-    print(f"📊 Analyzing '{csv_file}'...")
+    # Parquet datasets read 'category' as a categorical, which cannot take MISSING_CATEGORY
+    categories = df['category'].astype(object).fillna(MISSING_CATEGORY)
+    descriptions = df['description'].fillna('').astype(str)
+    has_description = descriptions.str.strip().ne('')
+    lengths = descriptions.str.len()
+    if token_counts is not None:
+        tokens = pd.Series(np.asarray(token_counts), index=df.index)
+    else:
+        tokens = descriptions.str.lower().str.count(TOKEN_COUNT_PATTERN)
 
-    if not os.path.exists(csv_file):
-        print(f"❌ Error: The file '{csv_file}' was not found.")
-        return
+    languages, _ = detect_languages(descriptions.tolist(), cache_file=language_cache_file)
+    languages = pd.Series(languages, index=df.index).fillna('none')
 
-    try:
-        df = pd.read_csv(csv_file)
-        total_apis = len(df)
+    stats = {
+        'rows': len(df),
+        'categories': {k: int(v) for k, v in categories.value_counts().items()},
+        'empty': {
+            'name': {k: int(v) for k, v in df['name'].isnull().groupby(categories).sum().items() if v},
+            'description': {k: int(v) for k, v in (~has_description).groupby(categories).sum().items() if v}
+        },
+        # Distributions over the non-empty descriptions only
+        'description_length': _value_counts(lengths[has_description].groupby([categories[has_description], lengths[has_description]]).size()),
+        'description_tokens': _value_counts(tokens[has_description].groupby([categories[has_description], tokens[has_description]]).size()),
+        'languages': {k: int(v) for k, v in languages.value_counts().items()},
+        'non_english_by_category': {k: int(v) for k, v in
+                                    (~languages.isin(['en', 'none'])).groupby(categories).sum().items() if v},
+        'duplicates': {},
+        'non_english_rows': [
+            [int(first_row + position), name, language]
+            for position, name, language in zip(
+                np.flatnonzero(~languages.isin(['en', 'none']).to_numpy()),
+                df['name'].astype(str)[~languages.isin(['en', 'none'])],
+                languages[~languages.isin(['en', 'none'])]
+            )
+        ]
+    }
+
+    hashes = {}
+    for column, mask in (('name', df['name'].notna()), ('description', has_description)):
+        column_hashes = _text_hashes(df[column][mask])
+        earlier = seen_hashes.get(column) if seen_hashes else None
+        duplicated = pd.Series(column_hashes).duplicated().to_numpy()
+        if earlier is not None and len(earlier):
+            duplicated = duplicated | np.isin(column_hashes, earlier)
+        stats['duplicates'][column] = int(duplicated.sum())
+        hashes[column] = column_hashes
+    return stats, hashes
+
+def merge_stats(total, stats):
+    """Add the statistics of a new batch to running totals, in place, and return them"""
+    non_english_rows = total.pop('non_english_rows', []) + stats['non_english_rows']
+    _merge_counts(total, {key: value for key, value in stats.items() if key != 'non_english_rows'})
+    total['non_english_rows'] = non_english_rows
+    return total
+
+def _distribution(counts):
+    """Summary of a {value: count} distribution"""
+    values = np.array([int(value) for value in counts], dtype=np.int64)
+    weights = np.array(list(counts.values()), dtype=np.int64)
+    order = np.argsort(values)
+    values, weights = values[order], weights[order]
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
 
-        # 1. Number of APIs per category
-        apis_per_category = df['category'].value_counts()
+    def percentile(q):
+        return int(values[np.searchsorted(cumulative, q * total)])
 
-        # 2. Number of empty names or descriptions
-        empty_names = df['name'].isnull().sum()
-        # Fill NaN in description to handle empty strings consistently
-        empty_descriptions = df['description'].fillna('').str.strip().eq('').sum()
+    mean = float((values * weights).sum() / total)
+    return {
+        'count': int(total),
+        'mean': round(mean, 1),
+        'std': round(float(np.sqrt((weights * (values - mean) ** 2).sum() / total)), 1),
+        'min': int(values[0]),
+        'p50': percentile(0.5),
+        'p90': percentile(0.9),
+        'max': int(values[-1])
+    }
 
-        # 3. Detect language and find non-English entries
-        df['language'] = df['description'].apply(get_language_if_not_english)
-        non_english_entries = df[df['language'].notna()]
-        non_english_count = len(non_english_entries)
+def summarize_stats(stats):
+    """Turns accumulated statistics into the report structure saved as JSON"""
+    rows = stats['rows']
+    categories = dict(sorted(stats['categories'].items(), key=lambda item: (-item[1], item[0])))
+    languages = dict(sorted(stats['languages'].items(), key=lambda item: (-item[1], item[0])))
+    non_english = sum(count for language, count in languages.items() if language not in ('en', 'none'))
+    return {
+        'total_apis': rows,
+        'apis_per_category': categories,
+        'empty_fields': {
+            'name': sum(stats['empty']['name'].values()),
+            'description': sum(stats['empty']['description'].values()),
+            'name_by_category': stats['empty']['name'],
+            'description_by_category': stats['empty']['description']
+        },
+        'duplicates': {
+            column: {'count': count, 'rate': round(count / rows, 4) if rows else 0.0}
+            for column, count in stats['duplicates'].items()
+        },
+        'description_length': {
+            category: _distribution(stats['description_length'][category])
+            for category in categories if category in stats['description_length']
+        },
+        'description_tokens': {
+            category: _distribution(stats['description_tokens'][category])
+            for category in categories if category in stats['description_tokens']
+        },
+        'languages': languages,
+        'non_english': {
+            'count': non_english,
+            'share': round(non_english / rows, 4) if rows else 0.0,
+            'by_category': stats['non_english_by_category']
+        },
+        'non_english_rows': stats['non_english_rows']
+    }
 
-        # Count languages
-        language_counts = non_english_entries['language'].value_counts()
+def _table(rows, columns):
+    """Fixed-width text table of a list of tuples"""
+    widths = [max(len(str(value)) for value in [column] + [row[i] for row in rows]) for i, column in enumerate(columns)]
+    lines = ["  ".join(str(column).ljust(width) for column, width in zip(columns, widths))]
+    lines += ["  ".join(str(value).ljust(width) for value, width in zip(row, widths)) for row in rows]
+    return "\n".join(lines)
 
-        # Prepare the detailed list of non-English APIs
-        non_english_details = non_english_entries[['name', 'language']]
+def write_text_report(summary, output_file):
+    """Writes the human-readable report of summarize_stats"""
+    sections = [
+        "RapidAPI Fused Dataset Analysis",
+        "=" * 40 + "\n",
+        f"Total APIs Analyzed: {summary['total_apis']}\n",
+        "--- APIs per Category ---",
+        _table(list(summary['apis_per_category'].items()), ["category", "count"]) + "\n",
+        "--- Data Quality ---",
+        f"Entries with empty 'name': {summary['empty_fields']['name']}",
+        f"Entries with empty 'description': {summary['empty_fields']['description']}",
+        f"Duplicate names: {summary['duplicates']['name']['count']} ({summary['duplicates']['name']['rate']:.2%})",
+        f"Duplicate descriptions: {summary['duplicates']['description']['count']} "
+        f"({summary['duplicates']['description']['rate']:.2%})\n",
+    ]
+    for key, title in (('description_length', "Description Length (characters)"), ('description_tokens', "Description Tokens")):
+        sections.append(f"--- {title} per Category ---")
+        rows = [(category, d['count'], d['mean'], d['std'], d['min'], d['p50'], d['p90'], d['max'])
+                for category, d in summary[key].items()]
+        sections.append(_table(rows, ["category", "count", "mean", "std", "min", "p50", "p90", "max"]) + "\n")
 
-        # 4. Save results to a .txt file
-        print(f"💾 Saving analysis to '{output_file}'...")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("RapidAPI Fused Dataset Analysis\n")
-            f.write("=" * 40 + "\n\n")
-            f.write(f"Total APIs Analyzed: {total_apis}\n\n")
+    sections += [
+        "--- Language Analysis ---",
+        f"Total entries with non-English descriptions: {summary['non_english']['count']} "
+        f"({summary['non_english']['share']:.2%})\n",
+        "--- Language Breakdown ---",
+        _table(list(summary['languages'].items()), ["language", "count"]) + "\n",
+        "--- Non-English Descriptions per Category ---",
+        _table(sorted(summary['non_english']['by_category'].items(), key=lambda item: (-item[1], item[0])), ["category", "count"]) + "\n",
+        "--- Non-English API Details ---",
+        "\n".join(f"Row {row}: {name} - Language: {language}" for row, name, language in summary['non_english_rows'])
+    ]
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("\n".join(sections) + "\n")
 
-            f.write("--- APIs per Category ---\n")
-            f.write(apis_per_category.to_string())
-            f.write("\n\n")
+def _state_files(json_file):
+    base = os.path.splitext(json_file)[0]
+    return base + ".state.json", base + ".hashes.npz"
 
-            f.write("--- Data Quality ---\n")
-            f.write(f"Entries with empty 'name': {empty_names}\n")
-            f.write(f"Entries with empty 'description': {empty_descriptions}\n\n")
+def analyze_fused_dataset(csv_file="rapidapi_fused_dataset.csv", output_file="statistics_report.txt",
+                          language_cache_file="language_cache.sqlite", json_file=None, incremental=False, chunksize=50000,
+                          corpus_dir=None):
+    """
+    Analyzes the fused dataset to generate statistics about the APIs.
+
+    Computes category counts, empty fields, description length and token
+    distributions per category, duplicate rates and the language mix, and
+    saves them as a text report (output_file) and as JSON (json_file,
+    defaults to output_file with a .json extension). csv_file can also be a
+    Parquet file, of which only the three columns used are read. Languages
+    are looked up in (and added to) language_cache_file. Token counts are
+    those of search_index.tokenize, read from the tokenized corpus in
+    corpus_dir when it was built from the same file (see corpus_store).
 
-            f.write("--- Language Analysis ---\n")
-            f.write(f"Total entries with non-English descriptions: {non_english_count}\n\n")
-            f.write("--- Language Breakdown ---\n")
-            f.write(language_counts.to_string())
-            f.write("\n\n")
+    With incremental=True the running totals are kept next to the JSON, and
+    a later run only reads the rows appended to the CSV since then. The
+    totals also keep the SHA-256 of the bytes analyzed; if the CSV no longer
+    starts with them, it was rewritten and everything is recomputed.
 
-            f.write("--- Non-English API Details ---\n")
-            for index, row in non_english_details.iterrows():
-                f.write(f"Row {index}: {row['name']} - Language: {row['language']}\n")
+    Returns:
+        dict: The report, as saved to the JSON file.
+    """
+    print(f"📊 Analyzing '{csv_file}'...")
+
+    if not os.path.exists(csv_file):
+        print(f"❌ Error: The file '{csv_file}' was not found.")
+        return
 
+    json_file = json_file or os.path.splitext(output_file)[0] + ".json"
+    state_file, hashes_file = _state_files(json_file)
+
+    try:
+        csv_bytes = os.path.getsize(csv_file)
+        csv_sha256 = None
+        total, hashes = None, {'name': np.empty(0, dtype=np.uint64), 'description': np.empty(0, dtype=np.uint64)}
+        if incremental and os.path.exists(state_file) and os.path.exists(hashes_file):
+            with open(state_file, 'r', encoding='utf-8') as f:
+                total = json.load(f)
+            analyzed_sha256, csv_sha256 = prefix_sha256s(csv_file, [total['csv_bytes'], csv_bytes])
+            if analyzed_sha256 is None or analyzed_sha256 != total.get('csv_sha256'):
+                print("   ⚠️ CSV was rewritten since the last run, recomputing all statistics")
+                total = None
+            else:
+                with np.load(hashes_file) as saved:
+                    hashes = {column: saved[column] for column in saved.files}
+        if total is None:
+            total = {'rows': 0, 'categories': {}, 'empty': {'name': {}, 'description': {}}, 'description_length': {},
+                     'description_tokens': {}, 'languages': {}, 'non_english_by_category': {},
+                     'duplicates': {'name': 0, 'description': 0}, 'non_english_rows': []}
+
+        corpus = None
+        if corpus_dir is not None:
+            from corpus_store import corpus_for
+            csv_sha256 = csv_sha256 or prefix_sha256s(csv_file, [csv_bytes])[0]
+            corpus = corpus_for(csv_file, corpus_dir, source_sha256=csv_sha256)
+        description_tokens = corpus.row_lengths('description') if corpus is not None else None
+
+        previous_rows = total['rows']
+        reader = iter_dataset_chunks(csv_file, chunksize=chunksize, columns=['name', 'category', 'description'],
+                                     skip_rows=previous_rows)
+        for chunk in reader:
+            if chunk.empty:
+                continue
+            token_counts = None
+            if description_tokens is not None:
+                token_counts = description_tokens[total['rows']:total['rows'] + len(chunk)]
+            stats, chunk_hashes = compute_chunk_stats(chunk, first_row=total['rows'],
+                                                      language_cache_file=language_cache_file, seen_hashes=hashes,
+                                                      token_counts=token_counts)
+            merge_stats(total, stats)
+            hashes = {column: np.concatenate([hashes[column], chunk_hashes[column]]) for column in hashes}
+        metrics.count('stats.rows', total['rows'] - previous_rows)
+        print(f"   {total['rows'] - previous_rows} new rows analyzed ({total['rows']} in total)")
+
+        summary = summarize_stats(total)
+
+        print(f"💾 Saving analysis to '{output_file}' and '{json_file}'...")
+        write_text_report(summary, output_file)
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+
+        if incremental:
+            total['csv_bytes'] = csv_bytes
+            total['csv_sha256'] = csv_sha256 or prefix_sha256s(csv_file, [csv_bytes])[0]
+            with open(state_file, 'w', encoding='utf-8') as f:
+                json.dump(total, f, ensure_ascii=False)
+            np.savez(hashes_file, **hashes)
 
         print("✅ Analysis complete!")
+        return summary
 
     except Exception as e:
         print(f"❌ An error occurred during analysis: {e}")
@@ -90,5 +326,6 @@ if __name__ == "__main__":
     # Construct the full path to the CSV file
     csv_path = os.path.join(script_dir, "rapidapi_fused_dataset_clean.csv")
     output_path = os.path.join(script_dir, "statistics_report_en_clean.txt")
-    
-    analyze_fused_dataset(csv_file=csv_path, output_file=output_path)
\ No newline at end of file
+    language_cache_path = os.path.join(script_dir, "language_cache.sqlite")
+
+    analyze_fused_dataset(csv_file=csv_path, output_file=output_path, language_cache_file=language_cache_path)
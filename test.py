@@ -1,15 +1,9 @@
-import requests
-import xml.etree.ElementTree as ET
+from sitemap import SitemapCache, crawl_sitemap
 
 def extract_from_sitemap(sitemap_url):
-    response = requests.get(sitemap_url)
-    root = ET.fromstring(response.content)
-    
-    urls = []
-    for url in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc'):
-        urls.append(url.text)
-    
-    return urls
+    # Conditional refresh of the local copy, then a streaming parse (sitemap indexes are followed)
+    urls, _ = crawl_sitemap(sitemap_url, SitemapCache())
+    return list(urls)
 
 # Get all API-related URLs
 api_urls = extract_from_sitemap("https://rapidapi.com/sitemap-category.xml")
@@ -0,0 +1,137 @@
+import argparse
+import json
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.metrics import accuracy_score, classification_report
+from sklearn.model_selection import StratifiedKFold, cross_val_predict
+from sklearn.pipeline import Pipeline
+from sklearn.svm import LinearSVC
+
+from metrics import peak_rss_mb
+
+def build_text(df):
+    """Text the classifier sees for each API: its name followed by its description"""
+    return (df['name'].fillna('').astype(str) + ". " + df['description'].fillna('').astype(str)).tolist()
+
+def build_pipeline(features="tfidf", max_features=50000, hash_bits=18, C=0.5):
+    """
+    Builds the sparse-feature linear classifier.
+
+    Args:
+        features (str): "tfidf" for a TF-IDF vocabulary of word 1-2 grams, or
+            "hashing" for hashed 1-2 grams, which needs no vocabulary.
+        max_features (int): Vocabulary size for "tfidf".
+        hash_bits (int): Number of hashed features is 2**hash_bits for "hashing".
+        C (float): Regularization strength of the linear SVM.
+    """
+    if features == "tfidf":
+        vectorizer = [('tfidf', TfidfVectorizer(ngram_range=(1, 2), min_df=2, max_features=max_features,
+                                                sublinear_tf=True, dtype=np.float32))]
+    elif features == "hashing":
+        vectorizer = [
+            ('hashing', HashingVectorizer(ngram_range=(1, 2), n_features=2 ** hash_bits, alternate_sign=False,
+                                          norm=None, dtype=np.float32)),
+            ('tfidf', TfidfTransformer(sublinear_tf=True))
+        ]
+    else:
+        raise ValueError(f"Unknown feature type '{features}', expected 'tfidf' or 'hashing'")
+    return Pipeline(vectorizer + [('classifier', LinearSVC(C=C))])
+
+def compact_model(pipeline):
+    """Store the linear model weights as float32 to halve the artifact size"""
+    classifier = pipeline.named_steps['classifier']
+    classifier.coef_ = classifier.coef_.astype(np.float32)
+    classifier.intercept_ = classifier.intercept_.astype(np.float32)
+    return pipeline
+
+def train_category_classifier(csv_file="rapidapi_fused_dataset_clean.csv", model_file="category_model.joblib",
+                              features="tfidf", folds=5, n_jobs=-1, min_category_size=10):
+    """
+    Trains the API category classifier and saves it with its evaluation.
+
+    Runs stratified cross-validation with the folds in parallel (n_jobs) to
+    measure per-category precision and recall, then fits the final model on
+    all rows and saves it with joblib. The metrics are saved next to the
+    model as JSON.
+
+    Args:
+        csv_file (str): The clean dataset with 'name', 'category' and 'description'.
+        model_file (str): Where to save the trained model.
+        features (str): "tfidf" or "hashing", see build_pipeline.
+        folds (int): Number of cross-validation folds, 0 to skip evaluation.
+        n_jobs (int): Parallel cross-validation jobs, -1 for all cores.
+        min_category_size (int): Categories with fewer APIs are left out.
+
+    Returns:
+        dict: The training metrics.
+    """
+    print(f"🧠 Training category classifier on '{csv_file}'...")
+    if not os.path.exists(csv_file):
+        print(f"❌ Error: Input file '{csv_file}' not found.")
+        return None
+
+    df = pd.read_csv(csv_file)
+    df = df.dropna(subset=['category'])
+    category_sizes = df['category'].value_counts()
+    rare = category_sizes[category_sizes < min_category_size].index
+    if len(rare):
+        print(f"   Leaving out {len(rare)} categories with fewer than {min_category_size} APIs: {', '.join(rare)}")
+        df = df[~df['category'].isin(rare)]
+
+    texts = build_text(df)
+    labels = df['category'].to_numpy()
+    print(f"   {len(texts)} APIs in {df['category'].nunique()} categories")
+
+    metrics = {'rows': len(texts), 'categories': int(df['category'].nunique()), 'features': features}
+
+    if folds:
+        start = time.perf_counter()
+        predictions = cross_val_predict(
+            build_pipeline(features), texts, labels,
+            cv=StratifiedKFold(n_splits=folds, shuffle=True, random_state=0), n_jobs=n_jobs
+        )
+        metrics['cv_seconds'] = time.perf_counter() - start
+        metrics['cv_accuracy'] = accuracy_score(labels, predictions)
+        report = classification_report(labels, predictions, output_dict=True, zero_division=0)
+        metrics['per_category'] = {
+            category: {key: report[category][key] for key in ('precision', 'recall', 'f1-score', 'support')}
+            for category in sorted(set(labels))
+        }
+        metrics['macro_f1'] = report['macro avg']['f1-score']
+        print(f"\n--- {folds}-fold cross-validation ({metrics['cv_seconds']:.1f}s) ---")
+        print(classification_report(labels, predictions, zero_division=0))
+
+    start = time.perf_counter()
+    pipeline = compact_model(build_pipeline(features).fit(texts, labels))
+    metrics['train_seconds'] = time.perf_counter() - start
+
+    joblib.dump(pipeline, model_file, compress=3)
+    metrics['model_bytes'] = os.path.getsize(model_file)
+    metrics['peak_memory_mb'] = peak_rss_mb(include_children=True)
+
+    metrics_file = os.path.splitext(model_file)[0] + ".metrics.json"
+    with open(metrics_file, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, indent=2)
+
+    print(f"⏱️  Training wall time: {metrics['train_seconds']:.1f}s")
+    print(f"🧮 Peak memory: {metrics['peak_memory_mb']:.0f} MB")
+    print(f"💾 Model saved to '{model_file}' ({metrics['model_bytes'] / 1024 / 1024:.1f} MB), metrics to '{metrics_file}'")
+    return metrics
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(__file__)
+    parser = argparse.ArgumentParser(description="Train the API category classifier")
+    parser.add_argument("--csv", default=os.path.join(script_dir, "rapidapi_fused_dataset_clean.csv"))
+    parser.add_argument("--model", default=os.path.join(script_dir, "category_model.joblib"))
+    parser.add_argument("--features", choices=["tfidf", "hashing"], default="tfidf")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=-1)
+    args = parser.parse_args()
+
+    train_category_classifier(csv_file=args.csv, model_file=args.model, features=args.features,
+                              folds=args.folds, n_jobs=args.jobs)
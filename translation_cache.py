@@ -0,0 +1,133 @@
+import hashlib
+import sqlite3
+import threading
+import time
+
+def text_hash(text):
+    """Content hash used as the cache key of a text"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+class TranslationCache:
+    """
+    On-disk cache of detected languages and translations, keyed by the
+    SHA-256 of the original text and stored in SQLite.
+
+    English texts are stored with their language only, so a rerun over an
+    unchanged dataset needs neither language detection nor translator calls.
+    Entries older than max_age_days are evicted, and the least recently used
+    ones are dropped once the cache holds more than max_entries.
+
+    Args:
+        path (str): The SQLite database file.
+        max_entries (int): Maximum number of cached texts, or None for no limit.
+        max_age_days (float): Maximum age of an entry, or None for no limit.
+    """
+
+    def __init__(self, path="translation_cache.sqlite", max_entries=200000, max_age_days=180):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                text_hash TEXT PRIMARY KEY,
+                language TEXT,
+                translated_text TEXT,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)")
+        self._conn.commit()
+        self.evict()
+
+    def get(self, text):
+        """
+        Look up a text.
+
+        Returns:
+            tuple: (translated text, language) or None on a cache miss. The
+            translated text is the original text for English entries.
+        """
+        key = text_hash(text)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT language, translated_text FROM translations WHERE text_hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE translations SET last_used = ? WHERE text_hash = ?", (time.time(), key))
+            self._maybe_commit()
+        language, translated_text = row
+        return (text if translated_text is None else translated_text), language
+
+    def put(self, text, translated_text, language):
+        """Store the language of a text and, if it differs, its translation"""
+        now = time.time()
+        stored_text = None if translated_text == text else translated_text
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations (text_hash, language, translated_text, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (text_hash(text), language, stored_text, now, now)
+            )
+            self._maybe_commit()
+
+    def _maybe_commit(self):
+        # Batch commits, one per write is what makes SQLite slow
+        self._pending_writes += 1
+        if self._pending_writes >= 500:
+            self._conn.commit()
+            self._pending_writes = 0
+
+    def evict(self):
+        """Drop expired entries and trim the cache to max_entries. Returns the number removed."""
+        removed = 0
+        with self._lock:
+            if self.max_age_days is not None:
+                cutoff = time.time() - self.max_age_days * 86400
+                removed += self._conn.execute("DELETE FROM translations WHERE created_at < ?", (cutoff,)).rowcount
+            if self.max_entries is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM translations WHERE text_hash IN ("
+                    "SELECT text_hash FROM translations ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+            self._conn.commit()
+            self._pending_writes = 0
+        return removed
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def stats(self):
+        """Return hit/miss counts for this session"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self)
+        }
+
+    def close(self):
+        """Evict, commit and close the database"""
+        if self._conn is None:
+            return
+        self.evict()
+        self._conn.close()
+        self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,117 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+
+class Translator:
+    """
+    Interface of the translation backends used by translate_batch.
+
+    Implementations must be safe to call from several threads at once.
+    """
+
+    name = None
+
+    def translate(self, text):
+        """Translate text to English and return the translation"""
+        raise NotImplementedError
+
+class GoogleTranslatorBackend(Translator):
+    """Google Translate through deep_translator, with one client per worker thread"""
+
+    name = "google"
+
+    def __init__(self, source='auto', target='en'):
+        self.source = source
+        self.target = target
+        self._local = threading.local()
+
+    def translate(self, text):
+        translator = getattr(self._local, 'translator', None)
+        if translator is None:
+            from deep_translator import GoogleTranslator
+            translator = self._local.translator = GoogleTranslator(source=self.source, target=self.target)
+        return translator.translate(text)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Args:
+        rate (float): Tokens added per second, or None for no limit.
+        capacity (float): Maximum burst size, defaults to max(1, rate).
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate or 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it"""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+def translate_batch(texts, translator, max_workers=8, rate_limit=5.0, max_retries=3, backoff=1.0):
+    """
+    Translates many texts through a bounded pool of concurrent workers.
+
+    Identical texts are translated once. Every call to the translator takes
+    a token from a shared token bucket, and failed calls are retried with
+    exponential backoff and jitter.
+
+    Args:
+        texts (list): The texts to translate.
+        translator (Translator): The translation backend.
+        max_workers (int): Number of concurrent translator calls.
+        rate_limit (float): Maximum translator calls per second, or None.
+        max_retries (int): Retries per text after the first failure.
+        backoff (float): Initial retry delay in seconds, doubled per retry.
+
+    Returns:
+        tuple: (list of translations in the same order as texts, with None
+        where translation failed, dict of call statistics)
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    bucket = TokenBucket(rate_limit)
+    stats = {'texts': len(texts), 'unique': len(unique_texts), 'calls': 0, 'retries': 0, 'failed': 0}
+    stats_lock = threading.Lock()
+
+    def translate_one(text):
+        for attempt in range(max_retries + 1):
+            bucket.acquire()
+            with stats_lock:
+                stats['calls'] += 1
+            try:
+                with metrics.timer('translate.call_latency'):
+                    return translator.translate(text)
+            except Exception as e:
+                if attempt == max_retries:
+                    print(f"    ❌ Error during translation: {e}")
+                    with stats_lock:
+                        stats['failed'] += 1
+                    return None
+                with stats_lock:
+                    stats['retries'] += 1
+                time.sleep(backoff * 2 ** attempt * (0.5 + random.random()))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(zip(unique_texts, executor.map(translate_one, unique_texts)))
+    stats['seconds'] = time.perf_counter() - start
+
+    return [results[text] for text in texts], stats
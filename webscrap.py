@@ -8,10 +8,80 @@ import pandas as pd
 import time
 import os
 import re
+import csv
+import json
+import threading
+import queue
 from urllib.parse import quote
+from fetch_backends import FetchBackend, HttpBackend
+import metrics
+
+# Reads name, category and description for every card in one script call,
+# mirroring the selectors and fallbacks of extract_data_from_card.
+# With arguments[0] set, only cards not returned by an earlier call are read
+# (they are tagged with a data-scraped attribute), so each scroll only
+# touches newly loaded cards. A card is only tagged once its name has
+# rendered, so a lazily filled card is read again on the next scroll.
+CARD_EXTRACTION_SCRIPT = """
+const onlyNew = arguments.length > 0 && arguments[0];
+const allCards = document.querySelectorAll('[class*="group/card"]');
+const cards = onlyNew
+    ? document.querySelectorAll('[class*="group/card"]:not([data-scraped])')
+    : allCards;
+const readField = (card, selector, useTitle) => {
+    const el = card.querySelector(selector);
+    if (!el) return null;
+    let value = useTitle ? (el.getAttribute('title') || '').trim() : '';
+    if (!value) value = (el.innerText || '').trim();
+    return value;
+};
+return {
+    total: allCards.length,
+    cards: Array.from(cards, card => {
+        const data = {
+            name: readField(card, '[class*="text-card-primary"][title]', true),
+            category: readField(card, '[class*="max-w-[100px]"]', false),
+            description: readField(card, '[class*="text-card-secondary"][title]', true)
+        };
+        if (onlyNew && data.name) card.setAttribute('data-scraped', '1');
+        return data;
+    })
+};
+"""
+
+# Resources the scraper never needs: it only reads three text fields per card
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*segment.io*", "*segment.com*", "*hotjar.com*", "*facebook.net*",
+    "*intercom.io*", "*intercomcdn.com*", "*fullstory.com*", "*sentry.io*",
+    "*clarity.ms*", "*hubspot.com*", "*linkedin.com/px*"
+]
+
+# Turns off CSS animations and transitions, injected before any page script
+LEAN_PAGE_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = '*, *::before, *::after { animation: none !important; transition: none !important; }';
+    document.head.appendChild(style);
+});
+"""
+
+DRIVER_PROFILES = ("full", "lean")
+
+def create_driver(profile="full"):
+    """Create and return a new Chrome driver instance
+
+    The "full" profile loads every resource like a normal browser. The "lean"
+    profile turns off images, blocks fonts, media and analytics requests and
+    disables CSS animations, which the scraper does not need.
+    """
+    if profile not in DRIVER_PROFILES:
+        raise ValueError(f"Unknown driver profile '{profile}', expected one of {DRIVER_PROFILES}")
 
-def create_driver():
-    """Create and return a new Chrome driver instance"""
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -20,33 +90,168 @@ def create_driver():
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if profile == "lean":
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        # Return from driver.get once the DOM is ready, the cards are waited for anyway
+        chrome_options.page_load_strategy = "eager"
     
     driver = webdriver.Chrome(options=chrome_options)
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if profile == "lean":
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": LEAN_PAGE_SCRIPT})
+    else:
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
     return driver
 
-def scroll_and_load(driver, scroll_pause_time=2):
-    """Scrolls to the last element to trigger loading more content."""
+# Scrolls the last card into view and resolves as soon as the DOM reports
+# new cards (MutationObserver), once they stop arriving for settleMs, or
+# after timeoutMs without any new card.
+SCROLL_AND_WAIT_SCRIPT = """
+const [timeoutMs, settleMs, maxSettleMs] = arguments;
+const done = arguments[arguments.length - 1];
+const selector = '[class*="group/card"]';
+const cards = document.querySelectorAll(selector);
+const before = cards.length;
+if (!before) {
+    done({loaded: 0, total: 0, latency: 0});
+    return;
+}
+const start = performance.now();
+let grownAt = null;
+let settleTimer = null;
+let finished = false;
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timeoutTimer);
+    clearTimeout(settleTimer);
+    const total = document.querySelectorAll(selector).length;
+    done({loaded: total - before, total: total, latency: (grownAt === null ? performance.now() : grownAt) - start});
+};
+const observer = new MutationObserver(() => {
+    if (document.querySelectorAll(selector).length <= before) return;
+    if (grownAt === null) {
+        grownAt = performance.now();
+        setTimeout(finish, maxSettleMs);
+    }
+    clearTimeout(settleTimer);
+    settleTimer = setTimeout(finish, settleMs);
+});
+observer.observe(document.body, {childList: true, subtree: true});
+const timeoutTimer = setTimeout(finish, timeoutMs);
+cards[before - 1].scrollIntoView(true);
+"""
+
+class ScrollPacer:
+    """
+    Adapts how long scroll_and_load waits for new cards.
+
+    The wait timeout follows how fast cards have been arriving (a multiple
+    of the moving average load latency, clamped to [min_timeout,
+    max_timeout]) and doubles after every scroll that loads nothing, so a
+    slow site gets more time while a fast one is not held up. Load latencies
+    are kept for the end-of-run report.
+
+    Args:
+        min_timeout (float): Lower bound of the wait, in seconds.
+        max_timeout (float): Upper bound of the wait before backoff, in seconds.
+        latency_factor (float): Timeout as a multiple of the average latency.
+        max_backoff (int): Cap of the backoff multiplier.
+    """
+
+    def __init__(self, min_timeout=2.0, max_timeout=15.0, latency_factor=4.0, max_backoff=4):
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.latency_factor = latency_factor
+        self.max_backoff = max_backoff
+        self.latencies = []
+        self.timeouts = 0
+        self._average_latency = None
+        self._backoff = 1
+
+    @property
+    def timeout(self):
+        """Seconds to wait for new cards on the next scroll"""
+        if self._average_latency is None:
+            base = self.max_timeout
+        else:
+            base = min(max(self._average_latency * self.latency_factor, self.min_timeout), self.max_timeout)
+        return base * self._backoff
+
+    def record_load(self, latency):
+        """Record a scroll that loaded new cards after latency seconds"""
+        self.latencies.append(latency)
+        metrics.observe('scrape.scroll_latency', latency)
+        if self._average_latency is None:
+            self._average_latency = latency
+        else:
+            self._average_latency = 0.7 * self._average_latency + 0.3 * latency
+        self._backoff = 1
+
+    def record_timeout(self):
+        """Record a scroll that loaded nothing before the timeout"""
+        self.timeouts += 1
+        metrics.count('scrape.scroll_timeouts')
+        self._backoff = min(self._backoff * 2, self.max_backoff)
+
+    def stats(self):
+        """Return per-scroll load latency statistics in seconds"""
+        if not self.latencies:
+            return {'scrolls_loaded': 0, 'timeouts': self.timeouts}
+        ordered = sorted(self.latencies)
+        return {
+            'scrolls_loaded': len(ordered),
+            'timeouts': self.timeouts,
+            'mean': sum(ordered) / len(ordered),
+            'p50': ordered[len(ordered) // 2],
+            'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            'max': ordered[-1]
+        }
+
+def scroll_and_load(driver, scroll_pause_time=2, pacer=None):
+    """
+    Scrolls to the last element to trigger loading more content.
+
+    Instead of polling and then sleeping, it returns as soon as new cards
+    have been added to the DOM and have stopped arriving for a moment
+    (at most scroll_pause_time seconds of settling).
+
+    Returns:
+        int: The number of cards that were loaded (0 at the end of the feed).
+    """
+    pacer = pacer or ScrollPacer()
+    timeout = pacer.timeout
+    settle = min(0.3, scroll_pause_time)
     try:
-        # Get current number of cards
-        card_selector = '[class*="group/card"]'
-        num_cards_before = len(driver.find_elements(By.CSS_SELECTOR, card_selector))
-
-        # Find the last card and scroll to it
-        all_cards = driver.find_elements(By.CSS_SELECTOR, card_selector)
-        if all_cards:
-            last_card = all_cards[-1]
-            driver.execute_script("arguments[0].scrollIntoView(true);", last_card)
-            print("    ⏬ Scrolling to last card to load more APIs...")
-
-            # Wait for new cards to load
-            WebDriverWait(driver, 15).until(
-                lambda d: len(d.find_elements(By.CSS_SELECTOR, card_selector)) > num_cards_before
-            )
-            time.sleep(scroll_pause_time) # Extra pause for content to settle
+        print(f"    ⏬ Scrolling to last card to load more APIs (waiting up to {timeout:.1f}s)...")
+        driver.set_script_timeout(timeout + scroll_pause_time + 5)
+        result = driver.execute_async_script(
+            SCROLL_AND_WAIT_SCRIPT, int(timeout * 1000), int(settle * 1000), int(scroll_pause_time * 1000)
+        )
     except Exception:
         print("    ⚠️  Could not scroll or find new cards. Reached end of page or content failed to load.")
+        pacer.record_timeout()
+        return 0
+
+    if result['loaded'] > 0:
+        pacer.record_load(result['latency'] / 1000)
+        print(f"    ⏱️  {result['loaded']} new cards after {result['latency'] / 1000:.2f}s")
+    else:
+        pacer.record_timeout()
+        print("    ⚠️  No new cards loaded. Reached end of page or content failed to load.")
+    return result['loaded']
 
 def extract_api_cards(driver):
     """Extract all API cards from the current page"""
@@ -113,6 +318,57 @@ def extract_data_from_card(card_element):
         print(f"    ❌ Error extracting card data: {e}")
         return None
 
+def _run_card_extraction_script(driver, only_new):
+    """Run CARD_EXTRACTION_SCRIPT and return (cards data, total cards on page)"""
+    # Wait for cards to be present
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="group/card"]'))
+        )
+    except:
+        print("  ⚠️  No API cards found on page")
+        return [], 0
+
+    result = driver.execute_script(CARD_EXTRACTION_SCRIPT, only_new) or {}
+    extracted = []
+    for data in result.get('cards', []):
+        if not data or not data.get('name'):
+            extracted.append(None)
+        else:
+            extracted.append({
+                'name': data['name'],
+                'category': data.get('category'),
+                'description': data.get('description')
+            })
+    return extracted, result.get('total', len(extracted))
+
+def extract_all_cards_data(driver):
+    """
+    Extract name, category, and description from every API card on the page
+    with a single script execution instead of several WebDriver calls per card.
+
+    Returns:
+        list: One entry per card, in page order. Cards without a name are
+        returned as None, like extract_data_from_card does.
+    """
+    extracted, _ = _run_card_extraction_script(driver, only_new=False)
+    print(f"  📊 Found {len(extracted)} API cards on current page")
+    return extracted
+
+def extract_new_cards_data(driver):
+    """
+    Like extract_all_cards_data, but only reads cards that no earlier call
+    has returned. Cards are tagged in the DOM once read, so the cost of each
+    call depends on how many cards were loaded since the last one, not on
+    how long the page has become.
+
+    Returns:
+        tuple: (list of new card data, total number of cards on the page)
+    """
+    extracted, total_cards = _run_card_extraction_script(driver, only_new=True)
+    print(f"  📊 Found {total_cards} API cards on current page ({len(extracted)} new)")
+    return extracted, total_cards
+
 def append_api_data_to_csv(data, filename="rapidapi_search_dataset.csv"):
     """Append a single API data record to CSV file"""
     # Convert single record to DataFrame
@@ -125,71 +381,332 @@ def append_api_data_to_csv(data, filename="rapidapi_search_dataset.csv"):
     df_single.to_csv(filename, mode='a', header=not file_exists, index=False)
     print(f"    💾 Saved: {data['name']}")
 
-def scrape_rapidapi_search_page(category=None, max_apis=None, scroll_delay=2, output_csv_prefix="rapidapi_apis"):
-    """Scrape API data from RapidAPI search page with infinite scroll"""
+def get_output_csv(category=None, output_csv_prefix="rapidapi_apis"):
+    """Return the per-category CSV filename used by the scraper"""
+    if category:
+        sanitized_category = category.replace('/', '_').replace(' ', '')
+        return f"{output_csv_prefix}_{sanitized_category}.csv"
+    return f"{output_csv_prefix}_all.csv"
+
+def is_driver_alive(driver):
+    """Return True if the Chrome session still answers WebDriver commands"""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+def get_checkpoint_file(output_csv):
+    """Return the checkpoint filename that belongs to an output CSV"""
+    return f"{output_csv}.checkpoint.json"
+
+def load_checkpoint(output_csv):
+    """Load the checkpoint of an output CSV, or None if there is none"""
+    checkpoint_file = get_checkpoint_file(output_csv)
+    if not os.path.exists(checkpoint_file):
+        return None
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"    ⚠️  Ignoring unreadable checkpoint {checkpoint_file}: {e}")
+        return None
+
+def save_checkpoint(output_csv, checkpoint):
+    """Atomically write the checkpoint of an output CSV"""
+    checkpoint_file = get_checkpoint_file(output_csv)
+    tmp_file = checkpoint_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_file, checkpoint_file)
+
+def load_saved_apis(output_csv, checkpoint=None):
+    """
+    Load the records already saved in an output CSV so a scrape can resume.
+
+    If a checkpoint is given, anything written after its last durable flush
+    (e.g. a row torn by a crash) is truncated away first.
+
+    Returns:
+        list: The saved records, in file order.
+    """
+    if not os.path.exists(output_csv):
+        return []
+    if checkpoint and 'bytes' in checkpoint and os.path.getsize(output_csv) > checkpoint['bytes']:
+        with open(output_csv, 'r+b') as f:
+            f.truncate(checkpoint['bytes'])
+    with open(output_csv, 'r', newline='', encoding='utf-8') as f:
+        return [row for row in csv.DictReader(f) if row.get('name')]
+
+class BufferedCsvWriter:
+    """
+    Streams API records to a CSV file in batches.
+
+    Records are buffered and written once batch_size records are pending or
+    flush_interval seconds have passed since the last write, so a crash loses
+    at most one batch. The header is written only when the file is new or
+    empty, and the file is fsynced when the writer is closed.
+
+    Args:
+        filename (str): The CSV file to append to.
+        fieldnames (list): Column order of the CSV.
+        batch_size (int): Number of buffered records that triggers a flush.
+        flush_interval (float): Maximum seconds between flushes.
+        checkpoint (dict): If given, this state is saved with save_checkpoint
+            after every flush, together with the number of durable bytes.
+    """
+
+    def __init__(self, filename, fieldnames=('name', 'category', 'description'), batch_size=100, flush_interval=5.0, checkpoint=None):
+        self.filename = filename
+        self.checkpoint = checkpoint
+        self.fieldnames = list(fieldnames)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self._buffer = []
+        self._last_flush = time.monotonic()
+
+        write_header = not os.path.isfile(filename) or os.path.getsize(filename) == 0
+        # Same line terminator and quoting as DataFrame.to_csv
+        self._file = open(filename, 'a', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, lineterminator=os.linesep, extrasaction='ignore')
+        if write_header:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def write(self, data):
+        """Buffer one record, flushing if the batch is full or the interval has passed"""
+        self._buffer.append(data)
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered records to the file"""
+        if self._buffer:
+            self._writer.writerows(self._buffer)
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+        self._file.flush()
+        if self.checkpoint is not None:
+            # The checkpoint may only point at bytes that are on disk
+            os.fsync(self._file.fileno())
+            self.checkpoint['bytes'] = self._file.tell()
+            save_checkpoint(self.filename, self.checkpoint)
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        """Flush pending records, fsync and close the file"""
+        if self._file.closed:
+            return
+        self.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def discard(self):
+        """Close the file without writing the buffered records or saving the checkpoint"""
+        self._buffer = []
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class SeleniumBackend(FetchBackend):
+    """
+    Fetches cards by scrolling the search page in headless Chrome.
+
+    If a driver is passed in it is reused and left open for the caller,
+    otherwise one with the given profile is created on first use and quit
+    by close(). With bulk_extract, card fields are read with one script call
+    per scroll, falling back to per-card extraction if the script fails.
+    Scrolling stops after max_empty_scrolls scrolls in a row load no new
+    cards; waits between scrolls adapt to the site, see ScrollPacer.
+    """
+
+    name = "selenium"
+
+    def __init__(self, driver=None, profile="full", scroll_delay=2, bulk_extract=True, max_empty_scrolls=5):
+        self.driver = driver
+        self.profile = profile
+        self.scroll_delay = scroll_delay
+        self.bulk_extract = bulk_extract
+        self.max_empty_scrolls = max_empty_scrolls
+        self.owns_driver = driver is None
+        self.pacer = ScrollPacer()
+        self.scroll_count = 0
+        self.total_cards_skipped = 0
+
+    def iter_card_batches(self, search_url):
+        if self.driver is None:
+            self.driver = create_driver(self.profile)
+        driver = self.driver
+
+        # Navigate to search page
+        print(f"🌐 Loading search page: {search_url}")
+        driver.get(search_url)
+        
+        # Wait for the first cards instead of a fixed delay
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="group/card"]'))
+            )
+        except Exception:
+            print("  ⚠️  No API cards appeared after page load")
+
+        self.pacer = ScrollPacer()
+        self.scroll_count = 0
+        self.total_cards_skipped = 0
+        bulk_extract = self.bulk_extract
+        consecutive_no_new_apis = 0
+        processed_cards = 0  # High-water mark of cards already read
+        print("🔄 Starting infinite scroll...")
+        
+        while consecutive_no_new_apis < self.max_empty_scrolls:
+            self.scroll_count += 1
+            metrics.count('scrape.scrolls')
+            print(f"\n📜 Scroll #{self.scroll_count}")
+            
+            # Extract only the cards loaded since the previous scroll
+            cards_data = None
+            with metrics.timer('scrape.extract_seconds'):
+                if bulk_extract:
+                    try:
+                        cards_data, cards_on_page = extract_new_cards_data(driver)
+                    except Exception as e:
+                        print(f"  ⚠️  Bulk extraction failed, falling back to per-card extraction: {e}")
+                        bulk_extract = False
+                if cards_data is None:
+                    cards = extract_api_cards(driver)
+                    cards_on_page = len(cards)
+                    # Cards before the high-water mark were processed on earlier scrolls
+                    cards_data = [extract_data_from_card(card) for card in cards[processed_cards:]]
+                    cards_skipped = min(processed_cards, cards_on_page)
+                else:
+                    cards_skipped = cards_on_page - len(cards_data)
+            processed_cards = max(processed_cards, cards_on_page)
+            self.total_cards_skipped += cards_skipped
+
+            yield cards_data
+
+            print(f"    ⏭️  Cards skipped (already processed): {cards_skipped} of {cards_on_page}")
+            
+            # Check if the page is still loading new cards. This does not
+            # depend on whether their APIs were saved before, so a resumed
+            # run keeps scrolling past the part it already has.
+            if not any(data and data['name'] for data in cards_data):
+                consecutive_no_new_apis += 1
+                print(f"    ⚠️  No new APIs found ({consecutive_no_new_apis}/{self.max_empty_scrolls})")
+            else:
+                consecutive_no_new_apis = 0
+            
+            # Scroll to trigger loading more content
+            scroll_and_load(driver, scroll_pause_time=self.scroll_delay, pacer=self.pacer)
+
+    def report(self):
+        print(f"   📜 Total scrolls: {self.scroll_count}")
+        print(f"   ⏭️  Card reads skipped: {self.total_cards_skipped}")
+        latency = self.pacer.stats()
+        if latency['scrolls_loaded']:
+            print(f"   ⏱️  Scroll load latency: p50 {latency['p50']:.2f}s, p95 {latency['p95']:.2f}s, "
+                  f"max {latency['max']:.2f}s ({latency['timeouts']} empty scrolls)")
+
+    def close(self):
+        if self.owns_driver and self.driver:
+            self.driver.quit()
+            self.driver = None
+
+FETCH_BACKENDS = {
+    SeleniumBackend.name: SeleniumBackend,
+    HttpBackend.name: HttpBackend
+}
+
+def scrape_rapidapi_search_page(category=None, max_apis=None, scroll_delay=2, output_csv_prefix="rapidapi_apis", driver=None, bulk_extract=True, resume=False,
+                                max_empty_scrolls=5, base_url="https://rapidapi.com", profile="full", backend="selenium", stop_event=None):
+    """Scrape API data from RapidAPI search page with infinite scroll
+
+    Cards come from a fetch backend: "selenium" (the default, see
+    SeleniumBackend for driver, profile, scroll_delay, bulk_extract and
+    max_empty_scrolls), "http" (see fetch_backends.HttpBackend), or any
+    FetchBackend instance, which is left open for the caller.
+    With resume, APIs already saved by an interrupted run are reloaded from
+    the output CSV and its checkpoint and skipped, and new ones are appended,
+    instead of deleting the output and starting over.
+    base_url can point the scraper at a local copy of the site.
+    stop_event is checked between batches: once it is set, the scrape stops
+    without writing the buffered APIs or marking the category complete, and
+    the output CSV and checkpoint are left as they were at the last flush.
+    """
     
     print("🚀 Starting RapidAPI Search Page Scraper")
     print("=" * 60)
     
-    driver = None
+    owns_backend = not isinstance(backend, FetchBackend)
+    writer = None
     try:
-        # Create driver
-        driver = create_driver()
-        
         # Build URL and output filename based on category
         if category:
             print(f"\n{'='*20} Scraping Category: {category} {'='*20}")
             encoded_category = quote(category, safe='')
-            search_url = f"https://rapidapi.com/search/{encoded_category}?sortBy=ByRelevance"
-            sanitized_category = category.replace('/', '_').replace(' ', '')
-            output_csv = f"{output_csv_prefix}_{sanitized_category}.csv"
+            search_url = f"{base_url}/search/{encoded_category}?sortBy=ByRelevance"
         else:
-            search_url = "https://rapidapi.com/search?sortBy=ByRelevance"
-            output_csv = f"{output_csv_prefix}_all.csv"
+            search_url = f"{base_url}/search?sortBy=ByRelevance"
+        output_csv = get_output_csv(category, output_csv_prefix)
 
-        # Navigate to search page
-        print(f"🌐 Loading search page: {search_url}")
-        driver.get(search_url)
-        
-        # Wait for page to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        time.sleep(3)  # Additional wait for initial content
-
-        # Clear existing file for this category
-        if os.path.exists(output_csv):
-            os.remove(output_csv)
-        
         all_extracted_data = []
         unique_apis = set()  # To avoid duplicates
-        scroll_count = 0
-        consecutive_no_new_apis = 0
+        checkpoint = load_checkpoint(output_csv) if resume else None
+
+        if resume and os.path.exists(output_csv):
+            all_extracted_data = load_saved_apis(output_csv, checkpoint)
+            unique_apis = {data['name'].lower().strip() for data in all_extracted_data}
+            print(f"♻️  Resuming: {len(unique_apis)} APIs already saved in {output_csv}")
+            if checkpoint and checkpoint.get('completed'):
+                print(f"✅ {output_csv} is already complete, nothing to do")
+                return all_extracted_data
+        else:
+            # Clear existing file and checkpoint for this category
+            if os.path.exists(output_csv):
+                os.remove(output_csv)
+            checkpoint = None
+            if os.path.exists(get_checkpoint_file(output_csv)):
+                os.remove(get_checkpoint_file(output_csv))
+
+        if checkpoint is None:
+            checkpoint = {'category': category, 'completed': False}
+        writer = BufferedCsvWriter(output_csv, checkpoint=checkpoint)
+
+        if owns_backend:
+            if backend not in FETCH_BACKENDS:
+                raise ValueError(f"Unknown fetch backend '{backend}', expected one of {list(FETCH_BACKENDS)}")
+            if backend == SeleniumBackend.name:
+                backend = SeleniumBackend(driver=driver, profile=profile, scroll_delay=scroll_delay,
+                                          bulk_extract=bulk_extract, max_empty_scrolls=max_empty_scrolls)
+            else:
+                backend = FETCH_BACKENDS[backend]()
         
         if max_apis:
             print(f"🎯 Target: {max_apis} APIs")
         else:
             print("🎯 Target: All available APIs")
-        print("🔄 Starting infinite scroll...")
         
-        while consecutive_no_new_apis < 5:
-            # Break if we've hit the max_apis limit (if one is set)
-            if max_apis and len(unique_apis) >= max_apis:
-                break
-
-            scroll_count += 1
-            print(f"\n📜 Scroll #{scroll_count}")
-            
-            # Extract cards from current view
-            cards = extract_api_cards(driver)
+        batches = backend.iter_card_batches(search_url)
+        if max_apis and len(unique_apis) >= max_apis:
+            batches = []
+        
+        for cards_data in batches:
+            if stop_event is not None and stop_event.is_set():
+                print("🛑 Stop requested, leaving the category unfinished")
+                writer.discard()
+                return all_extracted_data
             new_apis_found = 0
+            metrics.count('scrape.cards', len(cards_data))
             
-            for i, card in enumerate(cards):
+            for data in cards_data:
                 if max_apis and len(unique_apis) >= max_apis:
                     break
-                    
-                data = extract_data_from_card(card)
                 
                 if data and data['name']:
                     # Create a unique identifier for the API
@@ -200,27 +717,29 @@ def scrape_rapidapi_search_page(category=None, max_apis=None, scroll_delay=2, ou
                         all_extracted_data.append(data)
                         new_apis_found += 1
                         
-                        # Save immediately to CSV
-                        append_api_data_to_csv(data, output_csv)
+                        # Buffered write, flushed in batches
+                        writer.write(data)
                         
                         print(f"    ✅ {len(unique_apis)}. {data['name']}")
             
+            metrics.count('scrape.apis', new_apis_found)
             print(f"    📈 New APIs this scroll: {new_apis_found}")
             print(f"    📊 Total unique APIs: {len(unique_apis)}")
-            
-            # Check if we're still finding new APIs
-            if new_apis_found == 0:
-                consecutive_no_new_apis += 1
-                print(f"    ⚠️  No new APIs found ({consecutive_no_new_apis}/5)")
-            else:
-                consecutive_no_new_apis = 0
-            
-            # Scroll to trigger loading more content
-            scroll_and_load(driver, scroll_pause_time=scroll_delay)
+
+            # Break if we've hit the max_apis limit (if one is set)
+            if max_apis and len(unique_apis) >= max_apis:
+                break
         
+        # Mark the category as complete so a resumed run skips it, unless
+        # we only stopped because of max_apis
+        writer.close()
+        checkpoint['completed'] = not (max_apis and len(unique_apis) >= max_apis)
+        save_checkpoint(output_csv, checkpoint)
+        metrics.count('scrape.categories')
+
         print(f"\n🎉 Scraping completed!")
         print(f"   📊 Total APIs extracted: {len(unique_apis)}")
-        print(f"   📜 Total scrolls: {scroll_count}")
+        backend.report()
         print(f"   💾 Data saved to: {output_csv}")
         
         return all_extracted_data
@@ -229,8 +748,10 @@ def scrape_rapidapi_search_page(category=None, max_apis=None, scroll_delay=2, ou
         print(f"❌ Error during scraping: {e}")
         return []
     finally:
-        if driver:
-            driver.quit()
+        if writer:
+            writer.close()
+        if owns_backend and isinstance(backend, FetchBackend):
+            backend.close()
 
 def analyze_dataset(csv_file="rapidapi_search_dataset.csv"):
     """Analyze the scraped dataset"""
@@ -278,24 +799,193 @@ def quick_search_test(max_apis=200, scroll_delay=1):
     analyze_dataset(output_file)
     return data
 
-def scrape_categories(categories_to_scrape, scroll_delay=2):
-    """Loop through a list of categories and scrape each one."""
+def scrape_categories(categories_to_scrape, scroll_delay=2, num_drivers=1, resume=False, profile="full", backend="selenium"):
+    """Loop through a list of categories and scrape each one.
+
+    All categories are scraped in one long-lived browser session, which is
+    only restarted if Chrome crashes. With num_drivers > 1 the categories
+    are handed out to a pool of drivers instead, see
+    scrape_categories_parallel. With resume, finished categories are
+    skipped and interrupted ones continue where they stopped. profile
+    selects the driver profile, see create_driver. With backend="http" no
+    browser is started at all, see fetch_backends.HttpBackend.
+    """
+    if num_drivers > 1:
+        return scrape_categories_parallel(categories_to_scrape, num_drivers=num_drivers, scroll_delay=scroll_delay, resume=resume, profile=profile,
+                                          backend=backend)
+
     print("🚀 Starting Multi-Category Scraping")
     print("=" * 50)
     total_categories = len(categories_to_scrape)
 
-    for i, category in enumerate(categories_to_scrape):
-        print(f"\nProcessing category {i+1} of {total_categories}...")
-        scrape_rapidapi_search_page(
-            category=category,
-            max_apis=None, 
-            scroll_delay=scroll_delay
-        )
-        print(f"✅ Finished scraping for category: {category}")
-        # Optional: add a pause between categories
-        if i < total_categories - 1:
-            print("\nPausing for 5 seconds before next category...")
-            time.sleep(5)
+    driver = None
+    try:
+        for i, category in enumerate(categories_to_scrape):
+            print(f"\nProcessing category {i+1} of {total_categories}...")
+            if driver is not None and not is_driver_alive(driver):
+                print("    ⚠️  Chrome crashed, restarting driver...")
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                driver = None
+            if driver is None and backend == SeleniumBackend.name:
+                driver = create_driver(profile)
+            scrape_rapidapi_search_page(
+                category=category,
+                max_apis=None, 
+                scroll_delay=scroll_delay,
+                driver=driver,
+                resume=resume,
+                backend=backend
+            )
+            print(f"✅ Finished scraping for category: {category}")
+    finally:
+        if driver:
+            driver.quit()
+
+def scrape_categories_parallel(categories_to_scrape, num_drivers=4, scroll_delay=2,
+                               output_csv_prefix="rapidapi_apis", max_retries=2,
+                               summary_csv="rapidapi_scrape_summary.csv", resume=False, profile="full", backend="selenium"):
+    """
+    Scrapes categories with a pool of long-lived Chrome drivers.
+
+    Each worker thread owns one driver and keeps it across categories. If a
+    driver dies while scraping, it is quit and recreated and the category is
+    put back on the queue (up to max_retries times), so one crash does not
+    stop the rest of the run. A category whose checkpoint is not complete
+    after the scrape is retried the same way. Retries resume from the
+    category's checkpoint. With another backend no driver is started and
+    each worker scrapes with its own backend instance.
+
+    Args:
+        categories_to_scrape (list): Category names to scrape.
+        num_drivers (int): Number of Chrome drivers (worker threads).
+        scroll_delay (int): Pause after each scroll, passed to the scraper.
+        output_csv_prefix (str): Prefix of the per-category CSV files.
+        max_retries (int): How many times a category is retried after a crash.
+        summary_csv (str): Path of the combined summary CSV, or None to skip it.
+        resume (bool): Resume categories from an earlier, interrupted run.
+        profile (str): Driver profile, "full" or "lean" (see create_driver).
+        backend (str): Fetch backend name, see scrape_rapidapi_search_page.
+
+    Returns:
+        pd.DataFrame: One summary row per category.
+    """
+    uses_driver = backend == SeleniumBackend.name
+    print(f"🚀 Starting Parallel Multi-Category Scraping with {num_drivers} {'drivers' if uses_driver else backend + ' workers'}")
+    print("=" * 50)
+
+    tasks = queue.Queue()
+    for category in categories_to_scrape:
+        tasks.put((category, 0))
+
+    summary = {}
+    summary_lock = threading.Lock()
+
+    def worker(worker_id):
+        driver = None
+        try:
+            while True:
+                try:
+                    category, attempt = tasks.get_nowait()
+                except queue.Empty:
+                    break
+
+                if driver is None and uses_driver:
+                    try:
+                        driver = create_driver(profile)
+                    except Exception as e:
+                        print(f"❌ [driver {worker_id}] Could not start Chrome: {e}")
+                        tasks.put((category, attempt))
+                        break
+
+                print(f"\n[driver {worker_id}] Processing category: {category} (attempt {attempt + 1})")
+                start = time.time()
+                data = scrape_rapidapi_search_page(
+                    category=category,
+                    max_apis=None,
+                    scroll_delay=scroll_delay,
+                    output_csv_prefix=output_csv_prefix,
+                    driver=driver,
+                    resume=resume or attempt > 0,
+                    profile=profile,
+                    backend=backend
+                )
+                elapsed = time.time() - start
+
+                if uses_driver and not is_driver_alive(driver):
+                    print(f"    ⚠️  [driver {worker_id}] Chrome crashed, restarting driver...")
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
+                    driver = None
+                    if attempt < max_retries:
+                        tasks.put((category, attempt + 1))
+                        continue
+                    status = 'failed'
+                else:
+                    # A live driver can still have stopped early, e.g. on a page error
+                    checkpoint = load_checkpoint(get_output_csv(category, output_csv_prefix))
+                    if checkpoint and checkpoint.get('completed'):
+                        status = 'ok'
+                    elif attempt < max_retries:
+                        print(f"    ⚠️  [driver {worker_id}] {category} did not complete, retrying...")
+                        tasks.put((category, attempt + 1))
+                        continue
+                    else:
+                        status = 'failed'
+
+                with summary_lock:
+                    summary[category] = {
+                        'category': category,
+                        'apis': len(data),
+                        'output_csv': get_output_csv(category, output_csv_prefix),
+                        'attempts': attempt + 1,
+                        'seconds': round(elapsed, 1),
+                        'status': status
+                    }
+                print(f"✅ [driver {worker_id}] Finished scraping for category: {category} ({len(data)} APIs)")
+        finally:
+            if driver:
+                driver.quit()
+
+    threads = [threading.Thread(target=worker, args=(i + 1,), daemon=True) for i in range(num_drivers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Categories left on the queue could not get a working driver at all
+    while not tasks.empty():
+        category, attempt = tasks.get_nowait()
+        summary[category] = {
+            'category': category,
+            'apis': 0,
+            'output_csv': get_output_csv(category, output_csv_prefix),
+            'attempts': attempt,
+            'seconds': 0.0,
+            'status': 'failed'
+        }
+
+    summary_df = pd.DataFrame(
+        [summary[c] for c in categories_to_scrape if c in summary],
+        columns=['category', 'apis', 'output_csv', 'attempts', 'seconds', 'status']
+    )
+
+    print("\n📊 Scraping summary:")
+    print(f"   Categories scraped: {(summary_df['status'] == 'ok').sum()} / {len(categories_to_scrape)}")
+    print(f"   Total APIs extracted: {summary_df['apis'].sum()}")
+    failed = summary_df[summary_df['status'] != 'ok']['category'].tolist()
+    if failed:
+        print(f"   ⚠️  Failed categories: {', '.join(failed)}")
+
+    if summary_csv:
+        summary_df.to_csv(summary_csv, index=False)
+        print(f"   💾 Summary saved to: {summary_csv}")
+
+    return summary_df
 
 if __name__ == "__main__":
     
@@ -310,7 +1000,7 @@ if __name__ == "__main__":
     ]
 
     # Run the scraper for all specified categories
-    scrape_categories(categories_to_scrape, scroll_delay=1)
+    scrape_categories(categories_to_scrape, scroll_delay=1, num_drivers=4, profile="lean")
     
     print("\n" + "=" * 60)
     print("\n✅ All tests completed!")